@@ -4,11 +4,21 @@ This module wraps all ADB commands with subprocess.
 Contains only pure Python logic and never imports PyQt6.
 """
 
+import logging
+import re
+import shlex
 import subprocess
 import sys
-from dataclasses import dataclass
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Windows subprocess optimization for PyInstaller
 if sys.platform == 'win32':
     # Create startup info to hide console window and optimize process creation
@@ -22,6 +32,15 @@ else:
     _STARTUPINFO = None
     _CREATION_FLAGS = 0
 
+# Seconds between on_tick calls while a push/pull is running
+_TRANSFER_TICK = 0.5
+
+# Most paths per stat call in stat_sizes (keeps the command line short on Windows)
+_STAT_BATCH_SIZE = 100
+
+# First platform-tools release whose push/pull accept -z lz4/zstd
+_MIN_COMPRESSION_VERSION = 33
+
 
 @dataclass
 class AdbDevice:
@@ -37,6 +56,69 @@ class AdbDevice:
     model: str | None = None
 
 
+@dataclass
+class _ShellSession:
+    """Long-lived `adb shell` process that runs commands written to its stdin.
+    
+    Attributes:
+        process: adb shell process (binary pipes, stderr merged into stdout)
+        lock: Held while a command runs (one command at a time)
+    """
+    process: subprocess.Popen
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class DeviceTracker:
+    """Long-lived `adb track-devices` process (see AdbManager.track_devices).
+    
+    Iterating blocks until the adb server reports a device list and yields
+    it; iteration ends when the process exits or stop() is called.
+    """
+    
+    def __init__(self, process: subprocess.Popen) -> None:
+        """Initialize DeviceTracker instance.
+        
+        Args:
+            process: adb track-devices process (binary stdout)
+        """
+        self.process = process
+    
+    def __iter__(self) -> Iterator[frozenset[tuple[str, str]]]:
+        """Read device list updates.
+        
+        Yields:
+            (serial, state) pairs of the connected devices. The state is its
+            first word, as get_devices() reports it (e.g. "no" for
+            "no permissions (...)")
+        """
+        stdout = self.process.stdout
+        try:
+            while True:
+                # Each update: 4 hex digit length, then "serial\tstate" lines
+                header = stdout.read(4)
+                if len(header) < 4:
+                    return
+                length = int(header, 16)
+                payload = stdout.read(length).decode("utf-8", errors="replace")
+                devices = set()
+                for line in payload.splitlines():
+                    serial, _, state = line.partition("\t")
+                    words = state.split()
+                    if words:
+                        devices.add((serial, words[0]))
+                yield frozenset(devices)
+        except (OSError, ValueError):
+            return  # Stopped, or not a track-devices frame
+        finally:
+            self.stop()
+    
+    def stop(self) -> None:
+        """End the tracking process (may be called from any thread)."""
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+
+
 class AdbManager:
     """Class that manages ADB commands.
     
@@ -44,6 +126,35 @@ class AdbManager:
     Uses subprocess and provides timeout and error handling.
     """
     
+    # Persistent shell sessions by device serial. Shared by all instances,
+    # since workers create their own AdbManager
+    _shell_sessions: dict[str, _ShellSession] = {}
+    _shell_sessions_lock = threading.Lock()
+    
+    # Shared instances by adb path (see get_default)
+    _defaults: dict[str, "AdbManager"] = {}
+    _defaults_lock = threading.Lock()
+    
+    @classmethod
+    def get_default(cls, adb_path: str = "adb") -> "AdbManager":
+        """Get the shared AdbManager for an adb executable.
+        
+        Workers and widgets use this instead of creating their own, so
+        per-client state (e.g. the supports_compression() lookup) is
+        resolved once for the whole application. Methods are thread-safe.
+        
+        Args:
+            adb_path: Path to adb executable. Default is "adb" (searches in PATH)
+        
+        Returns:
+            AdbManager: Instance shared by all callers with the same adb_path
+        """
+        with cls._defaults_lock:
+            manager = cls._defaults.get(adb_path)
+            if manager is None:
+                manager = cls._defaults[adb_path] = cls(adb_path)
+            return manager
+    
     def __init__(self, adb_path: str = "adb") -> None:
         """Initialize AdbManager instance.
         
@@ -51,6 +162,8 @@ class AdbManager:
             adb_path: Path to adb executable. Default is "adb" (searches in PATH)
         """
         self.adb_path = adb_path
+        # Result of supports_compression(), looked up on first use
+        self._supports_compression: bool | None = None
     
     def get_devices(self) -> list[AdbDevice]:
         """Get list of connected ADB devices.
@@ -107,6 +220,33 @@ class AdbManager:
                 f"ADB executable not found: {self.adb_path}"
             )
     
+    def track_devices(self) -> DeviceTracker:
+        """Start following the adb server's device list.
+        
+        The adb server reports the list once and then whenever it changes,
+        so callers need not poll get_devices(). Also starts the adb server
+        if it is not running yet.
+        
+        Returns:
+            DeviceTracker: Iterate it for updates, stop() it when done
+        
+        Raises:
+            subprocess.SubprocessError: When adb cannot be started
+        """
+        try:
+            process = subprocess.Popen(
+                [self.adb_path, "track-devices"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                startupinfo=_STARTUPINFO,
+                creationflags=_CREATION_FLAGS,
+            )
+        except FileNotFoundError:
+            raise subprocess.SubprocessError(
+                f"ADB executable not found: {self.adb_path}"
+            )
+        return DeviceTracker(process)
+    
     def check_adb_available(self) -> bool:
         """Check if ADB is available.
         
@@ -128,6 +268,36 @@ class AdbManager:
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
     
+    def supports_compression(self) -> bool:
+        """Check if this adb client accepts -z ALGORITHM for push/pull.
+        
+        The platform-tools version is read from `adb version` once and cached.
+        Devices without compression support are handled by adb itself.
+        
+        Returns:
+            bool: Whether push_file/pull_file can be given a compression
+        """
+        if self._supports_compression is None:
+            try:
+                result = subprocess.run(
+                    [self.adb_path, "version"],
+                    capture_output=True,
+                    encoding='utf-8',
+                    errors='replace',
+                    timeout=3,
+                    check=True,
+                    startupinfo=_STARTUPINFO,
+                    creationflags=_CREATION_FLAGS,
+                )
+                # "Version 34.0.5-10900879" (platform-tools version)
+                match = re.search(r"^Version (\d+)\.", result.stdout, re.MULTILINE)
+                self._supports_compression = bool(
+                    match and int(match.group(1)) >= _MIN_COMPRESSION_VERSION
+                )
+            except (subprocess.SubprocessError, FileNotFoundError):
+                self._supports_compression = False
+        return self._supports_compression
+    
     def shell_command(
         self,
         device_serial: str,
@@ -168,6 +338,207 @@ class AdbManager:
                 f"Shell command execution failed: {e.stderr}"
             )
     
+    def shell_command_lines(
+        self,
+        device_serial: str,
+        command: str,
+        timeout: int = 30,
+    ) -> Iterator[str]:
+        """Execute shell command and yield its stdout lines as they arrive.
+        
+        Lets callers process long outputs before the command finishes.
+        
+        Args:
+            device_serial: Target device serial number
+            command: Shell command to execute
+            timeout: Timeout for the whole command (seconds). Default 30 seconds
+        
+        Yields:
+            str: Output line (without line ending)
+        
+        Raises:
+            subprocess.SubprocessError: When command execution fails
+        """
+        process = subprocess.Popen(
+            [self.adb_path, "-s", device_serial, "shell", command],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',  # Replace with ? on decode failure
+            startupinfo=_STARTUPINFO,
+            creationflags=_CREATION_FLAGS,
+        )
+        # Reading stdout blocks, so the timeout is enforced by killing the process
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+        try:
+            for line in process.stdout:
+                yield line.rstrip("\r\n")
+            stderr = process.stderr.read()
+            returncode = process.wait()
+        finally:
+            timed_out = not timer.is_alive()
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()  # Consumer stopped early
+            process.stdout.close()
+            process.stderr.close()
+            process.wait()
+        
+        if timed_out:
+            raise subprocess.SubprocessError(f"Shell command timeout: {command}")
+        if returncode != 0:
+            raise subprocess.SubprocessError(
+                f"Shell command execution failed: {stderr}"
+            )
+    
+    def session_command_lines(
+        self,
+        device_serial: str,
+        command: str,
+        timeout: int = 30,
+    ) -> Iterator[str]:
+        """Run shell command in the device's persistent shell and yield its output lines.
+        
+        Like shell_command_lines(), but one `adb shell` process per device
+        serves all commands, so they skip the adb process start and the
+        adbd connection handshake. While the session runs another command,
+        this falls back to shell_command_lines().
+        
+        Args:
+            device_serial: Target device serial number
+            command: Shell command to execute (one line)
+            timeout: Timeout for the whole command (seconds). Default 30 seconds
+        
+        Yields:
+            str: Output line (without line ending); stderr is interleaved
+        
+        Raises:
+            subprocess.SubprocessError: When command execution fails
+        """
+        session = self._acquire_shell_session(device_serial)
+        if session is None:
+            yield from self.shell_command_lines(device_serial, command, timeout)
+            return
+        
+        # The shell prints the end marker and exit status after the command.
+        # The marker is quoted apart in the input, so an echoed command line
+        # (legacy adbd runs the shell on a pty) never matches it
+        token = uuid.uuid4().hex
+        end_marker = f"__ADBCOPY_END_{token}__"
+        process = session.process
+        finished = False
+        returncode = 0
+        recent_lines: deque[str] = deque(maxlen=5)  # For the error message
+        # Reading stdout blocks, so the timeout is enforced by killing the session
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+        try:
+            process.stdin.write(
+                f'{command}\necho "__ADBCOPY_END_""{token}__ $?"\n'.encode("utf-8")
+            )
+            process.stdin.flush()
+            for raw_line in process.stdout:
+                line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+                marker_at = line.find(end_marker)
+                if marker_at >= 0:
+                    # Output without a final newline shares the marker's line
+                    if marker_at > 0:
+                        yield line[:marker_at]
+                    returncode = int(line[marker_at + len(end_marker):])
+                    finished = True
+                    break
+                recent_lines.append(line)
+                yield line
+        except (OSError, ValueError):
+            pass  # Session ended (broken pipe or malformed marker line)
+        finally:
+            timed_out = not timer.is_alive()
+            timer.cancel()
+            if not finished:
+                # Ended, timed out or consumer stopped early: the rest of
+                # the output would be read as the next command's
+                self._close_shell_session(device_serial, session)
+            session.lock.release()
+        
+        if timed_out:
+            raise subprocess.SubprocessError(f"Shell command timeout: {command}")
+        if not finished or returncode != 0:
+            output = "\n".join(recent_lines)
+            raise subprocess.SubprocessError(f"Shell command execution failed: {output}")
+    
+    def close_shell_sessions(self, keep_serials: set[str]) -> None:
+        """Close the persistent shell sessions of devices not in keep_serials.
+        
+        Args:
+            keep_serials: Serial numbers of devices that are still connected
+        """
+        with AdbManager._shell_sessions_lock:
+            stale = [
+                (serial, session)
+                for serial, session in AdbManager._shell_sessions.items()
+                if serial not in keep_serials
+            ]
+        for serial, session in stale:
+            self._close_shell_session(serial, session)
+    
+    def _acquire_shell_session(self, device_serial: str) -> _ShellSession | None:
+        """Get the device's shell session with its lock held, starting it if needed.
+        
+        Args:
+            device_serial: Target device serial number
+        
+        Returns:
+            Locked session, or None while another command is using it
+        
+        Raises:
+            subprocess.SubprocessError: When adb cannot be started
+        """
+        with AdbManager._shell_sessions_lock:
+            session = AdbManager._shell_sessions.get(device_serial)
+            if session is None or session.process.poll() is not None:
+                try:
+                    process = subprocess.Popen(
+                        [self.adb_path, "-s", device_serial, "shell"],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        startupinfo=_STARTUPINFO,
+                        creationflags=_CREATION_FLAGS,
+                    )
+                except FileNotFoundError:
+                    raise subprocess.SubprocessError(
+                        f"ADB executable not found: {self.adb_path}"
+                    )
+                # Keep error messages in order with the output they belong to
+                process.stdin.write(b"exec 2>&1\n")
+                session = _ShellSession(process)
+                AdbManager._shell_sessions[device_serial] = session
+            
+            if not session.lock.acquire(blocking=False):
+                return None
+            return session
+    
+    def _close_shell_session(self, device_serial: str, session: _ShellSession) -> None:
+        """End a shell session and forget it.
+        
+        Args:
+            device_serial: Serial number the session belongs to
+            session: Session to close
+        """
+        with AdbManager._shell_sessions_lock:
+            if AdbManager._shell_sessions.get(device_serial) is session:
+                del AdbManager._shell_sessions[device_serial]
+        
+        session.process.kill()
+        session.process.wait()
+        for pipe in (session.process.stdin, session.process.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass  # Unflushed input to the killed process
+    
     def pull_file(
         self,
         device_serial: str,
@@ -175,6 +546,8 @@ class AdbManager:
         local_path: str,
         is_dir: bool = False,
         timeout: int = 300,
+        on_tick: Callable[[], None] | None = None,
+        compression: str | None = None,
     ) -> None:
         """Pull file or folder from device to local.
         
@@ -184,6 +557,10 @@ class AdbManager:
             local_path: Local save path
             is_dir: Whether it's a directory (will use -a option)
             timeout: Timeout (seconds). Default 300 seconds (5 minutes)
+            on_tick: Called every _TRANSFER_TICK seconds while the transfer
+                runs (e.g. to report progress)
+            compression: adb -z algorithm (e.g. "lz4"), None for adb's
+                default. Only pass one if supports_compression() is True
             
         Raises:
             subprocess.SubprocessError: When file transfer fails
@@ -192,19 +569,11 @@ class AdbManager:
             cmd = [self.adb_path, "-s", device_serial, "pull"]
             if is_dir:
                 cmd.append("-a")  # Preserve file timestamp and mode for folders
+            if compression is not None:
+                cmd.extend(["-z", compression])
             cmd.extend([remote_path, local_path])
             
-            subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=timeout,
-                check=True,
-                startupinfo=_STARTUPINFO,
-                creationflags=_CREATION_FLAGS,
-            )
+            self._run_transfer(cmd, timeout, on_tick)
         except subprocess.TimeoutExpired:
             raise subprocess.SubprocessError(f"Pull timeout: {remote_path}")
         except subprocess.CalledProcessError as e:
@@ -217,6 +586,8 @@ class AdbManager:
         remote_path: str,
         is_dir: bool = False,
         timeout: int = 300,
+        on_tick: Callable[[], None] | None = None,
+        compression: str | None = None,
     ) -> None:
         """Push file or folder from local to device.
         
@@ -226,6 +597,10 @@ class AdbManager:
             remote_path: Save path on device
             is_dir: Whether it's a directory (will use -r option)
             timeout: Timeout (seconds). Default 300 seconds (5 minutes)
+            on_tick: Called every _TRANSFER_TICK seconds while the transfer
+                runs (e.g. to report progress)
+            compression: adb -z algorithm (e.g. "lz4"), None for adb's
+                default. Only pass one if supports_compression() is True
             
         Raises:
             subprocess.SubprocessError: When file transfer fails
@@ -234,8 +609,37 @@ class AdbManager:
             cmd = [self.adb_path, "-s", device_serial, "push"]
             if is_dir:
                 cmd.append("-r")  # Recursive for folders
+            if compression is not None:
+                cmd.extend(["-z", compression])
             cmd.extend([local_path, remote_path])
             
+            self._run_transfer(cmd, timeout, on_tick)
+        except subprocess.TimeoutExpired:
+            raise subprocess.SubprocessError(f"Push timeout: {local_path}")
+        except subprocess.CalledProcessError as e:
+            raise subprocess.SubprocessError(f"Push failed: {e.stderr}")
+    
+    def _run_transfer(
+        self,
+        cmd: list[str],
+        timeout: int,
+        on_tick: Callable[[], None] | None,
+    ) -> None:
+        """Run a push/pull command, calling on_tick while it runs.
+        
+        adb only prints transfer progress to a terminal, so callers track
+        progress themselves (e.g. from the destination file size).
+        
+        Args:
+            cmd: adb command line
+            timeout: Timeout (seconds)
+            on_tick: Called every _TRANSFER_TICK seconds until the command ends
+        
+        Raises:
+            subprocess.TimeoutExpired: When the command does not finish in time
+            subprocess.CalledProcessError: When the command fails
+        """
+        if on_tick is None:
             subprocess.run(
                 cmd,
                 capture_output=True,
@@ -247,8 +651,101 @@ class AdbManager:
                 startupinfo=_STARTUPINFO,
                 creationflags=_CREATION_FLAGS,
             )
+            return
+        
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            startupinfo=_STARTUPINFO,
+            creationflags=_CREATION_FLAGS,
+        )
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                # Retrying communicate() after a timeout loses no output
+                stdout, stderr = process.communicate(timeout=_TRANSFER_TICK)
+                break
+            except subprocess.TimeoutExpired:
+                if time.monotonic() >= deadline:
+                    process.kill()
+                    process.communicate()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                on_tick()
+        
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+    
+    def pull_files(
+        self,
+        device_serial: str,
+        remote_paths: list[str],
+        local_dir: str,
+        timeout: int = 300,
+    ) -> None:
+        """Pull several files from device into one local folder with a single adb call.
+        
+        Args:
+            device_serial: Target device serial number
+            remote_paths: File paths on device
+            local_dir: Existing local folder to save the files in
+            timeout: Timeout (seconds). Default 300 seconds (5 minutes)
+            
+        Raises:
+            subprocess.SubprocessError: When file transfer fails
+        """
+        try:
+            subprocess.run(
+                [self.adb_path, "-s", device_serial, "pull", *remote_paths, local_dir],
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                timeout=timeout,
+                check=True,
+                startupinfo=_STARTUPINFO,
+                creationflags=_CREATION_FLAGS,
+            )
         except subprocess.TimeoutExpired:
-            raise subprocess.SubprocessError(f"Push timeout: {local_path}")
+            raise subprocess.SubprocessError(f"Pull timeout: {len(remote_paths)} files")
+        except subprocess.CalledProcessError as e:
+            raise subprocess.SubprocessError(f"Pull failed: {e.stderr}")
+    
+    def push_files(
+        self,
+        device_serial: str,
+        local_paths: list[str],
+        remote_dir: str,
+        timeout: int = 300,
+    ) -> None:
+        """Push several files into one folder on device with a single adb call.
+        
+        Args:
+            device_serial: Target device serial number
+            local_paths: Local file paths
+            remote_dir: Existing folder on device to save the files in
+            timeout: Timeout (seconds). Default 300 seconds (5 minutes)
+            
+        Raises:
+            subprocess.SubprocessError: When file transfer fails
+        """
+        try:
+            subprocess.run(
+                [self.adb_path, "-s", device_serial, "push", *local_paths, remote_dir],
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                timeout=timeout,
+                check=True,
+                startupinfo=_STARTUPINFO,
+                creationflags=_CREATION_FLAGS,
+            )
+        except subprocess.TimeoutExpired:
+            raise subprocess.SubprocessError(f"Push timeout: {len(local_paths)} files")
         except subprocess.CalledProcessError as e:
             raise subprocess.SubprocessError(f"Push failed: {e.stderr}")
     
@@ -269,7 +766,8 @@ class AdbManager:
             subprocess.SubprocessError: When deletion fails
         """
         try:
-            command = f"rm -rf '{remote_path}'" if is_dir else f"rm '{remote_path}'"
+            quoted = shlex.quote(remote_path)
+            command = f"rm -rf {quoted}" if is_dir else f"rm {quoted}"
             self.shell_command(device_serial, command, timeout=10)
         except subprocess.SubprocessError as e:
             raise subprocess.SubprocessError(f"Deletion failed: {str(e)}")
@@ -289,7 +787,7 @@ class AdbManager:
             subprocess.SubprocessError: When creation fails
         """
         try:
-            command = f"mkdir -p '{remote_path}'"
+            command = f"mkdir -p {shlex.quote(remote_path)}"
             self.shell_command(device_serial, command, timeout=10)
         except subprocess.SubprocessError as e:
             raise subprocess.SubprocessError(f"Directory creation failed: {str(e)}")
@@ -311,7 +809,7 @@ class AdbManager:
             subprocess.SubprocessError: When renaming fails
         """
         try:
-            command = f"mv '{old_path}' '{new_path}'"
+            command = f"mv {shlex.quote(old_path)} {shlex.quote(new_path)}"
             self.shell_command(device_serial, command, timeout=10)
         except subprocess.SubprocessError as e:
             raise subprocess.SubprocessError(f"Rename failed: {str(e)}")
@@ -332,14 +830,53 @@ class AdbManager:
         """
         try:
             # Check existence with test command (most accurate)
-            command = f"test -e '{remote_path}' && echo 'YES' || echo 'NO'"
+            command = f"test -e {shlex.quote(remote_path)} && echo 'YES' || echo 'NO'"
             result = self.shell_command(device_serial, command, timeout=5)
             result_clean = result.strip()
-            print(f"[DEBUG] file_exists({remote_path}): result='{result_clean}'")
+            logger.debug("file_exists(%s): result='%s'", remote_path, result_clean)
             exists = result_clean == "YES"
-            print(f"[DEBUG] file_exists return value: {exists}")
+            logger.debug("file_exists return value: %s", exists)
             return exists
         except subprocess.SubprocessError as e:
-            print(f"[DEBUG] file_exists error: {str(e)}")
+            logger.debug("file_exists error: %s", e)
             return False
-
+    
+    def stat_sizes(
+        self,
+        device_serial: str,
+        remote_paths: list[str],
+        timeout: int = 10,
+    ) -> dict[str, int | None]:
+        """Get the sizes of several remote files with one stat call per batch.
+        
+        Args:
+            device_serial: Target device serial number
+            remote_paths: Paths to query
+            timeout: Timeout per stat call (seconds). Default 10 seconds
+        
+        Returns:
+            Path -> size (bytes), None for directories and other non-regular
+            files. Paths that cannot be stat'ed are left out
+        
+        Raises:
+            subprocess.SubprocessError: When command execution fails
+        """
+        sizes = {}
+        for i in range(0, len(remote_paths), _STAT_BATCH_SIZE):
+            quoted = " ".join(
+                shlex.quote(path) for path in remote_paths[i:i + _STAT_BATCH_SIZE]
+            )
+            # Missing files only go to stderr; keep the rest
+            output = self.shell_command(
+                device_serial,
+                f"stat -c '%F|%s|%n' -- {quoted} 2>/dev/null; true",
+                timeout=timeout,
+            )
+            for line in output.splitlines():
+                parts = line.split("|", 2)
+                if len(parts) != 3 or not parts[1].isdigit():
+                    continue
+                file_type, size, path = parts
+                # "regular file" or "regular empty file"
+                sizes[path] = int(size) if file_type.startswith("regular") else None
+        return sizes
@@ -19,6 +19,8 @@ class Translation:
             "en": {},  # English (default, no translation needed)
             "ko": self._load_korean()
         }
+        # Table of the current language, looked up once per language change
+        self._current_table: Dict[str, str] = self._translations["en"]
     
     def _load_korean(self) -> Dict[str, str]:
         """Load Korean translations.
@@ -75,6 +77,7 @@ class Translation:
             "Resume": "재개",
             "Retry Failed": "실패건 재시도",
             "Clear Completed": "완료건 지우기",
+            "Fit Columns": "열 너비 맞추기",
             
             # Status
             "⏳ Waiting": "⏳ 대기",
@@ -209,6 +212,7 @@ class Translation:
         """
         if language in self._translations:
             self._current_language = language
+            self._current_table = self._translations[language]
     
     def get_language(self) -> str:
         """Get the current language code.
@@ -227,11 +231,7 @@ class Translation:
         Returns:
             Translated text or original if translation not found
         """
-        if self._current_language == "en":
-            return text
-        
-        translations = self._translations.get(self._current_language, {})
-        return translations.get(text, text)
+        return self._current_table.get(text, text)
     
     def __call__(self, text: str) -> str:
         """Shorthand for translate().
@@ -258,7 +258,7 @@ def tr(text: str) -> str:
     Returns:
         Translated text
     """
-    return _translator(text)
+    return _translator.translate(text)
 
 
 def set_language(language: str) -> None:
@@ -4,6 +4,7 @@ Implements FileZilla-style vertical layout.
 Top: Console, Middle: Dual panels, Bottom: Transfer queue
 """
 
+import logging
 from pathlib import Path
 from PyQt6.QtCore import Qt, QThread
 from PyQt6.QtWidgets import (
@@ -28,6 +29,8 @@ from adb_copy.ui.overwrite_dialog import OverwriteDialog
 from adb_copy.i18n import tr, set_language, get_language
 from adb_copy.config import get_config, set_config
 
+logger = logging.getLogger(__name__)
+
 
 class MainWindow(QMainWindow):
     """ADBCopy main window class.
@@ -55,7 +58,7 @@ class MainWindow(QMainWindow):
         self._drag_source_files: list[dict] = []
         self._next_task_id = 1
         self._overwrite_all_action: int | None = None  # Store "apply to all" action
-        self.adb_manager = AdbManager()
+        self.adb_manager = AdbManager.get_default()
         
         self._init_ui()
         self._init_menubar()
@@ -244,6 +247,8 @@ class MainWindow(QMainWindow):
         
         # Start worker when thread starts
         self.device_thread.started.connect(self.device_watcher.start_watching)
+        # Delete the worker (and its poll timer) on its own thread when it ends
+        self.device_thread.finished.connect(self.device_watcher.deleteLater)
         
         # Start thread
         self.device_thread.start()
@@ -336,7 +341,9 @@ class MainWindow(QMainWindow):
         else:
             msg.setWindowTitle("언어 변경됨")
             msg.setText(f"언어가 {lang_name}(으)로 변경되었습니다.")
-            msg.setInformativeText("변경사항을 적용하려면 애플리케이션을 재시작하세요.")
+            msg.setInformativeText(
+                "변경사항을 적용하려면 애플리케이션을 재시작하세요."
+            )
             msg.setStandardButtons(QMessageBox.StandardButton.Ok)
         
         msg.exec()
@@ -386,9 +393,11 @@ class MainWindow(QMainWindow):
         Args:
             file_infos: List of dragged file information
         """
-        print(f"[DEBUG] _on_files_drag_started: {len(file_infos)} files")
-        for f in file_infos:
-            print(f"[DEBUG]   - {f['name']} (is_dir: {f.get('is_dir', False)})")
+        logger.debug("_on_files_drag_started: %s files", len(file_infos))
+        # Skip the per-file loop entirely unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            for f in file_infos:
+                logger.debug("  - %s (is_dir: %s)", f['name'], f.get('is_dir', False))
         
         self._drag_source_files = file_infos
         self.console.log_debug(f"{len(file_infos)} files drag started")
@@ -399,15 +408,18 @@ class MainWindow(QMainWindow):
         Args:
             dropped_files: Dropped file info (unused, uses _drag_source_files instead)
         """
-        print(f"[DEBUG] _on_files_dropped_to_local called")
-        print(f"[DEBUG] _drag_source_files: {len(self._drag_source_files) if self._drag_source_files else 0} files")
+        logger.debug("_on_files_dropped_to_local called")
+        logger.debug(
+            "_drag_source_files: %s files",
+            len(self._drag_source_files) if self._drag_source_files else 0,
+        )
         
         if not self._drag_source_files:
             self.console.log_warning("No dragged file information")
             return
         
         source_panel_type = self._drag_source_files[0]["panel_type"]
-        print(f"[DEBUG] source_panel_type: {source_panel_type}")
+        logger.debug("source_panel_type: %s", source_panel_type)
         
         # Ignore if dropped to same panel
         if source_panel_type == "local":
@@ -420,10 +432,10 @@ class MainWindow(QMainWindow):
         if not dest_path:
             dest_path = str(Path.home())
         
-        print(f"[DEBUG] dest_path: {dest_path}")
+        logger.debug("dest_path: %s", dest_path)
         
         # All files and folders can be transferred
-        print(f"[DEBUG] Transfer items: {len(self._drag_source_files)} items")
+        logger.debug("Transfer items: %s items", len(self._drag_source_files))
         
         if not self._drag_source_files:
             self.console.log_warning(tr("No transferable files"))
@@ -431,7 +443,7 @@ class MainWindow(QMainWindow):
             return
         
         device_serial = self._drag_source_files[0]["device_serial"]
-        print(f"[DEBUG] _add_transfer_tasks call: pull, {len(self._drag_source_files)} items")
+        logger.debug("_add_transfer_tasks call: pull, %s items", len(self._drag_source_files))
         self._add_transfer_tasks("pull", self._drag_source_files, dest_path, device_serial)
         
         # Reset drag info
@@ -443,9 +455,12 @@ class MainWindow(QMainWindow):
         Args:
             dropped_files: Dropped file info (from Windows Explorer or internal drag)
         """
-        print(f"[DEBUG] _on_files_dropped_to_remote called")
-        print(f"[DEBUG] dropped_files: {len(dropped_files) if dropped_files else 0}")
-        print(f"[DEBUG] _drag_source_files: {len(self._drag_source_files) if self._drag_source_files else 0} files")
+        logger.debug("_on_files_dropped_to_remote called")
+        logger.debug("dropped_files: %s", len(dropped_files) if dropped_files else 0)
+        logger.debug(
+            "_drag_source_files: %s files",
+            len(self._drag_source_files) if self._drag_source_files else 0,
+        )
         
         # Use external files if provided (from Windows Explorer)
         if dropped_files:
@@ -457,7 +472,7 @@ class MainWindow(QMainWindow):
             return
         
         source_panel_type = source_files[0]["panel_type"]
-        print(f"[DEBUG] source_panel_type: {source_panel_type}")
+        logger.debug("source_panel_type: %s", source_panel_type)
         
         # Ignore if dropped to same panel
         if source_panel_type == "remote":
@@ -476,17 +491,17 @@ class MainWindow(QMainWindow):
         if not dest_path:
             dest_path = "/"
         
-        print(f"[DEBUG] dest_path: {dest_path}")
+        logger.debug("dest_path: %s", dest_path)
         
         # All files and folders can be transferred
-        print(f"[DEBUG] Transfer items: {len(source_files)} items")
+        logger.debug("Transfer items: %s items", len(source_files))
         
         if not source_files:
             self.console.log_warning(tr("No transferable files"))
             self._drag_source_files = []
             return
         
-        print(f"[DEBUG] _add_transfer_tasks call: push, {len(source_files)} items")
+        logger.debug("_add_transfer_tasks call: push, %s items", len(source_files))
         self._add_transfer_tasks("push", source_files, dest_path, dest_device.serial)
         
         # Reset drag info
@@ -495,13 +510,12 @@ class MainWindow(QMainWindow):
     def _on_push_clicked(self) -> None:
         """Push button click handler (Local → Remote)."""
         # Get selected files from local panel
-        selected_rows = set(
-            item.row() 
-            for item in self.local_panel.file_detail.table.selectedItems()
-        )
+        file_infos = self.local_panel.file_detail.get_selected_files()
         
-        if not selected_rows:
-            QMessageBox.information(self, "Info", "Please select files to transfer from local panel.")
+        if not file_infos:
+            QMessageBox.information(
+                self, "Info", "Please select files to transfer from local panel."
+            )
             return
         
         # Check remote panel
@@ -510,47 +524,18 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Transfer failed", tr("No device connected"))
             return
         
-        # 선택된 파일 정보 수집
-        file_infos = []
-        for row in selected_rows:
-            name_item = self.local_panel.file_detail.table.item(row, 0)
-            if not name_item:
-                continue
-            
-            path = name_item.data(Qt.ItemDataRole.UserRole)
-            is_dir = name_item.data(Qt.ItemDataRole.UserRole + 1)
-            
-            size_item = self.local_panel.file_detail.table.item(row, 1)
-            size_str = size_item.text() if size_item else "0 B"
-            size_bytes = self.local_panel.file_detail._parse_size(size_str)
-            
-            file_info = {
-                "path": path,
-                "name": Path(path).name,
-                "size": size_bytes,
-                "is_dir": is_dir,
-                "panel_type": "local",
-                "device_serial": None,
-            }
-            file_infos.append(file_info)
-        
-        if not file_infos:
-            QMessageBox.information(self, tr("Info"), tr("Please select files to transfer from local panel."))
-            return
-        
         dest_path = self.remote_panel.file_detail.current_path or "/"
         self._add_transfer_tasks("push", file_infos, dest_path, dest_device.serial)
     
     def _on_pull_clicked(self) -> None:
         """Pull button click handler (Remote → Local)."""
         # Get selected files from remote panel
-        selected_rows = set(
-            item.row() 
-            for item in self.remote_panel.file_detail.table.selectedItems()
-        )
+        file_infos = self.remote_panel.file_detail.get_selected_files()
         
-        if not selected_rows:
-            QMessageBox.information(self, "Info", "Please select files to transfer from remote panel.")
+        if not file_infos:
+            QMessageBox.information(
+                self, "Info", "Please select files to transfer from remote panel."
+            )
             return
         
         # Check remote panel
@@ -559,34 +544,6 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Transfer failed", tr("No device connected"))
             return
         
-        # Collect selected file information
-        file_infos = []
-        for row in selected_rows:
-            name_item = self.remote_panel.file_detail.table.item(row, 0)
-            if not name_item:
-                continue
-            
-            path = name_item.data(Qt.ItemDataRole.UserRole)
-            is_dir = name_item.data(Qt.ItemDataRole.UserRole + 1)
-            
-            size_item = self.remote_panel.file_detail.table.item(row, 1)
-            size_str = size_item.text() if size_item else "0 B"
-            size_bytes = self.remote_panel.file_detail._parse_size(size_str)
-            
-            file_info = {
-                "path": path,
-                "name": Path(path).name,
-                "size": size_bytes,
-                "is_dir": is_dir,
-                "panel_type": "remote",
-                "device_serial": dest_device.serial,
-            }
-            file_infos.append(file_info)
-        
-        if not file_infos:
-            QMessageBox.information(self, tr("Info"), tr("Please select files to transfer from remote panel."))
-            return
-        
         dest_path = self.local_panel.file_detail.current_path or str(Path.home())
         self._add_transfer_tasks("pull", file_infos, dest_path, dest_device.serial)
     
@@ -605,7 +562,9 @@ class MainWindow(QMainWindow):
             dest_path: Destination path
             device_serial: Device serial number
         """
-        print(f"[DEBUG] _add_transfer_tasks start: direction={direction}, files={len(file_infos)}")
+        logger.debug(
+            "_add_transfer_tasks start: direction=%s, files=%s", direction, len(file_infos)
+        )
         
         # Reset "apply to all" action
         self._overwrite_all_action = None
@@ -614,15 +573,16 @@ class MainWindow(QMainWindow):
         BATCH_SIZE = 50  # Process 50 files per batch
         total_files = len(file_infos)
         
-        # Disable sorting (performance improvement)
-        self.transfer_queue.table.setSortingEnabled(False)
+        # Suspend sorting, repaints and stats updates of the queue
+        self.transfer_queue.begin_batch()
         
         # Add files in batches
         for i in range(0, total_files, BATCH_SIZE):
             batch = file_infos[i:i+BATCH_SIZE]
             batch_end = min(i + BATCH_SIZE, total_files)
+            queue_rows = []
             
-            print(f"[DEBUG] Processing batch: {i+1}-{batch_end}/{total_files}")
+            logger.debug("Processing batch: %s-%s/%s", i+1, batch_end, total_files)
             
             for file_info in batch:
                 task_id = self._next_task_id
@@ -636,15 +596,14 @@ class MainWindow(QMainWindow):
                 else:
                     destination_path = str(Path(dest_path) / filename)
                 
-                # Add to transfer queue (UI) - skip stats update
-                self.transfer_queue.add_transfer(
+                # Transfer queue row (UI), added per batch below
+                queue_rows.append((
                     task_id,
                     filename,
                     source_path,
                     destination_path,
-                    skip_stats_update=True,  # Skip stats update during batch processing
-                    file_size=file_info.get("size", 0),
-                )
+                    file_info.get("size", 0),
+                ))
                 
                 # Add task to worker
                 task = TransferTask(
@@ -659,23 +618,22 @@ class MainWindow(QMainWindow):
                 )
                 self.transfer_worker.add_task(task)
             
+            self.transfer_queue.add_transfers(queue_rows)
+            
             # Refresh UI between batches (prevent blocking)
             QApplication.processEvents()
         
-        # Re-enable sorting
-        self.transfer_queue.table.setSortingEnabled(True)
-        
-        # Update stats only once
-        self.transfer_queue._update_status_stats()
+        # Sort and update stats only once
+        self.transfer_queue.end_batch()
         
         direction_text = "Upload" if direction == "push" else "Download"
         self.console.log_info(f"{total_files} files added for transfer ({direction_text})")
         
         # Start worker if not running
-        print(f"[DEBUG] Thread running status: {self.transfer_thread.isRunning()}")
+        logger.debug("Thread running status: %s", self.transfer_thread.isRunning())
         
         if not self.transfer_thread.isRunning():
-            print("[DEBUG] Starting transfer thread")
+            logger.debug("Starting transfer thread")
             
             # Disconnect existing connection and reconnect
             try:
@@ -688,7 +646,7 @@ class MainWindow(QMainWindow):
             self.transfer_queue.enable_pause_button(True)
             self.console.log_info(tr("Transfer started"))
         else:
-            print("[DEBUG] Transfer thread already running")
+            logger.debug("Transfer thread already running")
             self.console.log_info("Added to transfer queue (in progress)")
     
     def _on_transfer_started(self, task_id: int) -> None:
@@ -697,7 +655,7 @@ class MainWindow(QMainWindow):
         Args:
             task_id: Task ID
         """
-        print(f"[DEBUG] _on_transfer_started called: task_id={task_id}")
+        logger.debug("_on_transfer_started called: task_id=%s", task_id)
         self.console.log_debug(f"Transfer started: Task {task_id}")
     
     def _on_transfer_progress(self, task_id: int, progress: int, speed: str) -> None:
@@ -708,7 +666,10 @@ class MainWindow(QMainWindow):
             progress: Progress (0-100)
             speed: Speed string
         """
-        print(f"[DEBUG] _on_transfer_progress called: task_id={task_id}, progress={progress}, speed={speed}")
+        logger.debug(
+            "_on_transfer_progress called: task_id=%s, progress=%s, speed=%s",
+            task_id, progress, speed,
+        )
         self.transfer_queue.update_progress_by_task_id(task_id, progress, speed=speed)
     
     def _on_transfer_completed(self, task_id: int) -> None:
@@ -717,7 +678,7 @@ class MainWindow(QMainWindow):
         Args:
             task_id: Task ID
         """
-        print(f"[DEBUG] _on_transfer_completed called: task_id={task_id}")
+        logger.debug("_on_transfer_completed called: task_id=%s", task_id)
         self.console.log_debug(f"Transfer completed: Task {task_id}")
         self.transfer_queue.update_progress_by_task_id(task_id, 100)
         
@@ -730,7 +691,7 @@ class MainWindow(QMainWindow):
             task_id: Task ID
             error_message: Error message
         """
-        print(f"[DEBUG] _on_transfer_failed called: task_id={task_id}, error={error_message}")
+        logger.debug("_on_transfer_failed called: task_id=%s, error=%s", task_id, error_message)
         self.console.log_error(f"Transfer failed (Task {task_id}): {error_message}")
         self.transfer_queue.mark_failed_by_task_id(task_id, error_message)
     
@@ -765,27 +726,10 @@ class MainWindow(QMainWindow):
         device_serial = self.remote_panel.file_detail.current_device.serial
         retry_count = 0
         
-        # Collect failed tasks
+        # Collect failed tasks (removed from the queue, re-added below)
         failed_tasks = []
-        table = self.transfer_queue.table
         
-        for row in range(table.rowCount()):
-            status_item = table.item(row, 0)
-            if not status_item or status_item.text() != tr("✗ Failed"):
-                continue
-            
-            # Collect file information
-            name_item = table.item(row, 1)
-            source_item = table.item(row, 2)
-            dest_item = table.item(row, 3)
-            
-            if not (name_item and source_item and dest_item):
-                continue
-            
-            filename = name_item.text()
-            source_path = source_item.text()
-            dest_path = dest_item.text()
-            
+        for filename, source_path, dest_path in self.transfer_queue.take_failed_transfers():
             # Determine direction (Windows path vs Unix path)
             if source_path.startswith("/"):
                 # Unix path → Remote is source → pull
@@ -803,13 +747,12 @@ class MainWindow(QMainWindow):
                     if local_file.exists():
                         file_size = local_file.stat().st_size
                 else:
-                    # Remote file size (omitted, set to 0)
+                    # Remote file size (looked up by the transfer worker)
                     file_size = 0
             except Exception:
                 pass
             
             failed_tasks.append({
-                "row": row,
                 "filename": filename,
                 "source_path": source_path,
                 "dest_path": dest_path,
@@ -821,14 +764,8 @@ class MainWindow(QMainWindow):
             self.console.log_info("No failed tasks to retry")
             return
         
-        # Remove failed rows from table (reverse order)
-        for task in reversed(failed_tasks):
-            table.removeRow(task["row"])
-        
-        # Update stats
-        self.transfer_queue._update_status_stats()
-        
-        # Add retry tasks
+        # Add retry tasks (queue sorts and updates stats once at the end)
+        self.transfer_queue.begin_batch()
         for task in failed_tasks:
             task_id = self._next_task_id
             self._next_task_id += 1
@@ -854,6 +791,7 @@ class MainWindow(QMainWindow):
             )
             self.transfer_worker.add_task(transfer_task)
             retry_count += 1
+        self.transfer_queue.end_batch()
         
         self.console.log_info(f"Retrying {retry_count} failed tasks...")
         
@@ -933,14 +871,20 @@ class MainWindow(QMainWindow):
     
     def _refresh_panels_after_transfer(self) -> None:
         """Refresh panels after transfer completion."""
-        # Refresh local panel
+        # Refresh local panel (file list and its folder in the tree)
         if self.local_panel.file_detail.current_path:
+            self.local_panel.folder_tree.invalidate_path(
+                self.local_panel.file_detail.current_path
+            )
             self.local_panel.file_detail.load_path(
                 self.local_panel.file_detail.current_path
             )
         
-        # Refresh remote panel
+        # Refresh remote panel (file list and its folder in the tree)
         if self.remote_panel.file_detail.current_path:
+            self.remote_panel.folder_tree.invalidate_path(
+                self.remote_panel.file_detail.current_path
+            )
             self.remote_panel.file_detail.load_path(
                 self.remote_panel.file_detail.current_path
             )
@@ -3,9 +3,25 @@
 Displays file/folder list of selected folder in a table.
 """
 
+import logging
+import os
+import stat
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QMimeData, QUrl
+from itertools import islice
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+    QMimeData,
+    QUrl,
+)
 from PyQt6.QtGui import QDrag, QAction, QKeyEvent
 from PyQt6.QtWidgets import (
     QApplication,
@@ -14,59 +30,437 @@ from PyQt6.QtWidgets import (
     QLabel,
     QMenu,
     QMessageBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from adb_copy.core.adb_manager import AdbDevice, AdbManager
-from adb_copy.workers.file_list_worker import FileListWorker, RemoteFileInfo
+from adb_copy.workers.file_list_worker import FileListRunnable, RemoteFileInfo
 from adb_copy.i18n import tr
 
+logger = logging.getLogger(__name__)
+
+
+def _parent_posix(path: str) -> str:
+    """Get parent directory of a remote (POSIX) path.
+    
+    Args:
+        path: Remote path
+    
+    Returns:
+        Parent path ("/" for top-level entries)
+    """
+    head, _, _ = path.rstrip("/").rpartition("/")
+    return head or "/"
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def _format_size(size: int) -> str:
+    """Format file size.
+    
+    Args:
+        size: Size in bytes
+    
+    Returns:
+        Formatted size string
+    """
+    if size <= 0:
+        return ""
+    
+    # Unit index straight from the bit length (each unit is 2**10 larger)
+    unit_index = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
+
+
+def _accepts_mime(mime_data) -> bool:
+    """Check whether a drag carries something the file list accepts.
+    
+    Args:
+        mime_data: QMimeData of the drag
+    
+    Returns:
+        True for ADBCopy file lists, URLs (e.g. from Windows Explorer) and text
+    """
+    return (
+        mime_data.hasFormat("application/x-adbcopy-files")
+        or mime_data.hasUrls()
+        or mime_data.hasText()
+    )
+
+
+def _local_file_info(path: str) -> dict | None:
+    """Build transfer file info for a local path dropped/pasted from outside.
+    
+    Uses a single stat() call for existence, type and size.
+    
+    Args:
+        path: Local file path
+    
+    Returns:
+        File info dict, or None if the path cannot be accessed
+    """
+    file_path = Path(path)
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    
+    is_dir = stat.S_ISDIR(st.st_mode)
+    return {
+        "path": str(file_path),
+        "name": file_path.name,
+        "size": 0 if is_dir else st.st_size,
+        "is_dir": is_dir,
+        "panel_type": "local",
+        "device_serial": None,
+    }
+
+
+class _LocalFileInfoSignals(QObject):
+    """Signals of _LocalFileInfoRunnable.
+    
+    Signals:
+        finished: Emitted when all paths are processed (list[dict]: file info)
+    """
+    
+    finished = pyqtSignal(list)
+
+
+class _LocalFileInfoRunnable(QRunnable):
+    """Collects local file info on a thread pool thread.
+    
+    Keeps stat() calls for pasted files off the GUI thread.
+    """
+    
+    def __init__(self, paths: list[str], signals: _LocalFileInfoSignals) -> None:
+        """Initialize _LocalFileInfoRunnable instance.
+        
+        Args:
+            paths: Local file paths
+            signals: Signals object to report the result through
+        """
+        super().__init__()
+        self.paths = paths
+        self.signals = signals
+    
+    def run(self) -> None:
+        """Stat all paths and emit the collected file info."""
+        file_infos = []
+        for path in self.paths:
+            file_info = _local_file_info(path)
+            if file_info is not None:
+                file_infos.append(file_info)
+        self.signals.finished.emit(file_infos)
+
+
+@dataclass(slots=True)
+class FileRecord:
+    """Data class containing one row of the file list.
+    
+    Attributes:
+        name: File/directory name
+        path: Full path
+        is_dir: Whether it's a directory
+        size: File size (bytes). 0 for directories
+        mtime: Modification time (timestamp, 0 if unknown)
+        date: Modification date display string
+        permissions: Permissions column text
+        type: Type column text
+        is_parent: Whether it's the parent folder (..) entry
+        label: Name column text (folder icon prefix is rendering only;
+            logic checks is_dir/is_parent, never this text)
+    """
+    name: str
+    path: str
+    is_dir: bool
+    size: int = 0
+    mtime: float = 0.0
+    date: str = ""
+    permissions: str = ""
+    type: str = ""
+    is_parent: bool = False
+    label: str = ""
+    
+    def __post_init__(self) -> None:
+        """Build the Name column text once instead of on every repaint."""
+        if not self.label:
+            self.label = f"📁 {self.name}" if self.is_dir else self.name
+
+
+# Item data roles as plain ints (FileListModel.data() runs for every
+# visible cell on each repaint; PyQt6 enum attribute access is slow there)
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+_ALIGNMENT_ROLE = int(Qt.ItemDataRole.TextAlignmentRole)
+_PATH_ROLE = int(Qt.ItemDataRole.UserRole)
+_IS_DIR_ROLE = _PATH_ROLE + 1
+_SIZE_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_RECORD_FLAGS = (
+    Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+)
 
-class SortableTableWidgetItem(QTableWidgetItem):
-    """QTableWidgetItem that sorts by UserRole data instead of display text."""
+# Sort key per column, computed once per record by list.sort.
+# The leading "not is_dir" keeps folders and files grouped.
+_SORT_KEYS = (
+    lambda r: (not r.is_dir, r.name.casefold()),
+    lambda r: (not r.is_dir, r.size),
+    lambda r: (not r.is_dir, r.mtime, r.date),
+    lambda r: (not r.is_dir, r.permissions),
+    lambda r: (not r.is_dir, r.type.casefold()),
+)
+
+
+def _opposite_order(order: Qt.SortOrder) -> Qt.SortOrder:
+    """Get the opposite sort order.
+    
+    Args:
+        order: Sort order
+    
+    Returns:
+        Descending for ascending and vice versa
+    """
+    if order == Qt.SortOrder.AscendingOrder:
+        return Qt.SortOrder.DescendingOrder
+    return Qt.SortOrder.AscendingOrder
+
+
+class FileListModel(QAbstractTableModel):
+    """Table model holding the file records shown by FileDetailWidget.
+    
+    Rows are plain FileRecord objects, so sorting and statistics work on
+    raw values instead of formatted cell text.
+    """
+    
+    def __init__(self, parent=None) -> None:
+        """Initialize FileListModel instance.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._rows: list[FileRecord] = []
+        self._message: str | None = None  # Placeholder text (loading/error)
+        self._totals: tuple[int, int, int] | None = None  # (files, dirs, size) cache
+        self._sort_state: tuple[int, Qt.SortOrder] | None = None  # Current row order
+        self._headers = [tr("Name"), tr("Size"), tr("Date"), tr("Permissions"), tr("Type")]
+    
+    @property
+    def records(self) -> list[FileRecord]:
+        """File records in display order (including the .. entry)."""
+        return self._rows
+    
+    def record(self, row: int) -> FileRecord | None:
+        """Get record of a row.
+        
+        Args:
+            row: Row index
+        
+        Returns:
+            File record, or None if the row holds no record
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
     
-    def __init__(self, text: str = "", sort_value=None):
-        """Initialize sortable item.
+    def set_records(self, records: list[FileRecord]) -> None:
+        """Replace all rows.
         
         Args:
-            text: Display text
-            sort_value: Value to use for sorting (stored in UserRole)
+            records: New file records
         """
-        super().__init__(text)
-        if sort_value is not None:
-            self.setData(Qt.ItemDataRole.UserRole, sort_value)
+        self.beginResetModel()
+        self._rows = records
+        self._message = None
+        self._totals = None
+        self._sort_state = None
+        self.endResetModel()
     
-    def __lt__(self, other):
-        """Compare items for sorting.
+    def append_records(self, records: list[FileRecord]) -> None:
+        """Add rows after the existing ones (replacing a placeholder message).
         
         Args:
-            other: Other item to compare
+            records: File records to add
+        """
+        if not records:
+            return
+        
+        if not self._rows:
+            # The placeholder row goes away, so reset instead of inserting
+            self.set_records(list(records))
+            return
+        
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self._rows.extend(records)
+        self._totals = None
+        self._sort_state = None
+        self.endInsertRows()
+    
+    def set_message(self, message: str) -> None:
+        """Clear rows and show a single placeholder message row.
+        
+        Args:
+            message: Message text (e.g. loading or error)
+        """
+        self.beginResetModel()
+        self._rows = []
+        self._message = message
+        self._totals = None
+        self._sort_state = None
+        self.endResetModel()
+    
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.beginResetModel()
+        self._rows = []
+        self._message = None
+        self._totals = None
+        self._sort_state = None
+        self.endResetModel()
+    
+    def totals(self) -> tuple[int, int, int]:
+        """Get file count, folder count and total file size of all rows.
+        
+        Computed once per set of records (sorting does not change it).
+        
+        Returns:
+            (file count, folder count, total size in bytes), excluding the .. entry
+        """
+        if self._totals is None:
+            total_files = 0
+            total_dirs = 0
+            total_size = 0
             
+            # The .. item can only be the first row, so skip it by index
+            start = 1 if self._rows and self._rows[0].is_parent else 0
+            for record in islice(self._rows, start, None):
+                if record.is_dir:
+                    total_dirs += 1
+                else:
+                    total_files += 1
+                    total_size += record.size
+            self._totals = (total_files, total_dirs, total_size)
+        return self._totals
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get row count."""
+        if parent.isValid():
+            return 0
+        if not self._rows and self._message is not None:
+            return 1
+        return len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get column count."""
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Get data of a cell.
+        
+        Args:
+            index: Cell index
+            role: Data role
+        
         Returns:
-            True if this item is less than other
+            Display text, alignment, path (UserRole) or is_dir (UserRole + 1)
+        """
+        if not index.isValid():
+            return None
+        
+        column = index.column()
+        if not self._rows:
+            # Placeholder message row
+            if role == _DISPLAY_ROLE and column == 0:
+                return self._message
+            return None
+        
+        record = self._rows[index.row()]
+        if role == _DISPLAY_ROLE:
+            if column == 0:
+                return record.label
+            if column == 1:
+                return _format_size(record.size)
+            if column == 2:
+                return record.date
+            if column == 3:
+                return record.permissions
+            return record.type
+        if role == _ALIGNMENT_ROLE and column == 1:
+            return _SIZE_ALIGNMENT
+        if role == _PATH_ROLE:
+            return record.path
+        if role == _IS_DIR_ROLE:
+            return record.is_dir
+        return None
+    
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        """Get header text."""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Get item flags."""
+        if not index.isValid() or not self._rows:
+            return Qt.ItemFlag.NoItemFlags
+        return _RECORD_FLAGS
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sort rows keeping folders and files separated.
+        
+        Ascending puts folders first, descending puts files first.
+        The parent folder (..) entry always stays at the top.
+        
+        Args:
+            column: Column to sort by
+            order: Sort order (Ascending or Descending)
         """
-        # Try UserRole + 2 first (for Name column with special sort key)
-        my_data = self.data(Qt.ItemDataRole.UserRole + 2)
-        other_data = other.data(Qt.ItemDataRole.UserRole + 2)
-        
-        # If UserRole + 2 is empty, try UserRole
-        if my_data is None:
-            my_data = self.data(Qt.ItemDataRole.UserRole)
-            other_data = other.data(Qt.ItemDataRole.UserRole)
-        
-        # If both have sort data, use it
-        if my_data is not None and other_data is not None:
-            # Handle numeric comparison
-            if isinstance(my_data, (int, float)) and isinstance(other_data, (int, float)):
-                return my_data < other_data
-            # Handle string comparison
-            return str(my_data) < str(other_data)
-        
-        # Fallback to text comparison
-        return self.text() < other.text()
+        has_parent = bool(self._rows) and self._rows[0].is_parent
+        if len(self._rows) - has_parent < 2 or self._sort_state == (column, order):
+            return
+        
+        # Same column in the opposite order is just the current order reversed
+        # (both the folder/file grouping and the keys flip)
+        reverse_only = self._sort_state == (column, _opposite_order(order))
+        self._sort_state = (column, order)
+        
+        self.layoutAboutToBeChanged.emit()
+        
+        # Remember which record each persistent index (selection, current) points to
+        old_indexes = self.persistentIndexList()
+        old_records = [self._rows[index.row()] for index in old_indexes]
+        
+        # Sort the record list in place (.. is set aside so it stays on top)
+        parent = self._rows.pop(0) if has_parent else None
+        if reverse_only:
+            self._rows.reverse()
+        else:
+            self._rows.sort(
+                key=_SORT_KEYS[column],
+                reverse=order == Qt.SortOrder.DescendingOrder,
+            )
+        if parent is not None:
+            self._rows.insert(0, parent)
+        
+        # Move persistent indexes along with their records
+        if old_indexes:
+            new_rows = {id(record): row for row, record in enumerate(self._rows)}
+            self.changePersistentIndexList(
+                old_indexes,
+                [
+                    self.index(new_rows[id(record)], index.column())
+                    for record, index in zip(old_records, old_indexes)
+                ],
+            )
+        
+        self.layoutChanged.emit()
 
 
 class FileDetailWidget(QWidget):
@@ -95,7 +489,8 @@ class FileDetailWidget(QWidget):
         self.panel_type = panel_type
         self.current_path = ""
         self.current_device: AdbDevice | None = None
-        self.adb_manager = AdbManager() if panel_type == "remote" else None
+        self.adb_manager = AdbManager.get_default() if panel_type == "remote" else None
+        self._load_generation = 0  # Incremented per remote load request
         self._init_ui()
     
     def _init_ui(self) -> None:
@@ -103,25 +498,26 @@ class FileDetailWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(2, 2, 2, 2)
         
-        # Table widget
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([tr("Name"), tr("Size"), tr("Date"), tr("Permissions"), tr("Type")])
+        # Table view and model
+        self.model = FileListModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
         # Column size adjustment
+        # (fixed default widths: ResizeToContents re-measures every row's text
+        # on each insertion, which dominates load time for large folders)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        for column, width in ((1, 80), (2, 120), (3, 90), (4, 80)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(column, width)
         
         # Row selection mode
         self.table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QTableView.SelectionBehavior.SelectRows
         )
         self.table.setSelectionMode(
-            QTableWidget.SelectionMode.ExtendedSelection  # Allow multiple selection
+            QTableView.SelectionMode.ExtendedSelection  # Allow multiple selection
         )
         self.table.setAlternatingRowColors(True)
         
@@ -132,7 +528,7 @@ class FileDetailWidget(QWidget):
         self.table.setDefaultDropAction(Qt.DropAction.CopyAction)
         
         # Double-click event
-        self.table.cellDoubleClicked.connect(self._on_cell_double_clicked)
+        self.table.doubleClicked.connect(self._on_double_clicked)
         
         # Override drag/drop events
         self.table.startDrag = self._start_drag
@@ -144,14 +540,20 @@ class FileDetailWidget(QWidget):
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._show_context_menu)
         
-        # Selection change event
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        # Selection change event (coalesced: range selection and held arrow
+        # keys emit selectionChanged in bursts, so restart a 30ms single-shot
+        # timer and update the status bar once the burst settles)
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(30)
+        self._selection_timer.timeout.connect(self._on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self._selection_timer.start)
         
         # Keyboard events (for copy/paste)
         self.table.keyPressEvent = self._key_press_event
         
         # Custom sorting (to keep folders/files separated)
-        header = self.table.horizontalHeader()
+        header.setSectionsClickable(True)
         header.setSortIndicatorShown(True)
         header.sectionClicked.connect(self._on_header_clicked)
         
@@ -161,14 +563,14 @@ class FileDetailWidget(QWidget):
         
         # Improve hover/selection colors
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 selection-background-color: #A8D3FF;  /* Light blue */
                 selection-color: #000000;  /* Black text */
             }
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background-color: #E8E8E8;  /* Light gray */
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #A8D3FF;  /* Light blue */
                 color: #000000;  /* Black text */
             }
@@ -205,7 +607,7 @@ class FileDetailWidget(QWidget):
         Args:
             path: Path to load
         """
-        print(f"[DEBUG] load_path called: {path}, panel={self.panel_type}")
+        logger.debug("load_path called: %s, panel=%s", path, self.panel_type)
         self.current_path = path
         
         if self.panel_type == "local":
@@ -213,6 +615,39 @@ class FileDetailWidget(QWidget):
         else:
             self._load_remote_files(path)
     
+    def get_selected_files(self) -> list[dict]:
+        """Get file info of selected rows.
+        
+        Returns:
+            File info dicts (path, name, size, is_dir, panel_type, device_serial).
+            The parent folder (..) entry is excluded.
+        """
+        device_serial = self.current_device.serial if self.current_device else None
+        return [
+            {
+                "path": record.path,
+                "name": record.name,
+                "size": record.size,
+                "is_dir": record.is_dir,
+                "panel_type": self.panel_type,
+                "device_serial": device_serial,
+            }
+            for record in self._selected_records()
+        ]
+    
+    def _selected_records(self) -> list[FileRecord]:
+        """Get records of selected rows, excluding the parent folder (..) entry.
+        
+        Returns:
+            Selected file records
+        """
+        records = []
+        for index in self.table.selectionModel().selectedRows():
+            record = self.model.record(index.row())
+            if record is not None and not record.is_parent:
+                records.append(record)
+        return records
+    
     def _load_local_files(self, path: str) -> None:
         """Load file list of local path.
         
@@ -220,92 +655,53 @@ class FileDetailWidget(QWidget):
             path: Local path to load
         """
         try:
-            print(f"[DEBUG] _load_local_files called with path: '{path}'")
-            print(f"[DEBUG] path type: {type(path)}, repr: {repr(path)}")
+            logger.debug("_load_local_files called with path: '%s'", path)
+            logger.debug("path type: %s, repr: %r", type(path), path)
             path_obj = Path(path)
             
-            if not path_obj.exists() or not path_obj.is_dir():
+            # is_dir() is False for missing paths too (one stat, not two)
+            if not path_obj.is_dir():
                 self._show_error("Invalid path.")
                 return
             
-            # Temporarily disable sorting (performance improvement)
-            self.table.setSortingEnabled(False)
+            # Translated labels are constant for the whole load
+            folder_text = tr("Folder")
+            file_text = tr("File")
+            
+            # One scandir pass: DirEntry knows its type from the directory
+            # listing, so each entry costs a single stat() (size and date)
+            file_records = []
+            with os.scandir(path_obj) as entries:
+                for entry in entries:
+                    is_dir = entry.is_dir()
+                    stat_info = entry.stat()
+                    file_records.append(FileRecord(
+                        name=entry.name,
+                        path=entry.path,
+                        is_dir=is_dir,
+                        size=0 if is_dir else stat_info.st_size,
+                        mtime=stat_info.st_mtime,
+                        date=datetime.fromtimestamp(stat_info.st_mtime).strftime("%Y-%m-%d %H:%M"),
+                        permissions=folder_text if is_dir else file_text,
+                        type=folder_text if is_dir else os.path.splitext(entry.name)[1] or "-",
+                    ))
+            
+            # Folders first, then by name (the key is computed once per record)
+            file_records.sort(key=lambda r: (not r.is_dir, r.name.casefold()))
             
-            # Initialize table
-            self.table.setRowCount(0)
+            records = []
             
             # Add parent folder item (..)
             if path_obj.parent != path_obj:  # If not root
-                row = 0
-                self.table.insertRow(row)
-                
-                # Use special sort key to keep .. at top always
-                parent_item = SortableTableWidgetItem("📁 ..")
-                parent_item.setData(Qt.ItemDataRole.UserRole, str(path_obj.parent))
-                parent_item.setData(Qt.ItemDataRole.UserRole + 1, True)  # is_dir
-                parent_item.setData(Qt.ItemDataRole.UserRole + 2, "\x00")  # Always sort first
-                self.table.setItem(row, 0, parent_item)
-                
-                self.table.setItem(row, 1, SortableTableWidgetItem("", 0))
-                self.table.setItem(row, 2, SortableTableWidgetItem("", 0))
-                self.table.setItem(row, 3, SortableTableWidgetItem("", 0))
-                self.table.setItem(row, 4, SortableTableWidgetItem(tr("Parent"), "\x00"))
-            
-            # Get file list
-            items = sorted(
-                path_obj.iterdir(),
-                key=lambda p: (not p.is_dir(), p.name.lower()),
-            )
+                records.append(self._parent_record(str(path_obj.parent)))
             
-            for item in items:
-                is_dir = item.is_dir()
-                stat_info = item.stat()
-                size = 0 if is_dir else stat_info.st_size
-                mtime = datetime.fromtimestamp(stat_info.st_mtime).strftime("%Y-%m-%d %H:%M")
-                
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-                
-                # Name
-                sort_key = f"0_{item.name.lower()}" if is_dir else f"1_{item.name.lower()}"
-                name_item = SortableTableWidgetItem(
-                    f"📁 {item.name}" if is_dir else item.name
-                )
-                name_item.setData(Qt.ItemDataRole.UserRole, str(item))
-                name_item.setData(Qt.ItemDataRole.UserRole + 1, is_dir)
-                name_item.setData(Qt.ItemDataRole.UserRole + 2, sort_key)
-                self.table.setItem(row, 0, name_item)
-                
-                # Size
-                size_item = SortableTableWidgetItem(self._format_size(size), size)
-                size_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                self.table.setItem(row, 1, size_item)
-                
-                # Date
-                date_item = SortableTableWidgetItem(mtime, stat_info.st_mtime)
-                self.table.setItem(row, 2, date_item)
-                
-                # Permissions
-                perm_item = SortableTableWidgetItem(
-                    tr("Folder") if is_dir else tr("File"),
-                    0 if is_dir else 1
-                )
-                self.table.setItem(row, 3, perm_item)
-                
-                # Type
-                type_sort = f"0_{tr('Folder')}" if is_dir else f"1_{item.suffix or 'zzz'}"
-                type_item = SortableTableWidgetItem(
-                    tr("Folder") if is_dir else item.suffix or "-",
-                    type_sort
-                )
-                self.table.setItem(row, 4, type_item)
+            records.extend(file_records)
+            self.model.set_records(records)
+            self._apply_current_sort()
             
             # Update status bar
             self._update_status_bar()
-            
-            # Re-enable sorting
-            self.table.setSortingEnabled(True)
-                
+        
         except PermissionError:
             self._show_error("Permission denied.")
         except Exception as e:
@@ -319,161 +715,159 @@ class FileDetailWidget(QWidget):
         """
         if not self.current_device:
             # Don't show error, just keep empty table
-            self.table.setRowCount(0)
+            self.model.clear()
             return
         
-        # Clean up existing thread if any
-        if hasattr(self, '_file_list_thread') and self._file_list_thread is not None:
-            if self._file_list_thread.isRunning():
-                print("[DEBUG] Terminating existing thread...")
-                self._file_list_thread.quit()
-                self._file_list_thread.wait(1000)
+        # Invalidate any listing still in flight (its result will be ignored,
+        # so there is no need to block the UI waiting for it to finish)
+        self._load_generation += 1
+        generation = self._load_generation
         
         # Show loading indicator
-        self.table.setRowCount(1)
-        loading_item = QTableWidgetItem("Loading...")
-        self.table.setItem(0, 0, loading_item)
+        self.model.set_message("Loading...")
+        
+        # Asynchronous load on the shared thread pool (no thread per listing)
+        runnable = FileListRunnable(self.current_device.serial, path, self)
+        runnable.worker.files_batch.connect(
+            lambda files: self._on_remote_files_batch(files, generation)
+        )
+        runnable.worker.files_loaded.connect(
+            lambda files: self._on_remote_files_loaded(files, generation)
+        )
+        runnable.worker.error_occurred.connect(
+            lambda message: self._on_remote_files_error(message, generation)
+        )
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_remote_files_batch(self, files: list[RemoteFileInfo], generation: int) -> None:
+        """Show part of a remote listing that is still arriving.
         
-        # Asynchronous load with worker
-        self._file_list_thread = QThread()
-        worker = FileListWorker()
-        worker.moveToThread(self._file_list_thread)
+        Rows are appended unsorted; files_loaded replaces them with the
+        complete, sorted list.
         
-        worker.files_loaded.connect(self._on_remote_files_loaded)
-        worker.error_occurred.connect(self._show_error)
+        Args:
+            files: Next batch of the file list
+            generation: Load generation the listing was requested for
+        """
+        if generation != self._load_generation:
+            return
         
-        # Clean up thread after completion
-        def cleanup_thread():
-            if self._file_list_thread:
-                self._file_list_thread.quit()
-                self._file_list_thread.wait()
-                print("[DEBUG] File list thread cleaned up")
+        records = self._remote_records(files)
         
-        worker.files_loaded.connect(cleanup_thread)
-        worker.error_occurred.connect(cleanup_thread)
+        # The first batch replaces the loading message; start with ..
+        if not self.model.records and self.current_path and self.current_path != "/":
+            records.insert(0, self._parent_record(_parent_posix(self.current_path)))
         
-        device_serial = self.current_device.serial
-        self._file_list_thread.started.connect(lambda: worker.list_files(device_serial, path))
-        self._file_list_thread.start()
+        self.model.append_records(records)
     
-    def _on_remote_files_loaded(self, files: list[RemoteFileInfo]) -> None:
+    def _on_remote_files_loaded(self, files: list[RemoteFileInfo], generation: int) -> None:
         """Remote file list load completion handler.
         
         Args:
             files: File list
+            generation: Load generation the listing was requested for
         """
+        # Ignore results of a listing superseded by a newer navigation
+        if generation != self._load_generation:
+            return
+        
         # Update current_path (extract from first file's path)
         if files and not self.current_path:
             first_file_path = files[0].path
-            self.current_path = "/".join(first_file_path.rstrip("/").split("/")[:-1]) or "/"
+            self.current_path = _parent_posix(first_file_path)
         
-        # Temporarily disable sorting (performance improvement)
-        self.table.setSortingEnabled(False)
-        
-        self.table.setRowCount(0)
+        records = []
         
         # Add parent folder item (..)
         if self.current_path and self.current_path != "/":
-            row = 0
-            self.table.insertRow(row)
-            
-            # Use special sort key to keep .. at top always
-            parent_item = SortableTableWidgetItem("📁 ..")
-            parent_path = "/".join(self.current_path.rstrip("/").split("/")[:-1]) or "/"
-            parent_item.setData(Qt.ItemDataRole.UserRole, parent_path)
-            parent_item.setData(Qt.ItemDataRole.UserRole + 1, True)  # is_dir
-            parent_item.setData(Qt.ItemDataRole.UserRole + 2, "\x00")  # Always sort first
-            self.table.setItem(row, 0, parent_item)
-            
-            self.table.setItem(row, 1, SortableTableWidgetItem("", 0))
-            self.table.setItem(row, 2, SortableTableWidgetItem("", 0))
-            self.table.setItem(row, 3, SortableTableWidgetItem("", 0))
-            self.table.setItem(row, 4, SortableTableWidgetItem(tr("Parent"), "\x00"))
+            records.append(self._parent_record(_parent_posix(self.current_path)))
         
-        for file_info in files:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # Name
-            sort_key = f"0_{file_info.name.lower()}" if file_info.is_dir else f"1_{file_info.name.lower()}"
-            name_item = SortableTableWidgetItem(
-                f"📁 {file_info.name}" if file_info.is_dir else file_info.name
-            )
-            name_item.setData(Qt.ItemDataRole.UserRole, file_info.path)
-            name_item.setData(Qt.ItemDataRole.UserRole + 1, file_info.is_dir)
-            name_item.setData(Qt.ItemDataRole.UserRole + 2, sort_key)
-            self.table.setItem(row, 0, name_item)
-            
-            # Size
-            size_item = SortableTableWidgetItem(self._format_size(file_info.size), file_info.size)
-            size_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 1, size_item)
-            
-            # Date
-            date_item = SortableTableWidgetItem(file_info.date, file_info.date)
-            self.table.setItem(row, 2, date_item)
-            
-            # Permissions
-            perm_item = SortableTableWidgetItem(
-                file_info.permissions,
-                0 if file_info.is_dir else 1
-            )
-            self.table.setItem(row, 3, perm_item)
-            
-            # Type
-            ext = Path(file_info.name).suffix if not file_info.is_dir else ""
-            type_sort = f"0_{tr('Folder')}" if file_info.is_dir else f"1_{ext or 'zzz'}"
-            type_item = SortableTableWidgetItem(
-                tr("Folder") if file_info.is_dir else Path(file_info.name).suffix or "-",
-                type_sort
-            )
-            self.table.setItem(row, 4, type_item)
+        records.extend(self._remote_records(files))
+        
+        self.model.set_records(records)
+        self._apply_current_sort()
         
         # Update status bar
         self._update_status_bar()
-        
-        # Re-enable sorting
-        self.table.setSortingEnabled(True)
     
-    def _on_cell_double_clicked(self, row: int, column: int) -> None:
-        """Cell double-click handler.
+    def _remote_records(self, files: list[RemoteFileInfo]) -> list[FileRecord]:
+        """Convert remote file entries into table records.
         
         Args:
-            row: Row index
-            column: Column index
+            files: Remote file entries
+        
+        Returns:
+            One record per entry, in the same order
         """
-        name_item = self.table.item(row, 0)
-        if not name_item:
-            return
+        records = []
         
-        path = name_item.data(Qt.ItemDataRole.UserRole)
-        is_dir = name_item.data(Qt.ItemDataRole.UserRole + 1)
+        # Translated labels are constant for the whole load
+        folder_text = tr("Folder")
         
-        # Enter if folder (or .. item)
-        if is_dir:
-            print(f"[DEBUG] Folder double-clicked: {path}")
-            # Update current path immediately
-            self.current_path = path
-            self.folder_double_clicked.emit(path)
+        for file_info in files:
+            # Type (os.path.splitext avoids PurePath parsing)
+            if file_info.is_dir:
+                type_text = folder_text
+            else:
+                type_text = os.path.splitext(file_info.name)[1] or "-"
+            
+            records.append(FileRecord(
+                name=file_info.name,
+                path=file_info.path,
+                is_dir=file_info.is_dir,
+                size=file_info.size,
+                date=file_info.date,
+                permissions=file_info.permissions,
+                type=type_text,
+            ))
+        
+        return records
     
-    def _format_size(self, size: int) -> str:
-        """Format file size.
+    def _parent_record(self, parent_path: str) -> FileRecord:
+        """Create the parent folder (..) entry.
         
         Args:
-            size: Size in bytes
-            
+            parent_path: Path of the parent folder
+        
         Returns:
-            Formatted size string
+            Parent folder record
+        """
+        return FileRecord(
+            name="..",
+            path=parent_path,
+            is_dir=True,
+            type=tr("Parent"),
+            is_parent=True,
+        )
+    
+    def _on_remote_files_error(self, message: str, generation: int) -> None:
+        """Remote file list load error handler.
+        
+        Args:
+            message: Error message
+            generation: Load generation the listing was requested for
         """
-        if size == 0:
-            return ""
+        if generation != self._load_generation:
+            return
         
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
+        self._show_error(message)
+    
+    def _on_double_clicked(self, index: QModelIndex) -> None:
+        """Double-click handler.
         
-        return f"{size:.1f} PB"
+        Args:
+            index: Clicked cell index
+        """
+        record = self.model.record(index.row())
+        if record is None:
+            return
+        
+        # Enter if folder (or .. item)
+        if record.is_dir:
+            logger.debug("Folder double-clicked: %s", record.path)
+            # Update current path immediately
+            self.current_path = record.path
+            self.folder_double_clicked.emit(record.path)
     
     def _show_error(self, message: str) -> None:
         """Display error message.
@@ -481,9 +875,7 @@ class FileDetailWidget(QWidget):
         Args:
             message: Error message
         """
-        self.table.setRowCount(1)
-        error_item = QTableWidgetItem(f"⚠ {message}")
-        self.table.setItem(0, 0, error_item)
+        self.model.set_message(f"⚠ {message}")
     
     def _start_drag(self, supported_actions: Qt.DropAction) -> None:
         """Handle drag start event.
@@ -491,52 +883,17 @@ class FileDetailWidget(QWidget):
         Args:
             supported_actions: Supported drop actions
         """
-        print(f"[DEBUG] _start_drag called: panel_type={self.panel_type}")
-        
-        selected_rows = set(item.row() for item in self.table.selectedItems())
-        if not selected_rows:
-            print("[DEBUG] No rows selected")
-            return
-        
-        print(f"[DEBUG] Number of selected rows: {len(selected_rows)}")
+        logger.debug("_start_drag called: panel_type=%s", self.panel_type)
         
-        # Collect selected file info
-        file_infos = []
-        for row in selected_rows:
-            name_item = self.table.item(row, 0)
-            if not name_item:
-                continue
-            
-            path = name_item.data(Qt.ItemDataRole.UserRole)
-            is_dir = name_item.data(Qt.ItemDataRole.UserRole + 1)
-            
-            print(f"[DEBUG] Item: path={path}, is_dir={is_dir}")
-            
-            # Exclude .. (parent folder) item
-            if path and ".." in str(path):
-                print(f"[DEBUG] Excluding parent folder item")
-                continue
-            
-            # Get size
-            size_item = self.table.item(row, 1)
-            size_str = size_item.text() if size_item else "0 B"
-            size_bytes = self._parse_size(size_str) if not is_dir else 0
-            
-            file_info = {
-                "path": path,
-                "name": Path(path).name if isinstance(path, str) else path,
-                "size": size_bytes,
-                "is_dir": is_dir,
-                "panel_type": self.panel_type,
-                "device_serial": self.current_device.serial if self.current_device else None,
-            }
-            file_infos.append(file_info)
+        # Collect selected file info (.. parent folder item is excluded)
+        file_infos = self.get_selected_files()
+        logger.debug("Number of selected items: %d", len(file_infos))
         
         if not file_infos:
-            print("[DEBUG] No file info (all folders?)")
+            logger.debug("No file info (all folders?)")
             return
         
-        print(f"[DEBUG] Drag started: {len(file_infos)} items")
+        logger.debug("Drag started: %d items", len(file_infos))
         
         # Emit signal
         self.files_drag_started.emit(file_infos)
@@ -546,7 +903,7 @@ class FileDetailWidget(QWidget):
         mime_data = QMimeData()
         
         # Encode file paths as text
-        paths_text = "\n".join(str(f["path"]) for f in file_infos)
+        paths_text = "\n".join(f["path"] for f in file_infos)
         mime_data.setText(paths_text)
         
         # Add application/x-adbcopy-files type (for our app only)
@@ -554,46 +911,14 @@ class FileDetailWidget(QWidget):
         
         # Add file URLs for Windows Explorer compatibility (only for local panel)
         if self.panel_type == "local":
-            urls = [QUrl.fromLocalFile(str(f["path"])) for f in file_infos]
+            urls = [QUrl.fromLocalFile(f["path"]) for f in file_infos]
             mime_data.setUrls(urls)
         
         drag.setMimeData(mime_data)
         
-        print(f"[DEBUG] Before drag.exec call: supported_actions={supported_actions}")
+        logger.debug("Before drag.exec call: supported_actions=%s", supported_actions)
         result = drag.exec(supported_actions)
-        print(f"[DEBUG] drag.exec result: {result}")
-    
-    def _parse_size(self, size_str: str) -> int:
-        """Convert size string to bytes.
-        
-        Args:
-            size_str: Size string (e.g. "1.2 MB")
-            
-        Returns:
-            Size in bytes
-        """
-        if not size_str or size_str == "":
-            return 0
-        
-        try:
-            parts = size_str.split()
-            if len(parts) != 2:
-                return 0
-            
-            value = float(parts[0])
-            unit = parts[1].upper()
-            
-            units = {
-                "B": 1,
-                "KB": 1024,
-                "MB": 1024 ** 2,
-                "GB": 1024 ** 3,
-                "TB": 1024 ** 4,
-            }
-            
-            return int(value * units.get(unit, 1))
-        except (ValueError, IndexError):
-            return 0
+        logger.debug("drag.exec result: %s", result)
     
     def _drag_enter_event(self, event) -> None:
         """Drag enter event handler.
@@ -601,24 +926,19 @@ class FileDetailWidget(QWidget):
         Args:
             event: QDragEnterEvent
         """
-        print(f"[DEBUG] file_detail._drag_enter_event: panel_type={self.panel_type}")
-        print(f"[DEBUG] MIME formats: {event.mimeData().formats()}")
-        
-        # Check if drag started from our app or Windows Explorer
-        if event.mimeData().hasFormat("application/x-adbcopy-files"):
-            print("[DEBUG] application/x-adbcopy-files format detected - accept")
-            event.setDropAction(Qt.DropAction.CopyAction)
-            event.accept()
-        elif event.mimeData().hasUrls():
-            print("[DEBUG] URLs format detected (from Windows Explorer) - accept")
-            event.setDropAction(Qt.DropAction.CopyAction)
-            event.accept()
-        elif event.mimeData().hasText():
-            print("[DEBUG] text format detected - accept")
+        mime_data = event.mimeData()
+        if logger.isEnabledFor(logging.DEBUG):
+            # formats() builds a string list; only pay for it when logging
+            logger.debug("file_detail._drag_enter_event: panel_type=%s", self.panel_type)
+            logger.debug("MIME formats: %s", mime_data.formats())
+        
+        # Drags from our app or Windows Explorer
+        if _accepts_mime(mime_data):
+            logger.debug("supported format - accept")
             event.setDropAction(Qt.DropAction.CopyAction)
             event.accept()
         else:
-            print("[DEBUG] unsupported format - ignore")
+            logger.debug("unsupported format - ignore")
     
     def _drag_move_event(self, event) -> None:
         """Drag move event handler.
@@ -626,17 +946,20 @@ class FileDetailWidget(QWidget):
         Args:
             event: QDragMoveEvent
         """
-        print(f"[DEBUG] file_detail._drag_move_event: panel_type={self.panel_type}")
+        # Fires continuously while dragging; skip log formatting unless enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("file_detail._drag_move_event: panel_type=%s", self.panel_type)
         
         # Same logic as dragEnterEvent
-        if (event.mimeData().hasFormat("application/x-adbcopy-files") or 
-            event.mimeData().hasUrls() or 
-            event.mimeData().hasText()):
-            print("[DEBUG] dragMove accept")
+        if _accepts_mime(event.mimeData()):
+            if debug:
+                logger.debug("dragMove accept")
             event.setDropAction(Qt.DropAction.CopyAction)
             event.accept()
         else:
-            print("[DEBUG] dragMove ignore")
+            if debug:
+                logger.debug("dragMove ignore")
             event.ignore()
     
     def _drop_event(self, event) -> None:
@@ -645,11 +968,11 @@ class FileDetailWidget(QWidget):
         Args:
             event: QDropEvent
         """
-        print(f"[DEBUG] file_detail._drop_event: panel_type={self.panel_type}")
+        logger.debug("file_detail._drop_event: panel_type=%s", self.panel_type)
         
         # Handle drops from Windows Explorer
         if event.mimeData().hasUrls() and self.panel_type == "remote":
-            print("[DEBUG] Drop from Windows Explorer detected")
+            logger.debug("Drop from Windows Explorer detected")
             event.setDropAction(Qt.DropAction.CopyAction)
             event.accept()
             
@@ -657,32 +980,26 @@ class FileDetailWidget(QWidget):
             external_files = []
             for url in event.mimeData().urls():
                 if url.isLocalFile():
-                    file_path = Path(url.toLocalFile())
-                    external_files.append({
-                        "path": str(file_path),
-                        "name": file_path.name,
-                        "size": file_path.stat().st_size if file_path.is_file() else 0,
-                        "is_dir": file_path.is_dir(),
-                        "panel_type": "local",
-                        "device_serial": None,
-                    })
+                    file_info = _local_file_info(url.toLocalFile())
+                    if file_info is not None:
+                        external_files.append(file_info)
             
             if external_files:
                 # Emit as if dragged from local panel
                 self.files_dropped.emit(external_files)
-                print(f"[DEBUG] Dropped {len(external_files)} files from Windows Explorer")
+                logger.debug("Dropped %d files from Windows Explorer", len(external_files))
             return
         
         # Handle internal drops
         if event.mimeData().hasFormat("application/x-adbcopy-files") or event.mimeData().hasText():
-            print("[DEBUG] Drop allowed")
+            logger.debug("Drop allowed")
             event.setDropAction(Qt.DropAction.CopyAction)
             event.accept()
             # Notify drop (actual file info is managed in main_window)
             self.files_dropped.emit([])
-            print("[DEBUG] files_dropped signal emitted")
+            logger.debug("files_dropped signal emitted")
         else:
-            print("[DEBUG] Drop rejected")
+            logger.debug("Drop rejected")
     
     def _show_context_menu(self, position) -> None:
         """Display context menu.
@@ -693,16 +1010,16 @@ class FileDetailWidget(QWidget):
         menu = QMenu(self)
         
         # Check selected items
-        selected_rows = set(item.row() for item in self.table.selectedItems())
+        selected_records = self._selected_records()
         
         if self.panel_type == "remote" and self.current_device:
             # Remote panel menu
-            if selected_rows:
+            if selected_records:
                 delete_action = QAction(tr("Delete"), self)
                 delete_action.triggered.connect(self._on_delete_selected)
                 menu.addAction(delete_action)
                 
-                if len(selected_rows) == 1:
+                if len(selected_records) == 1:
                     rename_action = QAction(tr("Rename"), self)
                     rename_action.triggered.connect(self._on_rename_selected)
                     menu.addAction(rename_action)
@@ -712,10 +1029,10 @@ class FileDetailWidget(QWidget):
             new_folder_action = QAction(tr("New Folder"), self)
             new_folder_action.triggered.connect(self._on_create_folder)
             menu.addAction(new_folder_action)
-            
+        
         elif self.panel_type == "local":
             # Local panel menu (simple version)
-            if len(selected_rows) == 1:
+            if len(selected_records) == 1:
                 rename_action = QAction(tr("Rename"), self)
                 rename_action.triggered.connect(self._on_rename_local)
                 menu.addAction(rename_action)
@@ -732,15 +1049,15 @@ class FileDetailWidget(QWidget):
         if not self.current_device:
             return
         
-        selected_rows = set(item.row() for item in self.table.selectedItems())
-        if not selected_rows:
+        selected_records = self._selected_records()
+        if not selected_records:
             return
         
         # Confirmation dialog
         reply = QMessageBox.question(
             self,
             tr("Confirm Delete"),
-            tr("Delete {0} item(s)?").format(len(selected_rows)),
+            tr("Delete {0} item(s)?").format(len(selected_records)),
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
         )
         
@@ -748,22 +1065,15 @@ class FileDetailWidget(QWidget):
             return
         
         # Execute delete
-        for row in selected_rows:
-            name_item = self.table.item(row, 0)
-            if not name_item:
-                continue
-            
-            path = name_item.data(Qt.ItemDataRole.UserRole)
-            is_dir = name_item.data(Qt.ItemDataRole.UserRole + 1)
-            
+        for record in selected_records:
             try:
                 self.adb_manager.delete_file(
                     self.current_device.serial,
-                    path,
-                    is_dir=is_dir,
+                    record.path,
+                    is_dir=record.is_dir,
                 )
             except Exception as e:
-                QMessageBox.warning(self, tr("Delete Failed"), f"{path}\n\n{str(e)}")
+                QMessageBox.warning(self, tr("Delete Failed"), f"{record.path}\n\n{str(e)}")
         
         # Refresh
         self.refresh_requested.emit()
@@ -773,17 +1083,12 @@ class FileDetailWidget(QWidget):
         if not self.current_device:
             return
         
-        selected_rows = list(set(item.row() for item in self.table.selectedItems()))
-        if not selected_rows:
-            return
-        
-        row = selected_rows[0]
-        name_item = self.table.item(row, 0)
-        if not name_item:
+        selected_records = self._selected_records()
+        if not selected_records:
             return
         
-        old_path = name_item.data(Qt.ItemDataRole.UserRole)
-        old_name = Path(old_path).name
+        old_path = selected_records[0].path
+        old_name = selected_records[0].name
         
         # New name input dialog
         new_name, ok = QInputDialog.getText(
@@ -797,7 +1102,7 @@ class FileDetailWidget(QWidget):
             return
         
         # Create new path
-        parent_path = "/".join(old_path.rstrip("/").split("/")[:-1])
+        parent_path = _parent_posix(old_path).rstrip("/")
         new_path = f"{parent_path}/{new_name}"
         
         try:
@@ -841,17 +1146,12 @@ class FileDetailWidget(QWidget):
     
     def _on_rename_local(self) -> None:
         """Local file rename handler."""
-        selected_rows = list(set(item.row() for item in self.table.selectedItems()))
-        if not selected_rows:
-            return
-        
-        row = selected_rows[0]
-        name_item = self.table.item(row, 0)
-        if not name_item:
+        selected_records = self._selected_records()
+        if not selected_records:
             return
         
-        old_path = Path(name_item.data(Qt.ItemDataRole.UserRole))
-        old_name = old_path.name
+        old_path = selected_records[0].path
+        old_name = selected_records[0].name
         
         # New name input dialog
         new_name, ok = QInputDialog.getText(
@@ -864,11 +1164,11 @@ class FileDetailWidget(QWidget):
         if not ok or not new_name or new_name == old_name:
             return
         
-        # Create new path
-        new_path = old_path.parent / new_name
+        # Create new path (record already holds the name; no Path parsing needed)
+        new_path = os.path.join(os.path.dirname(old_path), new_name)
         
         try:
-            old_path.rename(new_path)
+            os.rename(old_path, new_path)
             # Refresh
             self.refresh_requested.emit()
         except Exception as e:
@@ -884,33 +1184,11 @@ class FileDetailWidget(QWidget):
     
     def _update_status_bar(self) -> None:
         """Update status bar."""
-        selected_rows = set(item.row() for item in self.table.selectedItems())
+        selected_records = self._selected_records()
         
-        if not selected_rows:
-            # No selection - show total statistics
-            total_items = self.table.rowCount()
-            total_files = 0
-            total_dirs = 0
-            total_size = 0
-            
-            for row in range(total_items):
-                name_item = self.table.item(row, 0)
-                if not name_item:
-                    continue
-                
-                is_dir = name_item.data(Qt.ItemDataRole.UserRole + 1)
-                
-                # Exclude .. item
-                if name_item.text() == "📁 ..":
-                    continue
-                
-                if is_dir:
-                    total_dirs += 1
-                else:
-                    total_files += 1
-                    size_item = self.table.item(row, 1)
-                    if size_item:
-                        total_size += self._parse_size(size_item.text())
+        if not selected_records and not self.table.selectionModel().hasSelection():
+            # No selection - show total statistics (cached per load)
+            total_files, total_dirs, total_size = self.model.totals()
             
             # Generate status bar text
             parts = []
@@ -919,7 +1197,7 @@ class FileDetailWidget(QWidget):
             if total_dirs > 0:
                 parts.append(tr("{0} dir(s)").format(total_dirs))
             if total_size > 0:
-                parts.append(tr("Total size: {0}").format(self._format_size(total_size)))
+                parts.append(tr("Total size: {0}").format(_format_size(total_size)))
             
             status_text = ", ".join(parts) if parts else tr("0 items")
             self.status_label.setText(status_text)
@@ -929,24 +1207,12 @@ class FileDetailWidget(QWidget):
             selected_dirs = 0
             selected_size = 0
             
-            for row in selected_rows:
-                name_item = self.table.item(row, 0)
-                if not name_item:
-                    continue
-                
-                is_dir = name_item.data(Qt.ItemDataRole.UserRole + 1)
-                
-                # Exclude .. item
-                if name_item.text() == "📁 ..":
-                    continue
-                
-                if is_dir:
+            for record in selected_records:
+                if record.is_dir:
                     selected_dirs += 1
                 else:
                     selected_files += 1
-                    size_item = self.table.item(row, 1)
-                    if size_item:
-                        selected_size += self._parse_size(size_item.text())
+                    selected_size += record.size
             
             # Generate status bar text
             parts = []
@@ -955,7 +1221,7 @@ class FileDetailWidget(QWidget):
             if selected_dirs > 0:
                 parts.append(tr("{0} dir(s) selected").format(selected_dirs))
             if selected_size > 0:
-                parts.append(tr("Total size: {0}").format(self._format_size(selected_size)))
+                parts.append(tr("Total size: {0}").format(_format_size(selected_size)))
             
             status_text = ", ".join(parts) if parts else tr("0 selected")
             self.status_label.setText(status_text)
@@ -982,6 +1248,18 @@ class FileDetailWidget(QWidget):
         # Perform custom sort
         self._custom_sort(column, self._current_sort_order)
     
+    def _apply_current_sort(self) -> None:
+        """Order newly loaded rows by the column shown in the header.
+        
+        Listings arrive folders first by name, which is already the
+        default order, so only other header sorts need a sort pass.
+        """
+        if (
+            self._current_sort_column != 0
+            or self._current_sort_order != Qt.SortOrder.AscendingOrder
+        ):
+            self.model.sort(self._current_sort_column, self._current_sort_order)
+    
     def _custom_sort(self, column: int, order: Qt.SortOrder) -> None:
         """Perform custom sorting that keeps folders and files separated.
         
@@ -989,92 +1267,8 @@ class FileDetailWidget(QWidget):
             column: Column to sort by
             order: Sort order (Ascending or Descending)
         """
-        # Disable sorting to prevent conflicts
-        self.table.setSortingEnabled(False)
-        
-        # Collect all rows data (copy data, not references)
-        rows_data = []
-        for row in range(self.table.rowCount()):
-            row_data = []
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item:
-                    # Store item data (not item reference)
-                    item_data = {
-                        'text': item.text(),
-                        'user_role': item.data(Qt.ItemDataRole.UserRole),
-                        'user_role_1': item.data(Qt.ItemDataRole.UserRole + 1),
-                        'user_role_2': item.data(Qt.ItemDataRole.UserRole + 2),
-                        'alignment': item.textAlignment(),
-                    }
-                    row_data.append(item_data)
-                else:
-                    row_data.append(None)
-            
-            # Get is_dir flag from first column
-            is_dir = row_data[0]['user_role_1'] if row_data[0] else False
-            
-            # Get sort key from target column
-            if column < len(row_data) and row_data[column]:
-                # Try UserRole + 2 first (Name column), then UserRole
-                sort_key = row_data[column]['user_role_2']
-                if sort_key is None:
-                    sort_key = row_data[column]['user_role']
-                if sort_key is None:
-                    sort_key = row_data[column]['text']
-            else:
-                sort_key = ""
-            
-            rows_data.append((row_data, is_dir, sort_key))
-        
-        # Separate folders and files
-        folders = [(data, sort_key) for data, is_dir, sort_key in rows_data if is_dir]
-        files = [(data, sort_key) for data, is_dir, sort_key in rows_data if not is_dir]
-        
-        # Sort each group
-        reverse = (order == Qt.SortOrder.DescendingOrder)
-        
-        # Sort with type-safe comparison
-        def safe_sort_key(x):
-            key = x[1]
-            # Convert to comparable type (str for consistent comparison)
-            if isinstance(key, (int, float)):
-                # Pad numbers to ensure proper sorting (e.g., 1 < 10 < 100)
-                return f"{key:020.2f}"
-            return str(key) if key is not None else ""
-        
-        folders.sort(key=safe_sort_key, reverse=reverse)
-        files.sort(key=safe_sort_key, reverse=reverse)
-        
-        # Combine: Ascending = folders first, Descending = files first
-        if order == Qt.SortOrder.AscendingOrder:
-            sorted_rows = folders + files
-        else:
-            sorted_rows = files + folders
-        
-        # Clear and repopulate table
-        self.table.setRowCount(0)
-        for row_data, _ in sorted_rows:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            for col, item_data in enumerate(row_data):
-                if item_data:
-                    # Create new item from stored data
-                    new_item = SortableTableWidgetItem(item_data['text'])
-                    
-                    # Restore all data roles
-                    if item_data['user_role'] is not None:
-                        new_item.setData(Qt.ItemDataRole.UserRole, item_data['user_role'])
-                    if item_data['user_role_1'] is not None:
-                        new_item.setData(Qt.ItemDataRole.UserRole + 1, item_data['user_role_1'])
-                    if item_data['user_role_2'] is not None:
-                        new_item.setData(Qt.ItemDataRole.UserRole + 2, item_data['user_role_2'])
-                    
-                    # Restore text alignment
-                    if item_data['alignment']:
-                        new_item.setTextAlignment(item_data['alignment'])
-                    
-                    self.table.setItem(row, col, new_item)
+        # Rows are sorted in the model; selection follows the moved rows
+        self.model.sort(column, order)
     
     def _key_press_event(self, event: QKeyEvent) -> None:
         """Keyboard event handler.
@@ -1095,39 +1289,24 @@ class FileDetailWidget(QWidget):
             return
         
         # Call default handler for other keys
-        QTableWidget.keyPressEvent(self.table, event)
+        QTableView.keyPressEvent(self.table, event)
     
     def _copy_to_clipboard(self) -> None:
         """Copy selected files to clipboard."""
-        selected_rows = set(item.row() for item in self.table.selectedItems())
-        if not selected_rows:
+        # Only local files can be copied to clipboard
+        if self.panel_type != "local":
             return
         
-        # Collect file paths
-        file_paths = []
-        for row in selected_rows:
-            name_item = self.table.item(row, 0)
-            if not name_item:
-                continue
-            
-            path = name_item.data(Qt.ItemDataRole.UserRole)
-            
-            # Exclude .. item
-            if path and ".." in str(path):
-                continue
-            
-            # Only local files can be copied to clipboard
-            if self.panel_type == "local":
-                file_paths.append(Path(path))
-        
-        if file_paths:
-            # Set URLs to clipboard
-            mime_data = QMimeData()
-            urls = [QUrl.fromLocalFile(str(p)) for p in file_paths]
-            mime_data.setUrls(urls)
-            
-            QApplication.clipboard().setMimeData(mime_data)
-            print(f"[DEBUG] Copied {len(file_paths)} files to clipboard")
+        urls = [QUrl.fromLocalFile(record.path) for record in self._selected_records()]
+        if not urls:
+            return
+        
+        # Set URLs to clipboard
+        mime_data = QMimeData()
+        mime_data.setUrls(urls)
+        
+        QApplication.clipboard().setMimeData(mime_data)
+        logger.debug("Copied %d files to clipboard", len(urls))
     
     def _paste_from_clipboard(self) -> None:
         """Paste files from clipboard."""
@@ -1141,23 +1320,24 @@ class FileDetailWidget(QWidget):
         if self.panel_type != "remote":
             return
         
-        # Extract file paths from clipboard
-        external_files = []
-        for url in mime_data.urls():
-            if url.isLocalFile():
-                file_path = Path(url.toLocalFile())
-                if file_path.exists():
-                    external_files.append({
-                        "path": str(file_path),
-                        "name": file_path.name,
-                        "size": file_path.stat().st_size if file_path.is_file() else 0,
-                        "is_dir": file_path.is_dir(),
-                        "panel_type": "local",
-                        "device_serial": None,
-                    })
+        # Extract file paths from clipboard (cheap; stat runs on the thread pool)
+        paths = [url.toLocalFile() for url in mime_data.urls() if url.isLocalFile()]
+        if not paths:
+            return
+        
+        signals = _LocalFileInfoSignals(self)
+        signals.finished.connect(self._on_paste_files_collected)
+        signals.finished.connect(signals.deleteLater)
+        QThreadPool.globalInstance().start(_LocalFileInfoRunnable(paths, signals))
+    
+    def _on_paste_files_collected(self, external_files: list[dict]) -> None:
+        """Clipboard file info collection completion handler.
         
+        Args:
+            external_files: File info of pasted local files
+        """
         if external_files:
             # Trigger drop event with external files
             self.files_dropped.emit(external_files)
-            print(f"[DEBUG] Pasted {len(external_files)} files from clipboard")
+            logger.debug("Pasted %d files from clipboard", len(external_files))
 
@@ -3,26 +3,495 @@
 Displays hierarchical folder tree structure.
 """
 
+import ctypes
+import logging
 import os
 import string
-from pathlib import Path
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from PyQt6.QtCore import (
+    QAbstractItemModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QStandardPaths,
+    Qt,
+    pyqtSignal,
+    QThreadPool,
+)
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLineEdit,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
     QMessageBox,
 )
 
 from adb_copy.core.adb_manager import AdbDevice, AdbManager
-from adb_copy.workers.file_list_worker import FileListWorker, RemoteFileInfo
+from adb_copy.workers.file_list_worker import (
+    FileListBatchRunnable,
+    FileListRunnable,
+    RemoteFileInfo,
+)
 from adb_copy.i18n import tr
 
 
+logger = logging.getLogger(__name__)
+
+def _path_parts(path: str) -> tuple[str, ...]:
+    """Split a local path into comparable parts.
+    
+    Case-normalized like Windows path comparison, so ancestry checks become
+    tuple prefix comparisons instead of Path object math.
+    
+    Args:
+        path: Local path
+    
+    Returns:
+        Path parts (e.g. ("c:\\", "users", "me"))
+    """
+    return Path(os.path.normcase(path)).parts
+
+
+def _drive_letters() -> list[str]:
+    """Get the letters of existing drives.
+    
+    On Windows the drive bitmask comes from a single GetLogicalDrives() call
+    instead of probing all 26 letters.
+    
+    Returns:
+        Drive letters (e.g. ["C", "D"])
+    """
+    if sys.platform == "win32":
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+        return [letter for i, letter in enumerate(string.ascii_uppercase) if mask & (1 << i)]
+    return [letter for letter in string.ascii_uppercase if os.path.exists(f"{letter}:\\")]
+
+
+def _standard_folder(location: QStandardPaths.StandardLocation) -> str:
+    """Get the path of a standard (known) folder of the user.
+    
+    Args:
+        location: Standard location
+    
+    Returns:
+        Native folder path, or "" if it is not configured or does not exist
+    """
+    path = QStandardPaths.writableLocation(location)
+    if not path or not os.path.isdir(path):
+        return ""
+    # Qt returns "/" separators; the tree and path box use native ones
+    return os.path.normpath(path)
+
+
+def _list_local_subfolders(parent_path: str) -> list[tuple[str, str, str]]:
+    """List the visible subfolders of a local folder in one directory scan.
+    
+    DirEntry.is_dir() answers from the directory enumeration data, so no
+    extra stat() call is made per entry. Rows carry their casefolded name
+    first, so they sort without a key function.
+    
+    Args:
+        parent_path: Local folder path
+    
+    Returns:
+        (sort key, name, path) per subfolder, sorted by name
+    
+    Raises:
+        OSError: If the folder cannot be read
+    """
+    with os.scandir(parent_path) as entries:
+        # Exclude hidden folders (optional)
+        subfolders = [
+            (entry.name.casefold(), entry.name, entry.path)
+            for entry in entries
+            if not entry.name.startswith(".") and entry.is_dir()
+        ]
+    subfolders.sort()
+    return subfolders
+
+
+def _accepts_mime(mime_data) -> bool:
+    """Check whether a drag carries something the tree accepts.
+    
+    Args:
+        mime_data: QMimeData of the drag
+    
+    Returns:
+        True for ADBCopy file lists and text
+    """
+    return mime_data.hasFormat("application/x-adbcopy-files") or mime_data.hasText()
+
+
+class _LocalFolderListSignals(QObject):
+    """Signals of _LocalFolderListRunnable.
+    
+    Signals:
+        finished: Emitted when the folder is listed (list[tuple]: subfolders)
+        error_occurred: Emitted when the folder cannot be read (str)
+    """
+    
+    finished = pyqtSignal(list)
+    error_occurred = pyqtSignal(str)
+
+
+class _LocalFolderListRunnable(QRunnable):
+    """Lists local subfolders on a thread pool thread.
+    
+    Keeps directory scans of slow disks and network shares off the GUI thread.
+    """
+    
+    def __init__(self, parent_path: str, signals: _LocalFolderListSignals) -> None:
+        """Initialize _LocalFolderListRunnable instance.
+        
+        Args:
+            parent_path: Local folder path
+            signals: Signals object to report the result through
+        """
+        super().__init__()
+        self.parent_path = parent_path
+        self.signals = signals
+    
+    def run(self) -> None:
+        """List the folder and emit its subfolders."""
+        try:
+            subfolders = _list_local_subfolders(self.parent_path)
+        except PermissionError:
+            self.signals.error_occurred.emit("Permission denied")
+        except OSError as e:
+            self.signals.error_occurred.emit(str(e))
+        else:
+            self.signals.finished.emit(subfolders)
+
+
+# Item data roles as plain ints (FolderTreeModel.data() runs for every
+# visible row on each repaint; PyQt6 enum attribute access is slow there)
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+_PATH_ROLE = int(Qt.ItemDataRole.UserRole)
+_NODE_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+# Node id of the invisible root whose children are the top-level rows
+_ROOT = 0
+
+# (label, path or None, has children) of a node to insert
+TreeRow = tuple[str, str | None, bool]
+
+
+class FolderTreeModel(QAbstractItemModel):
+    """Tree model holding the folders shown by FolderTreeWidget.
+    
+    Nodes are stored as parallel lists indexed by node id instead of one
+    item object per row, and the view only asks for the rows it paints.
+    Folder children are loaded lazily: canFetchMore()/fetchMore() hand the
+    request to the owner through fetch_requested, which fills the folder
+    later with set_children() or set_message().
+    
+    Nodes without a path are virtual ("My PC") or message rows
+    ("Loading...", errors).
+    
+    Signals:
+        fetch_requested: Emitted when a folder's children are needed (str: folder path)
+    """
+    
+    fetch_requested = pyqtSignal(str)
+    
+    def __init__(self, path_key: Callable[[str], tuple[str, ...]], parent=None) -> None:
+        """Initialize FolderTreeModel instance.
+        
+        Args:
+            path_key: Maps a folder path to its normalized lookup key
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._path_key = path_key
+        self._reset_nodes()
+    
+    def _reset_nodes(self) -> None:
+        """Drop all nodes and recreate the invisible root."""
+        # Node ids are the internal ids of the model indexes
+        self._labels: list[str] = [""]
+        self._paths: list[str | None] = [None]
+        self._parents: list[int] = [_ROOT]
+        self._rows: list[int] = [0]
+        self._children: list[list[int]] = [[]]
+        self._fetchable: list[bool] = [False]  # Children not requested yet
+        self._loading: set[int] = set()  # Folders whose listing is in flight
+        self._path_to_node: dict[tuple[str, ...], int] = {}
+        # Ids of removed nodes, reused by _add_nodes so that reloading
+        # folders does not grow the lists
+        self._free_nodes: list[int] = []
+    
+    def _node(self, index: QModelIndex) -> int:
+        """Get the node id of an index (root for an invalid index)."""
+        return index.internalId() if index.isValid() else _ROOT
+    
+    def _index_of(self, node: int) -> QModelIndex:
+        """Create the index of a node."""
+        if node == _ROOT:
+            return QModelIndex()
+        return self.createIndex(self._rows[node], 0, node)
+    
+    def index_for_key(self, key: tuple[str, ...]) -> QModelIndex:
+        """Find the folder with a lookup key.
+        
+        Args:
+            key: Normalized path key (see path_key)
+        
+        Returns:
+            Index of the folder, or an invalid index if it is not loaded
+        """
+        node = self._path_to_node.get(key)
+        return QModelIndex() if node is None else self._index_of(node)
+    
+    def is_loading(self, index: QModelIndex) -> bool:
+        """Check whether a folder's children are still being listed.
+        
+        Args:
+            index: Folder index
+        
+        Returns:
+            True if its listing is in flight
+        """
+        return self._node(index) in self._loading
+    
+    def clear(self) -> None:
+        """Remove all nodes."""
+        self.beginResetModel()
+        self._reset_nodes()
+        self.endResetModel()
+    
+    def append_rows(self, parent: QModelIndex, rows: list[TreeRow]) -> None:
+        """Append nodes under a parent in one insertion.
+        
+        Args:
+            parent: Parent index (invalid for top-level rows)
+            rows: Nodes to append
+        """
+        if not rows:
+            return
+        node = self._node(parent)
+        first = len(self._children[node])
+        self.beginInsertRows(parent, first, first + len(rows) - 1)
+        self._add_nodes(node, rows)
+        self.endInsertRows()
+    
+    def set_children(self, path: str, rows: list[TreeRow]) -> None:
+        """Replace the children of a folder with its listing.
+        
+        Ignored if the folder is no longer in the tree.
+        
+        Args:
+            path: Folder path
+            rows: Subfolder nodes
+        """
+        node = self._path_to_node.get(self._path_key(path))
+        if node is not None:
+            self._replace_children(node, rows)
+    
+    def set_loading(self, path: str) -> None:
+        """Show the loading indicator under a folder.
+        
+        Args:
+            path: Folder path
+        """
+        node = self._path_to_node.get(self._path_key(path))
+        if node is not None:
+            self._replace_children(node, [(tr("Loading..."), None, False)])
+            self._loading.add(node)
+    
+    def reset_children(self, path: str) -> QModelIndex:
+        """Drop the loaded children of a folder so they are requested again.
+        
+        Args:
+            path: Folder path
+        
+        Returns:
+            Index of the folder, or an invalid index if it is not in the tree
+        """
+        node = self._path_to_node.get(self._path_key(path))
+        if node is None:
+            return QModelIndex()
+        self._replace_children(node, [])
+        self._fetchable[node] = True
+        return self._index_of(node)
+    
+    def set_message(self, path: str, message: str) -> None:
+        """Show a message (e.g. an error) as the only child of a folder.
+        
+        Args:
+            path: Folder path
+            message: Message text
+        """
+        self.set_children(path, [(message, None, False)])
+    
+    def _add_nodes(self, parent: int, rows: list[TreeRow]) -> None:
+        """Create nodes at the end of a parent's children."""
+        children = self._children[parent]
+        for label, path, has_children in rows:
+            if self._free_nodes:
+                node = self._free_nodes.pop()
+                self._labels[node] = label
+                self._paths[node] = path
+                self._parents[node] = parent
+                self._rows[node] = len(children)
+                self._children[node] = []
+                self._fetchable[node] = has_children
+            else:
+                node = len(self._labels)
+                self._labels.append(label)
+                self._paths.append(path)
+                self._parents.append(parent)
+                self._rows.append(len(children))
+                self._children.append([])
+                self._fetchable.append(has_children)
+            children.append(node)
+            if path is not None:
+                self._path_to_node[self._path_key(path)] = node
+    
+    def _forget(self, node: int) -> None:
+        """Unregister a removed node and its descendants and free their ids."""
+        path = self._paths[node]
+        if path is not None:
+            key = self._path_key(path)
+            if self._path_to_node.get(key) == node:
+                del self._path_to_node[key]
+        self._loading.discard(node)
+        for child in self._children[node]:
+            self._forget(child)
+        # Drop the references held by the free slot
+        self._labels[node] = ""
+        self._paths[node] = None
+        self._children[node] = []
+        self._free_nodes.append(node)
+    
+    def _replace_children(self, node: int, rows: list[TreeRow]) -> None:
+        """Remove all children of a node, then add new ones."""
+        self._loading.discard(node)
+        self._fetchable[node] = False
+        parent = self._index_of(node)
+        
+        old_children = self._children[node]
+        if old_children:
+            self.beginRemoveRows(parent, 0, len(old_children) - 1)
+            for child in old_children:
+                self._forget(child)
+            self._children[node] = []
+            self.endRemoveRows()
+        
+        self.append_rows(parent, rows)
+    
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Get the index of a child row."""
+        children = self._children[self._node(parent)]
+        if column != 0 or not 0 <= row < len(children):
+            return QModelIndex()
+        return self.createIndex(row, 0, children[row])
+    
+    def parent(self, index: QModelIndex | None = None):
+        """Get the parent index of a node (or the parent QObject without arguments)."""
+        if index is None:
+            return super().parent()
+        if not index.isValid():
+            return QModelIndex()
+        return self._index_of(self._parents[index.internalId()])
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get row count."""
+        if parent.column() > 0:
+            return 0
+        return len(self._children[self._node(parent)])
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get column count."""
+        return 1
+    
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Check for children without listing the folder."""
+        node = self._node(parent)
+        return bool(self._children[node]) or self._fetchable[node]
+    
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Check whether a folder's children still have to be requested."""
+        return parent.isValid() and self._fetchable[parent.internalId()]
+    
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Request a folder's children through fetch_requested."""
+        node = self._node(parent)
+        if not self._fetchable[node]:
+            return
+        self._fetchable[node] = False
+        self.fetch_requested.emit(self._paths[node])
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Get data of a node.
+        
+        Args:
+            index: Node index
+            role: Data role
+        
+        Returns:
+            Label (DisplayRole) or folder path (UserRole)
+        """
+        if not index.isValid():
+            return None
+        if role == _DISPLAY_ROLE:
+            return self._labels[index.internalId()]
+        if role == _PATH_ROLE:
+            return self._paths[index.internalId()]
+        return None
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Get item flags."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return _NODE_FLAGS
+
+
+@dataclass(slots=True)
+class _RemoteFolders:
+    """Subfolders of one remote folder as parallel lists.
+    
+    Cached per folder instead of the RemoteFileInfo objects, which also carry
+    size, permissions and date the tree never shows.
+    
+    Attributes:
+        names: Subfolder names
+        paths: Subfolder full paths
+    """
+    names: list[str]
+    paths: list[str]
+    
+    @classmethod
+    def from_files(cls, files: list[RemoteFileInfo]) -> "_RemoteFolders":
+        """Keep the folders of a directory listing.
+        
+        Args:
+            files: Directory listing from FileListWorker
+        
+        Returns:
+            Subfolders of the listing
+        """
+        folders = [f for f in files if f.is_dir]
+        return cls([f.name for f in folders], [f.path for f in folders])
+
+
+# Remote folder listing cache (seconds a listing stays fresh, max entries)
+_REMOTE_CACHE_TTL = 10.0
+_REMOTE_CACHE_SIZE = 256
+
+# Number of subfolders listed ahead after a remote folder loads
+_PREFETCH_COUNT = 8
+
+# Maximum number of navigation history entries
+_HISTORY_SIZE = 100
+
+
 class FolderTreeWidget(QWidget):
     """Folder tree widget class.
     
@@ -46,9 +515,25 @@ class FolderTreeWidget(QWidget):
         self.panel_type = panel_type
         self.current_device: AdbDevice | None = None
         self._previous_path = ""
+        self._drives_loaded = False  # Local drive tree is built on first show
+        
+        # Folder the panel currently shows (last one announced or navigated to)
+        self._last_emitted_path = ""
+        
+        # (device serial, path) -> (load time, subfolders) of recent remote listings
+        self._remote_cache: dict[tuple[str, str], tuple[float, _RemoteFolders]] = {}
+        self._prefetching: set[tuple[str, str]] = set()  # Cache keys being listed ahead
+        
+        # Folder key -> listing generation, bumped by invalidate_path so that
+        # listings started before the invalidation are dropped
+        self._list_generations: dict[tuple[str, ...], int] = {}
+        
+        # Path to resume expanding to once its next level has loaded
+        self._pending_expand: str | None = None
         
         # Navigation history
-        self._history_stack = []  # List of visited paths
+        # Visited paths, oldest dropped first
+        self._history_stack: deque[str] = deque(maxlen=_HISTORY_SIZE)
         self._history_index = -1  # Current position in history
         
         self._init_ui()
@@ -92,42 +577,55 @@ class FolderTreeWidget(QWidget):
         
         layout.addLayout(path_layout)
         
-        # Folder tree
-        self.tree_widget = QTreeWidget()
-        self.tree_widget.setHeaderHidden(True)
-        self.tree_widget.itemClicked.connect(self._on_item_clicked)
-        self.tree_widget.itemExpanded.connect(self._on_item_expanded)
+        # Folder tree (children are listed when the view fetches them)
+        self.model = FolderTreeModel(self._path_key, self)
+        self.model.fetch_requested.connect(self._on_fetch_requested)
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.model)
+        self.tree_view.setHeaderHidden(True)
+        self.tree_view.clicked.connect(self._on_item_clicked)
         
         # Enable drop
-        self.tree_widget.setAcceptDrops(True)
-        self.tree_widget.setDropIndicatorShown(True)
-        self.tree_widget.dragEnterEvent = self._drag_enter_event
-        self.tree_widget.dragMoveEvent = self._drag_move_event
-        self.tree_widget.dropEvent = self._drop_event
+        self.tree_view.setAcceptDrops(True)
+        self.tree_view.setDropIndicatorShown(True)
+        self.tree_view.dragEnterEvent = self._drag_enter_event
+        self.tree_view.dragMoveEvent = self._drag_move_event
+        self.tree_view.dropEvent = self._drop_event
         
         # Improve hover/selection colors
-        self.tree_widget.setStyleSheet("""
-            QTreeWidget {
+        self.tree_view.setStyleSheet("""
+            QTreeView {
                 selection-background-color: #A8D3FF;  /* Light blue */
                 selection-color: #000000;  /* Black text */
             }
-            QTreeWidget::item:hover {
+            QTreeView::item:hover {
                 background-color: #E8E8E8;  /* Light gray */
             }
-            QTreeWidget::item:selected {
+            QTreeView::item:selected {
                 background-color: #A8D3FF;  /* Light blue */
                 color: #000000;  /* Black text */
             }
         """)
         
-        layout.addWidget(self.tree_widget)
+        layout.addWidget(self.tree_view)
         
-        # Set initial path
-        if self.panel_type == "local":
-            self._load_windows_drives()
-        else:
+        # Set initial path (the local drive tree is built in showEvent)
+        if self.panel_type == "remote":
             self.path_edit.setText("/")
     
+    def showEvent(self, event) -> None:
+        """Build the local drive tree the first time the widget is shown.
+        
+        Keeps drive and special folder lookups out of application startup.
+        
+        Args:
+            event: QShowEvent
+        """
+        if self.panel_type == "local" and not self._drives_loaded:
+            self._drives_loaded = True
+            self._load_windows_drives()
+        super().showEvent(event)
+
     def set_device(self, device: AdbDevice | None) -> None:
         """Set connected device for remote panel.
         
@@ -138,11 +636,14 @@ class FolderTreeWidget(QWidget):
             return
         
         self.current_device = device
+        self._remote_cache.clear()
+        self._pending_expand = None
+        self._last_emitted_path = ""
         
         if device:
             self._load_remote_root("/sdcard/")
         else:
-            self.tree_widget.clear()
+            self.model.clear()
             self.path_edit.clear()
     
     def _on_path_entered(self) -> None:
@@ -164,117 +665,100 @@ class FolderTreeWidget(QWidget):
         previous_path = self.path_edit.text()
         
         if self.panel_type == "local":
-            if not Path(path).exists():
+            if not os.path.exists(path):
                 QMessageBox.warning(self, tr("Path error"), tr("Path does not exist:\n{0}").format(path))
                 self.path_edit.setText(previous_path)
                 return
             # Navigate to path and expand tree
             self._add_to_history(path)
             self.expand_and_select_path(path)  # Expand tree to show path
-            self.folder_selected.emit(path)
+            self._emit_folder_selected(path)
         else:
-            # Remote path - navigate and expand tree
+            # Remote path - navigate and expand tree (always re-list it)
+            if self.current_device:
+                self._remote_cache.pop((self.current_device.serial, path), None)
             self._previous_path = previous_path
             self._add_to_history(path)
             self.expand_and_select_path(path)  # Expand tree to show path
-            self.folder_selected.emit(path)
+            self._emit_folder_selected(path)
     
-    def _on_item_clicked(self, item: QTreeWidgetItem, column: int) -> None:
+    def _on_item_clicked(self, index: QModelIndex) -> None:
         """Called when tree item is clicked.
         
         Args:
-            item: Clicked item
-            column: Column index
+            index: Clicked index
         """
-        folder_path = item.data(0, Qt.ItemDataRole.UserRole)
+        folder_path = index.data(_PATH_ROLE)
         
-        # Virtual nodes like "My PC" are None
-        if folder_path is None:
+        # Virtual nodes like "My PC" are None; skip reloading the current folder
+        if not folder_path or folder_path == self._last_emitted_path:
             return
         
-        if folder_path:
-            self._add_to_history(folder_path)
-            self.folder_selected.emit(folder_path)
+        self._add_to_history(folder_path)
+        self._emit_folder_selected(folder_path)
     
-    def _on_item_expanded(self, item: QTreeWidgetItem) -> None:
-        """Called when tree item is expanded.
+    def _on_fetch_requested(self, folder_path: str) -> None:
+        """Called when the view needs the children of a folder.
         
         Args:
-            item: Expanded item
+            folder_path: Folder path
         """
-        # Load actual contents if child is placeholder
-        if item.childCount() == 1:
-            child = item.child(0)
-            if child.text(0) == "...":
-                folder_path = item.data(0, Qt.ItemDataRole.UserRole)
-                item.removeChild(child)
-                
-                if self.panel_type == "local":
-                    self._load_local_children(item, folder_path)
-                else:
-                    self._load_remote_children(item, folder_path)
+        if self.panel_type == "local":
+            self._load_local_children(folder_path)
+        else:
+            self._load_remote_children(folder_path)
+    
+    def _expand_index(self, index: QModelIndex) -> None:
+        """Expand a folder, requesting its children right away if needed.
+        
+        Args:
+            index: Folder index
+        """
+        if self.model.canFetchMore(index):
+            self.model.fetchMore(index)
+        self.tree_view.expand(index)
     
     def _load_windows_drives(self) -> None:
         """Load Windows drives and special folders."""
-        self.tree_widget.clear()
+        self.model.clear()
         
         # My PC root node
-        my_pc_item = QTreeWidgetItem()
-        my_pc_item.setText(0, "💻 My PC")
-        my_pc_item.setData(0, Qt.ItemDataRole.UserRole, None)
-        self.tree_widget.addTopLevelItem(my_pc_item)
-        
-        # Special folders
-        home_path = Path.home()
-        
-        special_folders = [
-            ("📁 Desktop", home_path / "Desktop"),
-            ("📁 Documents", home_path / "Documents"),
-            ("📁 Downloads", home_path / "Downloads"),
-            ("📁 Pictures", home_path / "Pictures"),
-            ("📁 Music", home_path / "Music"),
-            ("📁 Videos", home_path / "Videos"),
-        ]
-        
-        for icon_name, folder_path in special_folders:
-            if folder_path.exists():
-                item = QTreeWidgetItem()
-                item.setText(0, icon_name)
-                item.setData(0, Qt.ItemDataRole.UserRole, str(folder_path))
-                
-                # Add placeholder if has subfolders
-                try:
-                    if any(p.is_dir() for p in folder_path.iterdir()):
-                        placeholder = QTreeWidgetItem()
-                        placeholder.setText(0, "...")
-                        item.addChild(placeholder)
-                except PermissionError:
-                    pass
-                
-                my_pc_item.addChild(item)
+        self.model.append_rows(QModelIndex(), [("💻 My PC", None, False)])
+        my_pc_index = self.model.index(0, 0)
+        
+        # Special folders (the OS's known folders, so relocated or
+        # localized ones are found too)
+        location = QStandardPaths.StandardLocation
+        special_folders = (
+            ("📁 Desktop", location.DesktopLocation),
+            ("📁 Documents", location.DocumentsLocation),
+            ("📁 Downloads", location.DownloadLocation),
+            ("📁 Pictures", location.PicturesLocation),
+            ("📁 Music", location.MusicLocation),
+            ("📁 Videos", location.MoviesLocation),
+        )
+        
+        rows = []
+        for icon_name, folder_location in special_folders:
+            folder_path = _standard_folder(folder_location)
+            if folder_path:
+                # Listed on first expand; the arrow goes away if it has no subfolders
+                rows.append((icon_name, folder_path, True))
         
         # Drives (C:\, D:\, ...)
-        for drive_letter in string.ascii_uppercase:
-            drive_path = Path(f"{drive_letter}:\\")
-            if drive_path.exists():
-                item = QTreeWidgetItem()
-                item.setText(0, f"💾 {drive_letter}:\\")
-                item.setData(0, Qt.ItemDataRole.UserRole, str(drive_path))
-                
-                # Placeholder
-                placeholder = QTreeWidgetItem()
-                placeholder.setText(0, "...")
-                item.addChild(placeholder)
-                
-                my_pc_item.addChild(item)
-        
-        my_pc_item.setExpanded(True)
+        for drive_letter in _drive_letters():
+            drive_path = f"{drive_letter}:\\"
+            rows.append((f"💾 {drive_path}", drive_path, True))
+        
+        # Attach all top-level folders in one batch
+        self.model.append_rows(my_pc_index, rows)
+        self.tree_view.expand(my_pc_index)
         
         # Select Documents folder by default
-        documents_path = home_path / "Documents"
-        if documents_path.exists():
-            self.folder_selected.emit(str(documents_path))
-            self.path_edit.setText(str(documents_path))
+        documents_path = _standard_folder(location.DocumentsLocation)
+        if documents_path:
+            self._emit_folder_selected(documents_path)
+            self.path_edit.setText(documents_path)
     
     def _load_local_root(self, root_path: str) -> None:
         """Load local root path (called from path input).
@@ -286,44 +770,51 @@ class FolderTreeWidget(QWidget):
         self.path_edit.setText(root_path)
         
         # Emit folder selected signal (update file list)
-        self.folder_selected.emit(root_path)
+        self._emit_folder_selected(root_path)
     
-    def _load_local_children(self, parent_item: QTreeWidgetItem, parent_path: str) -> None:
+    def _load_local_children(self, parent_path: str) -> None:
         """Load subfolders of local folder.
         
         Args:
-            parent_item: Parent tree item
             parent_path: Parent path
         """
-        try:
-            path_obj = Path(parent_path)
-            subfolders = sorted([p for p in path_obj.iterdir() if p.is_dir()], 
-                              key=lambda p: p.name.lower())
+        # Show loading indicator
+        self.model.set_loading(parent_path)
+        generation = self._list_generation(parent_path)
+        
+        def on_loaded(subfolders: list[tuple[str, str, str]]) -> None:
+            if self._list_generation(parent_path) != generation:
+                return  # Folder was invalidated meanwhile
             
-            for folder in subfolders:
-                # Exclude hidden folders (optional)
-                if folder.name.startswith("."):
-                    continue
-                
-                item = QTreeWidgetItem()
-                item.setText(0, f"📁 {folder.name}")
-                item.setData(0, Qt.ItemDataRole.UserRole, str(folder))
-                
-                # Check for subfolders (add placeholder)
-                try:
-                    if any(p.is_dir() for p in folder.iterdir()):
-                        placeholder = QTreeWidgetItem()
-                        placeholder.setText(0, "...")
-                        item.addChild(placeholder)
-                except PermissionError:
-                    pass
-                
-                parent_item.addChild(item)
-                
-        except PermissionError:
-            error_item = QTreeWidgetItem()
-            error_item.setText(0, "⚠ Permission denied")
-            parent_item.addChild(error_item)
+            # Every folder is expandable; an empty one just ends up without rows
+            self.model.set_children(
+                parent_path,
+                [(f"📁 {name}", path, True) for _, name, path in subfolders],
+            )
+            
+            # Resume a path expansion that was waiting for this level
+            pending = self._pending_expand
+            if pending is not None and self._is_under(pending, parent_path):
+                self._expand_local_path(pending)
+        
+        def on_error(error_msg: str) -> None:
+            if self._list_generation(parent_path) != generation:
+                return  # Folder was invalidated meanwhile
+            
+            self.model.set_message(parent_path, f"⚠ {error_msg}")
+            
+            # A path expansion waiting for this level stops here
+            pending = self._pending_expand
+            if pending is not None and self._is_under(pending, parent_path):
+                self._pending_expand = None
+        
+        # Asynchronous scan on the shared thread pool
+        signals = _LocalFolderListSignals(self)
+        signals.finished.connect(on_loaded)
+        signals.error_occurred.connect(on_error)
+        signals.finished.connect(signals.deleteLater)
+        signals.error_occurred.connect(signals.deleteLater)
+        QThreadPool.globalInstance().start(_LocalFolderListRunnable(parent_path, signals))
     
     def _load_remote_root(self, root_path: str) -> None:
         """Load remote root path.
@@ -334,64 +825,75 @@ class FolderTreeWidget(QWidget):
         if not self.current_device:
             return
         
-        self.tree_widget.clear()
+        self.model.clear()
         self.path_edit.setText(root_path)
         
-        root_item = QTreeWidgetItem()
-        root_item.setText(0, f"📁 {root_path}")
-        root_item.setData(0, Qt.ItemDataRole.UserRole, root_path)
+        self.model.append_rows(QModelIndex(), [(f"📁 {root_path}", root_path, True)])
+        self._expand_index(self.model.index(0, 0))
         
-        self.tree_widget.addTopLevelItem(root_item)
-        self._load_remote_children(root_item, root_path)
-        root_item.setExpanded(True)
-        
-        self.folder_selected.emit(root_path)
+        self._emit_folder_selected(root_path)
     
-    def _load_remote_children(
-        self,
-        parent_item: QTreeWidgetItem,
-        parent_path: str,
-    ) -> None:
+    def _load_remote_children(self, parent_path: str) -> None:
         """Load subfolders of remote folder.
         
         Args:
-            parent_item: Parent tree item
             parent_path: Parent path
         """
         if not self.current_device:
             return
         
+        # Fill from a fresh cached listing without going to the device
+        cache_key = (self.current_device.serial, parent_path)
+        cached = self._remote_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _REMOTE_CACHE_TTL:
+            self.model.set_children(parent_path, self._remote_folder_rows(cached[1]))
+            return
+        
         # Show loading indicator
-        loading_item = QTreeWidgetItem()
-        loading_item.setText(0, tr("Loading..."))
-        parent_item.addChild(loading_item)
+        self.model.set_loading(parent_path)
+        generation = self._list_generation(parent_path)
+        
+        # Asynchronous load on the shared thread pool
+        runnable = FileListRunnable(self.current_device.serial, parent_path, self)
         
-        # Asynchronous load with worker
-        thread = QThread()
-        worker = FileListWorker()
-        worker.moveToThread(thread)
+        def on_batch(files: list[RemoteFileInfo]) -> None:
+            if self._list_generation(parent_path) != generation:
+                return  # Folder was invalidated meanwhile
+            
+            # Show a large folder's first subfolders below the loading
+            # indicator; on_loaded replaces them with the sorted listing
+            index = self.model.index_for_key(self._path_key(parent_path))
+            if index.isValid():
+                self.model.append_rows(
+                    index, self._remote_folder_rows(_RemoteFolders.from_files(files))
+                )
         
         def on_loaded(files: list[RemoteFileInfo]) -> None:
-            parent_item.removeChild(loading_item)
+            if self._list_generation(parent_path) != generation:
+                return  # Folder was invalidated meanwhile
+            
+            folders = _RemoteFolders.from_files(files)
+            self._store_remote_listing(cache_key, folders)
+            self.model.set_children(parent_path, self._remote_folder_rows(folders))
+            self._prefetch_remote_children(folders)
             
-            folders = [f for f in files if f.is_dir]
-            for folder in folders:
-                item = QTreeWidgetItem()
-                item.setText(0, f"📁 {folder.name}")
-                item.setData(0, Qt.ItemDataRole.UserRole, folder.path)
-                
-                # Add placeholder
-                placeholder = QTreeWidgetItem()
-                placeholder.setText(0, "...")
-                item.addChild(placeholder)
-                
-                parent_item.addChild(item)
+            # Resume a path expansion that was waiting for this level
+            pending = self._pending_expand
+            if pending is not None and self._is_under(pending, parent_path):
+                self._expand_remote_path(pending)
         
         def on_error(error_msg: str) -> None:
-            parent_item.removeChild(loading_item)
+            if self._list_generation(parent_path) != generation:
+                return  # Folder was invalidated meanwhile
+            
+            # A path expansion waiting for this level cannot continue
+            pending = self._pending_expand
+            if pending is not None and self._is_under(pending, parent_path):
+                self._pending_expand = None
             
             # Show error popup + restore previous path if moved from path input
             if hasattr(self, "_previous_path") and self._previous_path:
+                self.model.set_children(parent_path, [])
                 QMessageBox.warning(
                     self,
                     tr("Path error"),
@@ -402,24 +904,167 @@ class FolderTreeWidget(QWidget):
                 self._previous_path = ""
             else:
                 # Show error in tree if occurred during tree expansion
-                error_item = QTreeWidgetItem()
-                error_item.setText(0, f"⚠ {error_msg}")
-                parent_item.addChild(error_item)
+                self.model.set_message(parent_path, f"⚠ {error_msg}")
+        
+        runnable.worker.files_batch.connect(on_batch)
+        runnable.worker.files_loaded.connect(on_loaded)
+        runnable.worker.error_occurred.connect(on_error)
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _prefetch_remote_children(self, folders: _RemoteFolders) -> None:
+        """List the first subfolders of a loaded folder ahead into the cache.
+        
+        All of them are listed with a single adb call, which hides the adb
+        round trip when one of them is expanded next.
+        
+        Args:
+            folders: Subfolders that were just listed
+        """
+        if not self.current_device:
+            return
         
-        def cleanup_thread():
-            print("[DEBUG] folder_tree thread cleanup in progress...")
-            thread.quit()
-            thread.wait(1000)
-            print("[DEBUG] folder_tree thread cleanup completed")
+        serial = self.current_device.serial
+        now = time.monotonic()
+        paths = []
+        for path in folders.paths[:_PREFETCH_COUNT]:
+            cache_key = (serial, path)
+            cached = self._remote_cache.get(cache_key)
+            if cache_key in self._prefetching or (
+                cached is not None and now - cached[0] < _REMOTE_CACHE_TTL
+            ):
+                continue
+            paths.append(path)
+        
+        if not paths:
+            return
         
-        worker.files_loaded.connect(on_loaded)
-        worker.error_occurred.connect(on_error)
-        worker.files_loaded.connect(cleanup_thread)
-        worker.error_occurred.connect(cleanup_thread)
+        keys = [(serial, path) for path in paths]
+        self._prefetching.update(keys)
+        runnable = FileListBatchRunnable(serial, paths, self)
+        runnable.worker.batch_loaded.connect(
+            lambda listings: self._on_remote_prefetched(serial, keys, listings)
+        )
+        runnable.worker.error_occurred.connect(
+            lambda _error_msg: self._prefetching.difference_update(keys)
+        )
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_remote_prefetched(
+        self,
+        serial: str,
+        keys: list[tuple[str, str]],
+        listings: dict[str, list[RemoteFileInfo]],
+    ) -> None:
+        """Store listings fetched ahead (not attached to the tree).
         
-        device_serial = self.current_device.serial
-        thread.started.connect(lambda: worker.list_files(device_serial, parent_path))
-        thread.start()
+        Args:
+            serial: Device serial number
+            keys: Cache keys that were requested
+            listings: Directory path -> listing (unreadable directories missing)
+        """
+        self._prefetching.difference_update(keys)
+        for path, files in listings.items():
+            self._store_remote_listing((serial, path), _RemoteFolders.from_files(files))
+    
+    def _remote_folder_rows(self, folders: _RemoteFolders) -> list[TreeRow]:
+        """Build tree rows for remote subfolders.
+        
+        Args:
+            folders: Subfolders
+        
+        Returns:
+            Expandable folder rows
+        """
+        return [(f"📁 {name}", path, True) for name, path in zip(folders.names, folders.paths)]
+    
+    def _path_key(self, path: str) -> tuple[str, ...]:
+        """Get the index key of a path for this panel.
+        
+        Args:
+            path: Local or remote folder path
+        
+        Returns:
+            Normalized path parts
+        """
+        if self.panel_type == "local":
+            return _path_parts(path)
+        return PurePosixPath(path).parts
+    
+    def _list_generation(self, path: str) -> int:
+        """Get the listing generation of a folder (see invalidate_path).
+        
+        Args:
+            path: Folder path
+        
+        Returns:
+            Number of times the folder was invalidated
+        """
+        return self._list_generations.get(self._path_key(path), 0)
+    
+    def _is_under(self, path: str, folder_path: str) -> bool:
+        """Check whether a path is a folder or lies below it.
+        
+        Args:
+            path: Path to check
+            folder_path: Folder path
+        
+        Returns:
+            True if path is folder_path or one of its descendants
+        """
+        folder_key = self._path_key(folder_path)
+        return self._path_key(path)[:len(folder_key)] == folder_key
+    
+    def _deepest_loaded_index(
+        self,
+        target_key: tuple[str, ...],
+    ) -> tuple[QModelIndex, int]:
+        """Find the loaded folder closest to a target path and expand its ancestors.
+        
+        Args:
+            target_key: Lookup key of the target path
+        
+        Returns:
+            (index, length of its key), or (invalid index, 0) if no ancestor is loaded
+        """
+        depth = len(target_key)
+        while depth:
+            index = self.model.index_for_key(target_key[:depth])
+            if index.isValid():
+                break
+            depth -= 1
+        else:
+            return QModelIndex(), 0
+        
+        # Expand the ancestor chain top-down with one repaint at the end.
+        # expandRecursively() would also open (and list) every sibling folder.
+        ancestors = []
+        parent = index.parent()
+        while parent.isValid():
+            ancestors.append(parent)
+            parent = parent.parent()
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            for ancestor in reversed(ancestors):
+                self.tree_view.expand(ancestor)
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
+        return index, depth
+    
+    def _store_remote_listing(
+        self,
+        cache_key: tuple[str, str],
+        folders: _RemoteFolders,
+    ) -> None:
+        """Store a remote listing in the cache, evicting the oldest entry when full.
+        
+        Args:
+            cache_key: (device serial, path)
+            folders: Subfolders of the path
+        """
+        self._remote_cache.pop(cache_key, None)
+        if len(self._remote_cache) >= _REMOTE_CACHE_SIZE:
+            del self._remote_cache[next(iter(self._remote_cache))]
+        self._remote_cache[cache_key] = (time.monotonic(), folders)
     
     def _drag_enter_event(self, event) -> None:
         """Drag enter event handler.
@@ -427,19 +1072,18 @@ class FolderTreeWidget(QWidget):
         Args:
             event: QDragEnterEvent
         """
-        print(f"[DEBUG] folder_tree._drag_enter_event: panel_type={self.panel_type}")
-        print(f"[DEBUG] MIME formats: {event.mimeData().formats()}")
-        
-        if event.mimeData().hasFormat("application/x-adbcopy-files"):
-            print("[DEBUG] application/x-adbcopy-files format detected - accept")
-            event.setDropAction(Qt.DropAction.CopyAction)
-            event.accept()
-        elif event.mimeData().hasText():
-            print("[DEBUG] text format detected - accept")
+        mime_data = event.mimeData()
+        if logger.isEnabledFor(logging.DEBUG):
+            # formats() builds a string list; only pay for it when logging
+            logger.debug("folder_tree._drag_enter_event: panel_type=%s", self.panel_type)
+            logger.debug("MIME formats: %s", mime_data.formats())
+        
+        if _accepts_mime(mime_data):
+            logger.debug("supported format - accept")
             event.setDropAction(Qt.DropAction.CopyAction)
             event.accept()
         else:
-            print("[DEBUG] unsupported format - ignore")
+            logger.debug("unsupported format - ignore")
     
     def _drag_move_event(self, event) -> None:
         """Drag move event handler.
@@ -447,15 +1091,20 @@ class FolderTreeWidget(QWidget):
         Args:
             event: QDragMoveEvent
         """
-        print(f"[DEBUG] folder_tree._drag_move_event: panel_type={self.panel_type}")
+        # Fires continuously while dragging; skip log formatting unless enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("folder_tree._drag_move_event: panel_type=%s", self.panel_type)
         
         # Same logic as dragEnterEvent
-        if event.mimeData().hasFormat("application/x-adbcopy-files") or event.mimeData().hasText():
-            print("[DEBUG] dragMove accept")
+        if _accepts_mime(event.mimeData()):
+            if debug:
+                logger.debug("dragMove accept")
             event.setDropAction(Qt.DropAction.CopyAction)
             event.accept()
         else:
-            print("[DEBUG] dragMove ignore")
+            if debug:
+                logger.debug("dragMove ignore")
             event.ignore()
     
     def _drop_event(self, event) -> None:
@@ -464,18 +1113,33 @@ class FolderTreeWidget(QWidget):
         Args:
             event: QDropEvent
         """
-        print(f"[DEBUG] folder_tree._drop_event: panel_type={self.panel_type}")
+        logger.debug("folder_tree._drop_event: panel_type=%s", self.panel_type)
         
-        if event.mimeData().hasFormat("application/x-adbcopy-files") or event.mimeData().hasText():
-            print("[DEBUG] Drop allowed")
-            event.setDropAction(Qt.DropAction.CopyAction)
-            event.accept()
-            # Use folder path at drop location as destination
-            # File info is managed in main_window
-            self.files_dropped.emit([])
-            print("[DEBUG] files_dropped signal emitted")
-        else:
-            print("[DEBUG] Drop rejected")
+        # Nothing to transfer without our file format or some dropped text
+        mime_data = event.mimeData()
+        has_files = mime_data.hasFormat("application/x-adbcopy-files")
+        if not has_files and not (mime_data.hasText() and mime_data.text().strip()):
+            logger.debug("Drop rejected")
+            return
+        
+        logger.debug("Drop allowed")
+        event.setDropAction(Qt.DropAction.CopyAction)
+        event.accept()
+        # Dropped files change remote folders; drop cached listings
+        self._remote_cache.clear()
+        # Use folder path at drop location as destination
+        # File info is managed in main_window
+        self.files_dropped.emit([])
+        logger.debug("files_dropped signal emitted")
+
+    def _emit_folder_selected(self, path: str) -> None:
+        """Record a folder as the current one and emit folder_selected.
+        
+        Args:
+            path: Selected folder path
+        """
+        self._last_emitted_path = path
+        self.folder_selected.emit(path)
     
     def _add_to_history(self, path: str) -> None:
         """Add path to navigation history.
@@ -489,8 +1153,8 @@ class FolderTreeWidget(QWidget):
                 return
         
         # Remove forward history when navigating to new path
-        if self._history_index < len(self._history_stack) - 1:
-            self._history_stack = self._history_stack[:self._history_index + 1]
+        while len(self._history_stack) > self._history_index + 1:
+            self._history_stack.pop()
         
         # Add new path
         self._history_stack.append(path)
@@ -505,7 +1169,8 @@ class FolderTreeWidget(QWidget):
             self._history_index -= 1
             path = self._history_stack[self._history_index]
             self.path_edit.setText(path)
-            self.folder_selected.emit(path)
+            if path != self._last_emitted_path:
+                self._emit_folder_selected(path)
             self._update_navigation_buttons()
     
     def _on_forward_clicked(self) -> None:
@@ -514,7 +1179,8 @@ class FolderTreeWidget(QWidget):
             self._history_index += 1
             path = self._history_stack[self._history_index]
             self.path_edit.setText(path)
-            self.folder_selected.emit(path)
+            if path != self._last_emitted_path:
+                self._emit_folder_selected(path)
             self._update_navigation_buttons()
     
     def _update_navigation_buttons(self) -> None:
@@ -522,12 +1188,42 @@ class FolderTreeWidget(QWidget):
         self.back_button.setEnabled(self._history_index > 0)
         self.forward_button.setEnabled(self._history_index < len(self._history_stack) - 1)
     
+    def invalidate_path(self, path: str) -> None:
+        """Re-list a folder whose contents changed (e.g. after a transfer).
+        
+        Cached and in-flight listings of the folder are discarded. An expanded
+        folder is listed again right away, a collapsed one on its next expand.
+        
+        Args:
+            path: Folder path
+        """
+        key = self._path_key(path)
+        self._list_generations[key] = self._list_generations.get(key, 0) + 1
+        
+        if self.current_device:
+            self._remote_cache.pop((self.current_device.serial, path), None)
+        
+        index = self.model.index_for_key(key)
+        if not index.isValid():
+            return
+        
+        folder_path = index.data(_PATH_ROLE)
+        if self.current_device:
+            self._remote_cache.pop((self.current_device.serial, folder_path), None)
+        
+        expanded = self.tree_view.isExpanded(index)
+        self.model.reset_children(folder_path)
+        if expanded:
+            self._expand_index(index)
+    
     def expand_and_select_path(self, path: str) -> None:
         """Expand tree to show and select the given path.
         
         Args:
             path: Path to expand and select
         """
+        # Callers show this folder themselves (e.g. double-click in the file list)
+        self._last_emitted_path = path
         if self.panel_type == "local":
             self._expand_local_path(path)
         else:
@@ -539,110 +1235,13 @@ class FolderTreeWidget(QWidget):
         Args:
             path: Local path to expand to
         """
-        from PyQt6.QtWidgets import QApplication
-        import time
-        
-        print(f"[DEBUG] _expand_local_path called: {path}")
+        logger.debug("_expand_local_path called: %s", path)
         
         # Update path input
         self.path_edit.setText(path)
         
-        # Normalize path for comparison
-        target_path = str(Path(path))
-        
-        # Recursively find and expand item
-        def find_and_expand_local(parent_item: QTreeWidgetItem, target_path: str) -> QTreeWidgetItem | None:
-            """Recursively find item and expand parents in local tree."""
-            # Get stored path from UserRole
-            item_path = parent_item.data(0, Qt.ItemDataRole.UserRole)
-            
-            # Skip virtual nodes (like "My PC") with no path
-            if item_path is None:
-                # Search in children for virtual nodes
-                for i in range(parent_item.childCount()):
-                    child = parent_item.child(i)
-                    result = find_and_expand_local(child, target_path)
-                    if result:
-                        return result
-                return None
-            
-            # Normalize for comparison
-            item_path_normalized = str(Path(item_path))
-            
-            print(f"[DEBUG] Checking local item: text='{parent_item.text(0)}', path='{item_path_normalized}'")
-            
-            # Exact match
-            if item_path_normalized == target_path:
-                print(f"[DEBUG] Found exact match!")
-                return parent_item
-            
-            # Check if target is under this path
-            try:
-                # Use Path to check if target is relative to item_path
-                target_path_obj = Path(target_path)
-                item_path_obj = Path(item_path_normalized)
-                
-                # Check if target is under this item
-                if target_path_obj == item_path_obj or item_path_obj in target_path_obj.parents:
-                    print(f"[DEBUG] Target is under this item, expanding...")
-                    
-                    # Expand if collapsed
-                    if not parent_item.isExpanded():
-                        # Check for placeholder
-                        if parent_item.childCount() == 1 and parent_item.child(0).text(0) == "...":
-                            print(f"[DEBUG] Has placeholder, expanding to trigger load...")
-                            self.tree_widget.expandItem(parent_item)
-                            # Wait for lazy load
-                            for _ in range(10):
-                                QApplication.processEvents()
-                                time.sleep(0.05)
-                                if parent_item.childCount() > 1:
-                                    break
-                        else:
-                            parent_item.setExpanded(True)
-                    
-                    # Search in children
-                    for i in range(parent_item.childCount()):
-                        child = parent_item.child(i)
-                        if child.text(0) == "...":
-                            continue
-                        result = find_and_expand_local(child, target_path)
-                        if result:
-                            return result
-                    
-                    # If no child matched, this is as close as we can get
-                    return parent_item
-                    
-            except Exception as e:
-                print(f"[DEBUG] Error checking path relationship: {e}")
-            
-            return None
-        
-        # Start search from root (My PC)
-        if self.tree_widget.topLevelItemCount() > 0:
-            root_item = self.tree_widget.topLevelItem(0)
-            result = find_and_expand_local(root_item, target_path)
-            
-            if result:
-                # Expand final item if it has children
-                if not result.isExpanded() and result.childCount() > 0:
-                    if result.childCount() == 1 and result.child(0).text(0) == "...":
-                        self.tree_widget.expandItem(result)
-                        # Wait a bit for load
-                        for _ in range(5):
-                            QApplication.processEvents()
-                            time.sleep(0.05)
-                            if result.childCount() > 1:
-                                break
-                    else:
-                        result.setExpanded(True)
-                
-                # Select and scroll to item
-                self.tree_widget.setCurrentItem(result)
-                self.tree_widget.scrollToItem(result)
-                print(f"[DEBUG] Selected and scrolled to: {result.text(0)}")
-            else:
-                print(f"[DEBUG] Path not found in tree: {path}")
+        # Missing folders still reveal their deepest existing ancestor
+        self._expand_to_path(path, closest=True)
     
     def _expand_remote_path(self, path: str) -> None:
         """Expand remote tree to show path.
@@ -653,80 +1252,59 @@ class FolderTreeWidget(QWidget):
         if not self.current_device or not path:
             return
         
-        print(f"[DEBUG] _expand_remote_path called: {path}")
+        logger.debug("_expand_remote_path called: %s", path)
         
-        # Recursively find and expand item
-        def find_and_expand(parent_item: QTreeWidgetItem, target_path: str) -> QTreeWidgetItem | None:
-            """Recursively find item and expand parents."""
-            # Check if this item matches
-            item_path = parent_item.data(0, Qt.ItemDataRole.UserRole)
-            
-            # Skip items without path (like "Loading...")
-            if item_path is None:
-                return None
-            
-            print(f"[DEBUG] Checking item: text='{parent_item.text(0)}', path='{item_path}', target='{target_path}'")
-            
-            if item_path == target_path:
-                print(f"[DEBUG] Found exact match!")
-                return parent_item
-            
-            # Expand this item if target path is under it
-            if target_path.startswith(item_path.rstrip('/') + '/'):
-                print(f"[DEBUG] Target is under this item, expanding...")
-                
-                # Expand if collapsed
-                if not parent_item.isExpanded():
-                    # Check for placeholder
-                    if parent_item.childCount() == 1 and parent_item.child(0).text(0) == "...":
-                        print(f"[DEBUG] Has placeholder, expanding to trigger load...")
-                        self.tree_widget.expandItem(parent_item)
-                        # Wait for lazy load (async operation needs time)
-                        from PyQt6.QtWidgets import QApplication
-                        import time
-                        for _ in range(10):  # Wait up to 1 second
-                            QApplication.processEvents()
-                            time.sleep(0.1)
-                            # Check if loading is done
-                            if parent_item.childCount() > 1 or (parent_item.childCount() == 1 and parent_item.child(0).text(0) != "Loading..."):
-                                break
-                        print(f"[DEBUG] After expansion, child count: {parent_item.childCount()}")
-                    else:
-                        parent_item.setExpanded(True)
-                
-                # Search in children (skip "Loading..." items)
-                for i in range(parent_item.childCount()):
-                    child = parent_item.child(i)
-                    # Skip loading/placeholder items
-                    if child.text(0) in ("...", "Loading..."):
-                        continue
-                    result = find_and_expand(child, target_path)
-                    if result:
-                        return result
-            
-            return None
+        if not self._expand_to_path(path, closest=False):
+            self.path_edit.setText(path)
+    
+    def _expand_to_path(self, path: str, closest: bool) -> bool:
+        """Expand the tree down to a path and select it.
         
-        # Start search from root
-        if self.tree_widget.topLevelItemCount() > 0:
-            root_item = self.tree_widget.topLevelItem(0)
-            result = find_and_expand(root_item, path)
+        Levels that are not loaded yet are expanded one at a time. When a
+        level is still being listed, the path is kept in _pending_expand and
+        the walk resumes from the listing callback.
+        
+        Args:
+            path: Local or remote folder path
+            closest: Select the deepest loaded ancestor if the path itself is missing
+        
+        Returns:
+            False if nothing could be selected, True otherwise (including while waiting)
+        """
+        # A new expansion replaces one still waiting for a listing
+        self._pending_expand = None
+        
+        # Start from the deepest folder already in the tree
+        target_key = self._path_key(path)
+        result, depth = self._deepest_loaded_index(target_key)
+        
+        # Load the missing levels one at a time
+        while result.isValid() and depth < len(target_key):
+            logger.debug("Target is under '%s', expanding...", result.data())
+            # Children come from the cache right away or from a pool thread later
+            self._expand_index(result)
             
-            if result:
-                # Expand final item if it has children
-                if not result.isExpanded() and result.childCount() > 0:
-                    if result.childCount() == 1 and result.child(0).text(0) == "...":
-                        self.tree_widget.expandItem(result)
-                    else:
-                        result.setExpanded(True)
-                
-                # Select and scroll
-                self.tree_widget.setCurrentItem(result)
-                self.tree_widget.scrollToItem(result)
-                print(f"[DEBUG] Selected and scrolled to: {result.text(0)}")
-            else:
-                print(f"[DEBUG] Path not found in tree: {path}")
-                self.path_edit.setText(path)
-        else:
-            print(f"[DEBUG] No top-level items in tree")
-            self.path_edit.setText(path)
-
+            child = self.model.index_for_key(target_key[:depth + 1])
+            if not child.isValid() and self.model.is_loading(result):
+                # Resumed from on_loaded once this level arrives
+                self._pending_expand = path
+                logger.debug("Waiting for '%s' to load", result.data())
+                return True
+            if not child.isValid() and closest:
+                # No child matched, this is as close as we can get
+                break
+            result, depth = child, depth + 1
+        
+        if not result.isValid():
+            logger.debug("Path not found in tree: %s", path)
+            return False
+        
+        # Expand final item if it has children
+        if not self.tree_view.isExpanded(result) and self.model.hasChildren(result):
+            self._expand_index(result)
+        
+        # Select and scroll to item
+        self.tree_view.setCurrentIndex(result)
+        self.tree_view.scrollTo(result)
+        logger.debug("Selected and scrolled to: %s", result.data())
+        return True
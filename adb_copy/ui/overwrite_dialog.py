@@ -16,6 +16,8 @@ from PyQt6.QtWidgets import (
 
 from adb_copy.i18n import tr
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 
 class OverwriteDialog(QDialog):
     """File overwrite dialog class.
@@ -120,13 +122,10 @@ class OverwriteDialog(QDialog):
         Returns:
             Formatted size string
         """
-        if size == 0:
+        if size <= 0:
             return "Unknown"
         
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        
-        return f"{size:.1f} PB"
+        # Unit index straight from the bit length (each unit is 2**10 larger)
+        unit_index = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
 
@@ -3,14 +3,18 @@
 Displays and manages ongoing file transfer tasks.
 """
 
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+import logging
+
+from PyQt6.QtCore import QAbstractTableModel, QElapsedTimer, QModelIndex, Qt, pyqtSignal, QTimer
+from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QHBoxLayout,
     QHeaderView,
     QLabel,
+    QMenu,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QProgressBar,
@@ -18,6 +22,313 @@ from PyQt6.QtWidgets import (
 
 from adb_copy.i18n import tr
 
+logger = logging.getLogger(__name__)
+
+
+# Transfer states (index into _STATUS_LABELS)
+WAITING = 0
+TRANSFERRING = 1
+COMPLETED = 2
+FAILED = 3
+_STATUS_LABELS = ("⏳ Waiting", "⚡ Transferring", "✓ Completed", "✗ Failed")
+
+# Item data roles as plain ints (data() runs for every visible cell on each repaint)
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+_ALIGNMENT_ROLE = int(Qt.ItemDataRole.TextAlignmentRole)
+_TIME_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_TIME_COLUMN = 4
+
+# Delay (ms) over which stats updates requested by queue changes are merged
+_STATS_DELAY_MS = 150
+
+# Delay (ms) over which auto-scroll requests from progress updates are merged
+_SCROLL_DELAY_MS = 250
+
+
+def _format_hms(seconds: float) -> str:
+    """Format a duration as HH:MM:SS.
+    
+    Args:
+        seconds: Duration in seconds
+    
+    Returns:
+        Formatted duration
+    """
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+class TransferQueueModel(QAbstractTableModel):
+    """Table model holding the transfer queue rows.
+    
+    Rows are stored as parallel lists (one per field) and looked up by task
+    ID through a dict. Per-state counts and the size of completed transfers
+    are kept up to date on every state change, so statistics never scan the
+    rows.
+    """
+    
+    def __init__(self, parent=None) -> None:
+        """Initialize TransferQueueModel instance.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._task_ids: list[int] = []
+        self._statuses: list[int] = []
+        self._names: list[str] = []
+        self._sources: list[str] = []
+        self._dests: list[str] = []
+        self._times: list[float | None] = []  # Transfer time (seconds) once completed
+        self._sizes: list[int] = []
+        self._id_to_row: dict[int, int] = {}
+        self._percents: dict[int, int] = {}  # task_id: progress (%) of transferring rows
+        
+        self._status_counts = [0, 0, 0, 0]
+        self._completed_bytes = 0
+        self._headers = [
+            tr("Status"),
+            tr("Filename"),
+            tr("Source"),
+            tr("Destination"),
+            tr("Time(sec)"),
+        ]
+        # Cell texts translated once (a language change takes effect on restart)
+        self._status_texts = [tr(label) for label in _STATUS_LABELS]
+        self._failed_text = tr("Failed")
+    
+    @property
+    def status_counts(self) -> list[int]:
+        """Number of rows per state (indexed by WAITING..FAILED)."""
+        return self._status_counts
+    
+    @property
+    def completed_bytes(self) -> int:
+        """Total size of completed transfers."""
+        return self._completed_bytes
+    
+    def row_of(self, task_id: int) -> int:
+        """Find row index by task_id.
+        
+        Args:
+            task_id: Task ID
+        
+        Returns:
+            Row index. Returns -1 if not found
+        """
+        return self._id_to_row.get(task_id, -1)
+    
+    def status(self, row: int) -> int:
+        """Get the state of a row.
+        
+        Args:
+            row: Row index
+        
+        Returns:
+            WAITING, TRANSFERRING, COMPLETED or FAILED
+        """
+        return self._statuses[row]
+    
+    def add_rows(self, rows: list[tuple[int, str, str, str, int]]) -> None:
+        """Append waiting transfers in one insertion.
+        
+        Args:
+            rows: (task_id, filename, source, destination, file_size) per transfer
+        """
+        if not rows:
+            return
+        first = len(self._task_ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for row, (task_id, filename, source, destination, file_size) in enumerate(rows, first):
+            self._id_to_row[task_id] = row
+            self._task_ids.append(task_id)
+            self._statuses.append(WAITING)
+            self._names.append(filename)
+            self._sources.append(source)
+            self._dests.append(destination)
+            self._times.append(None)
+            self._sizes.append(file_size)
+        self._status_counts[WAITING] += len(rows)
+        self.endInsertRows()
+    
+    def set_status(self, row: int, status: int, elapsed: float | None = None) -> None:
+        """Change the state of a row.
+        
+        Args:
+            row: Row index
+            status: New state
+            elapsed: Transfer time (seconds) for COMPLETED, None to keep the current one
+        """
+        self._account(row, -1)
+        self._statuses[row] = status
+        if elapsed is not None:
+            self._times[row] = elapsed
+        if status != TRANSFERRING:
+            self._percents.pop(self._task_ids[row], None)
+        self._account(row, 1)
+        self.dataChanged.emit(
+            self.index(row, 0),
+            self.index(row, _TIME_COLUMN),
+            [Qt.ItemDataRole.DisplayRole],
+        )
+    
+    def set_progress(self, row: int, percent: int) -> None:
+        """Show the progress of a transferring row in its status cell.
+        
+        Args:
+            row: Row index
+            percent: Progress (%)
+        """
+        self._percents[self._task_ids[row]] = percent
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+    
+    def remove_status(self, status: int) -> list[tuple[str, str, str]]:
+        """Remove all rows in a state.
+        
+        Args:
+            status: State to remove
+        
+        Returns:
+            (filename, source, destination) of the removed rows
+        """
+        keep = [row for row, s in enumerate(self._statuses) if s != status]
+        if len(keep) == len(self._statuses):
+            return []
+        
+        removed = [
+            (self._names[row], self._sources[row], self._dests[row])
+            for row, s in enumerate(self._statuses) if s == status
+        ]
+        for row, s in enumerate(self._statuses):
+            if s == status:
+                self._account(row, -1)
+        
+        self.beginResetModel()
+        self._reorder(keep)
+        self.endResetModel()
+        return removed
+    
+    def _account(self, row: int, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a row's share of the statistics.
+        
+        Args:
+            row: Row index
+            sign: 1 or -1
+        """
+        status = self._statuses[row]
+        self._status_counts[status] += sign
+        if status == COMPLETED:
+            self._completed_bytes += sign * self._sizes[row]
+    
+    def _reorder(self, order: list[int]) -> None:
+        """Rearrange (and drop) rows.
+        
+        Args:
+            order: Old row index for each new row
+        """
+        self._task_ids = [self._task_ids[row] for row in order]
+        self._statuses = [self._statuses[row] for row in order]
+        self._names = [self._names[row] for row in order]
+        self._sources = [self._sources[row] for row in order]
+        self._dests = [self._dests[row] for row in order]
+        self._times = [self._times[row] for row in order]
+        self._sizes = [self._sizes[row] for row in order]
+        self._id_to_row = {task_id: row for row, task_id in enumerate(self._task_ids)}
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get row count."""
+        return 0 if parent.isValid() else len(self._task_ids)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get column count."""
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Get cell data."""
+        role = int(role)
+        if role == _DISPLAY_ROLE:
+            row = index.row()
+            column = index.column()
+            if column == 0:
+                status = self._statuses[row]
+                if status == TRANSFERRING:
+                    percent = self._percents.get(self._task_ids[row])
+                    if percent is not None:
+                        return f"{self._status_texts[status]} {percent}%"
+                return self._status_texts[status]
+            if column == 1:
+                return self._names[row]
+            if column == 2:
+                return self._sources[row]
+            if column == 3:
+                return self._dests[row]
+            if self._statuses[row] == FAILED:
+                return self._failed_text
+            elapsed = self._times[row]
+            return "-" if elapsed is None else f"{elapsed:.1f}"
+        if role == _ALIGNMENT_ROLE and index.column() == _TIME_COLUMN:
+            return _TIME_ALIGNMENT
+        return None
+    
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        """Get header label."""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sort rows by a column (on raw values, stable).
+        
+        Args:
+            column: Column to sort by (-1 leaves the order unchanged)
+            order: Sort order
+        """
+        if column < 0:
+            return
+        
+        if column == 0:
+            values = self._statuses
+        elif column == 1:
+            values = [name.casefold() for name in self._names]
+        elif column == 2:
+            values = self._sources
+        elif column == 3:
+            values = self._dests
+        else:
+            values = [-1.0 if elapsed is None else elapsed for elapsed in self._times]
+        
+        order_rows = sorted(
+            range(len(values)),
+            key=values.__getitem__,
+            reverse=order == Qt.SortOrder.DescendingOrder,
+        )
+        self.layoutAboutToBeChanged.emit()
+        
+        # Remember which task each persistent index (selection, current) points to
+        old_indexes = self.persistentIndexList()
+        old_task_ids = [self._task_ids[index.row()] for index in old_indexes]
+        
+        self._reorder(order_rows)
+        
+        # Move persistent indexes along with their tasks
+        if old_indexes:
+            self.changePersistentIndexList(
+                old_indexes,
+                [
+                    self.index(self._id_to_row[task_id], index.column())
+                    for task_id, index in zip(old_task_ids, old_indexes)
+                ],
+            )
+        
+        self.layoutChanged.emit()
+
 
 class TransferQueueWidget(QWidget):
     """Transfer queue widget class.
@@ -38,13 +349,34 @@ class TransferQueueWidget(QWidget):
         """Initialize TransferQueueWidget instance."""
         super().__init__()
         self._paused = False
-        self._task_start_times = {}  # task_id: start_time (seconds)
+        # Monotonic clock for task times (immune to system clock changes)
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._task_start_ms = {}  # task_id: start time (self._clock milliseconds)
+        # Time with at least one transfer running (transfers run in parallel,
+        # so per-task times would add up to more than the real time)
+        self._busy_ms = 0
+        self._busy_since: int | None = None  # self._clock time the current busy period began
+        self._batch_depth = 0  # Nesting level of begin_batch()/end_batch()
         self._init_ui()
         
-        # Timer for real-time stats update (every 1 second)
+        # Timer for real-time stats update (every 1 second, refreshes in-progress time)
         self._update_timer = QTimer(self)
         self._update_timer.timeout.connect(self._update_status_stats)
         self._update_timer.start(1000)  # Update every 1 second
+        
+        # Coalesces stats updates requested by queue changes into one run
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.setInterval(_STATS_DELAY_MS)
+        self._stats_timer.timeout.connect(self._update_status_stats)
+        
+        # Auto-scroll to the transferring task, at most once per _SCROLL_DELAY_MS
+        self._scroll_task_id: int | None = None
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(_SCROLL_DELAY_MS)
+        self._scroll_timer.timeout.connect(self._scroll_to_current)
     
     def _init_ui(self) -> None:
         """Initialize UI."""
@@ -87,7 +419,10 @@ class TransferQueueWidget(QWidget):
         info_layout.addSpacing(20)
         
         # Right: Task statistics
-        self.status_label = QLabel(f"{tr('Waiting')}: 0 | {tr('In Progress')}: 0 | {tr('Completed')}: 0 | {tr('Failed')}: 0")
+        self.status_label = QLabel(
+            f"{tr('Waiting')}: 0 | {tr('In Progress')}: 0 | "
+            f"{tr('Completed')}: 0 | {tr('Failed')}: 0"
+        )
         info_layout.addWidget(self.status_label)
         
         info_layout.addStretch()
@@ -110,37 +445,46 @@ class TransferQueueWidget(QWidget):
         layout.addLayout(info_layout)
         
         # Transfer list table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            tr("Status"), tr("Filename"), tr("Source"), tr("Destination"), tr("Time(sec)")
-        ])
-        
-        # Column size adjustment (filename/source/destination similar sizes)
+        self.model = TransferQueueModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().setVisible(False)
+        
+        # Column size adjustment (filename/source/destination similar sizes).
+        # Status and Time get preset widths: ResizeToContents would measure
+        # every row again whenever tasks are added ("Fit Columns" does it once)
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # Status
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)  # Status
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Filename
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)  # Source
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)  # Destination
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Time
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)  # Time
+        header.resizeSection(0, 110)
+        header.resizeSection(_TIME_COLUMN, 80)
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
         # No max height limit (controlled by Splitter)
         
-        # Enable sorting
+        # Enable sorting (TransferQueueModel.sort); no sort column until the
+        # user clicks a header, so enqueued tasks are not re-sorted meanwhile
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.table.setSortingEnabled(True)
         
+        # Context menu
+        self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self._show_context_menu)
+        
         # Improve hover/selection colors
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 selection-background-color: #A8D3FF;  /* Light blue */
                 selection-color: #000000;  /* Black text */
             }
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background-color: #E8E8E8;  /* Light gray */
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #A8D3FF;  /* Light blue */
                 color: #000000;  /* Black text */
             }
@@ -166,52 +510,50 @@ class TransferQueueWidget(QWidget):
             destination: Destination path
             skip_stats_update: Skip stats update (for batch processing)
             file_size: File size (bytes)
-            
+        
         Returns:
             Added row index
         """
+        self.model.add_rows([(task_id, filename, source, destination, file_size)])
         
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        
-        # Temporarily disable sorting (prevent sorting during add)
-        sorting_enabled = self.table.isSortingEnabled()
-        if sorting_enabled:
-            self.table.setSortingEnabled(False)
-        
-        # Status (store task_id and file_size in UserRole)
-        status_item = QTableWidgetItem(tr("⏳ Waiting"))
-        status_item.setData(Qt.ItemDataRole.UserRole, task_id)
-        status_item.setData(Qt.ItemDataRole.UserRole + 1, file_size)  # Store file size
-        self.table.setItem(row, 0, status_item)
-        
-        # Filename
-        name_item = QTableWidgetItem(filename)
-        self.table.setItem(row, 1, name_item)
-        
-        # Source
-        source_item = QTableWidgetItem(source)
-        self.table.setItem(row, 2, source_item)
+        # Update stats (skip during batch processing)
+        if not skip_stats_update and not self._batch_depth:
+            self._schedule_stats_update()
         
-        # Destination
-        dest_item = QTableWidgetItem(destination)
-        self.table.setItem(row, 3, dest_item)
+        return self.model.rowCount() - 1
+    
+    def add_transfers(self, rows: list[tuple[int, str, str, str, int]]) -> None:
+        """Add several transfer tasks in one insertion.
         
-        # Time (seconds)
-        time_item = QTableWidgetItem("-")
-        time_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.table.setItem(row, 4, time_item)
+        Args:
+            rows: (task_id, filename, source, destination, file_size) per task
+        """
+        self.model.add_rows(rows)
+        if not self._batch_depth:
+            self._schedule_stats_update()
+    
+    def begin_batch(self) -> None:
+        """Start adding many tasks.
         
-        # Re-enable sorting
-        if sorting_enabled:
+        Until the matching end_batch(), sorting, table repaints and the stats
+        timer are suspended, and adding tasks does not update the stats.
+        Calls may be nested.
+        """
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.table.setSortingEnabled(False)
+            self.table.setUpdatesEnabled(False)
+            self._update_timer.stop()
+    
+    def end_batch(self) -> None:
+        """Finish adding many tasks: sort, repaint and update stats once."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.table.setUpdatesEnabled(True)
             self.table.setSortingEnabled(True)
-        
-        # Update stats (skip during batch processing)
-        if not skip_stats_update:
+            self._update_timer.start()
             self._update_status_stats()
-        
-        return row
-    
+
     def update_progress_by_task_id(
         self,
         task_id: int,
@@ -223,45 +565,62 @@ class TransferQueueWidget(QWidget):
         
         Args:
             task_id: Task ID
-            progress: Progress (0-100)
+            progress: Progress (0-100); values in between are shown in the status cell
             speed: Transfer speed string (unused)
             time_info: Time info string (unused)
         """
-        import time
-        
         # Find row by task_id
-        row = self._find_row_by_task_id(task_id)
+        row = self.model.row_of(task_id)
         if row == -1:
-            print(f"[DEBUG] Cannot find row for task_id {task_id}")
+            logger.debug("Cannot find row for task_id %d", task_id)
             return
         
-        print(f"[DEBUG] update_progress_by_task_id: task_id={task_id}, row={row}, progress={progress}")
+        logger.debug(
+            "update_progress_by_task_id: task_id=%d, row=%d, progress=%s",
+            task_id, row, progress,
+        )
         
         # Update status
-        status_item = self.table.item(row, 0)
-        if status_item:
-            if progress == 0:
-                # Record transfer start time
-                self._task_start_times[task_id] = time.time()
-                status_item.setText(tr("⚡ Transferring"))
-            elif progress == 100:
-                # Calculate transfer completion time
-                if task_id in self._task_start_times:
-                    elapsed = time.time() - self._task_start_times[task_id]
-                    time_item = self.table.item(row, 4)
-                    if time_item:
-                        time_item.setText(f"{elapsed:.1f}")
-                    del self._task_start_times[task_id]
-                status_item.setText(tr("✓ Completed"))
-            else:
-                status_item.setText(tr("⚡ Transferring"))
+        if progress == 0:
+            # Record transfer start time
+            now_ms = self._clock.elapsed()
+            if self._busy_since is None:
+                self._busy_since = now_ms
+            self._task_start_ms[task_id] = now_ms
+            self.model.set_status(row, TRANSFERRING)
+        elif progress == 100:
+            # Calculate transfer completion time
+            start_ms = self._end_task_time(task_id)
+            elapsed = None if start_ms is None else (self._clock.elapsed() - start_ms) / 1000
+            self.model.set_status(row, COMPLETED, elapsed)
+        else:
+            if self.model.status(row) != TRANSFERRING:
+                self.model.set_status(row, TRANSFERRING)
+            self.model.set_progress(row, progress)
         
         # Auto-scroll to current transferring item
         if progress < 100:
-            self.table.scrollToItem(status_item, QTableWidget.ScrollHint.PositionAtCenter)
+            self._scroll_task_id = task_id
+            if not self._scroll_timer.isActive():
+                self._scroll_timer.start()
         
         # Update stats
-        self._update_status_stats()
+        self._schedule_stats_update()
+    
+    def _end_task_time(self, task_id: int) -> int | None:
+        """Stop timing a task that completed or failed.
+        
+        Args:
+            task_id: Task ID
+        
+        Returns:
+            The task's start time (self._clock milliseconds), or None if it was not running
+        """
+        start_ms = self._task_start_ms.pop(task_id, None)
+        if not self._task_start_ms and self._busy_since is not None:
+            self._busy_ms += self._clock.elapsed() - self._busy_since
+            self._busy_since = None
+        return start_ms
     
     def mark_failed_by_task_id(self, task_id: int, error_message: str) -> None:
         """Mark transfer as failed by task_id.
@@ -270,39 +629,27 @@ class TransferQueueWidget(QWidget):
             task_id: Task ID
             error_message: Error message
         """
-        row = self._find_row_by_task_id(task_id)
+        row = self.model.row_of(task_id)
         if row == -1:
             return
         
-        status_item = self.table.item(row, 0)
-        if status_item:
-            status_item.setText(tr("✗ Failed"))
-        
         # Remove time display (on failure)
-        if task_id in self._task_start_times:
-            del self._task_start_times[task_id]
-        
-        time_item = self.table.item(row, 4)
-        if time_item:
-            time_item.setText(tr("Failed"))
+        self._end_task_time(task_id)
+        self.model.set_status(row, FAILED)
         
         # Update stats
-        self._update_status_stats()
+        self._schedule_stats_update()
     
-    def _find_row_by_task_id(self, task_id: int) -> int:
-        """Find row index by task_id.
+    def take_failed_transfers(self) -> list[tuple[str, str, str]]:
+        """Remove failed transfers from the queue (e.g. to retry them).
         
-        Args:
-            task_id: Task ID
-            
         Returns:
-            Row index. Returns -1 if not found
+            (filename, source, destination) of the removed transfers
         """
-        for row in range(self.table.rowCount()):
-            status_item = self.table.item(row, 0)
-            if status_item and status_item.data(Qt.ItemDataRole.UserRole) == task_id:
-                return row
-        return -1
+        failed = self.model.remove_status(FAILED)
+        if failed:
+            self._schedule_stats_update()
+        return failed
     
     def update_progress(
         self,
@@ -319,16 +666,11 @@ class TransferQueueWidget(QWidget):
             speed: Transfer speed string
             time_info: Time info string
         """
-        if row < 0 or row >= self.table.rowCount():
+        if row < 0 or row >= self.model.rowCount():
             return
         
         # Update status
-        status_item = self.table.item(row, 0)
-        if status_item:
-            if progress == 100:
-                status_item.setText(tr("✓ Completed"))
-            else:
-                status_item.setText(tr("⚡ Transferring"))
+        self.model.set_status(row, COMPLETED if progress == 100 else TRANSFERRING)
         
         # Update progress (legacy code, column 4 no longer has progress bar)
         # Kept for compatibility but does nothing
@@ -340,29 +682,42 @@ class TransferQueueWidget(QWidget):
             row: Row index
             error_message: Error message
         """
-        if row < 0 or row >= self.table.rowCount():
+        if row < 0 or row >= self.model.rowCount():
             return
         
-        status_item = self.table.item(row, 0)
-        if status_item:
-            status_item.setText(tr("✗ Failed"))
+        self.model.set_status(row, FAILED)
     
     def _on_clear_completed(self) -> None:
         """Remove completed transfer items."""
-        rows_to_remove = []
-        
-        for row in range(self.table.rowCount()):
-            status_item = self.table.item(row, 0)
-            if status_item and status_item.text() == tr("✓ Completed"):
-                rows_to_remove.append(row)
+        self.model.remove_status(COMPLETED)
         
-        # Remove in reverse order (prevent index changes)
-        for row in reversed(rows_to_remove):
-            self.table.removeRow(row)
+        # The time measured so far belongs to the removed transfers
+        self._busy_ms = 0
+        if self._busy_since is not None:
+            self._busy_since = self._clock.elapsed()
         
         # Update stats
-        self._update_status_stats()
+        self._schedule_stats_update()
+    
+    def _show_context_menu(self, position) -> None:
+        """Display context menu.
+        
+        Args:
+            position: Mouse position
+        """
+        menu = QMenu(self)
+        
+        fit_action = QAction(tr("Fit Columns"), self)
+        fit_action.triggered.connect(self._fit_columns)
+        menu.addAction(fit_action)
+        
+        menu.exec(self.table.viewport().mapToGlobal(position))
     
+    def _fit_columns(self) -> None:
+        """Size the Status and Time columns to their current contents."""
+        self.table.resizeColumnToContents(0)
+        self.table.resizeColumnToContents(_TIME_COLUMN)
+
     def _on_pause_clicked(self) -> None:
         """Pause/resume button click handler."""
         self._paused = not self._paused
@@ -394,50 +749,39 @@ class TransferQueueWidget(QWidget):
         """
         self.retry_button.setEnabled(enabled)
     
+    def _scroll_to_current(self) -> None:
+        """Scroll the latest transferring task into view unless it is visible."""
+        row = self.model.row_of(self._scroll_task_id)
+        if row == -1:
+            return
+        
+        index = self.model.index(row, 0)
+        if not self.table.visualRect(index).intersects(self.table.viewport().rect()):
+            self.table.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
+    
+    def _schedule_stats_update(self) -> None:
+        """Update the stats shortly, once for all changes made until then.
+        
+        Progress signals arrive in bursts; each burst refreshes the labels once.
+        """
+        if not self._stats_timer.isActive():
+            self._stats_timer.start()
+    
     def _update_status_stats(self) -> None:
-        """Update top status statistics."""
-        import time
-        
-        total = self.table.rowCount()
-        waiting = 0
-        in_progress = 0
-        completed = 0
-        failed = 0
-        
-        total_elapsed = 0.0
-        in_progress_tasks = []
-        
-        for row in range(total):
-            status_item = self.table.item(row, 0)
-            if not status_item:
-                continue
-            
-            status_text = status_item.text()
-            task_id = status_item.data(Qt.ItemDataRole.UserRole)
-            
-            if status_text == tr("⏳ Waiting"):
-                waiting += 1
-            elif status_text == tr("⚡ Transferring"):
-                in_progress += 1
-                if task_id in self._task_start_times:
-                    in_progress_tasks.append(task_id)
-            elif status_text == tr("✓ Completed"):
-                completed += 1
-                # Sum completed task times
-                time_item = self.table.item(row, 4)
-                if time_item and time_item.text() not in ["-", tr("Failed")]:
-                    try:
-                        total_elapsed += float(time_item.text())
-                    except ValueError:
-                        pass
-            elif status_text == tr("✗ Failed"):
-                failed += 1
-        
-        # Add elapsed time for in-progress tasks
-        current_time = time.time()
-        for task_id in in_progress_tasks:
-            if task_id in self._task_start_times:
-                total_elapsed += (current_time - self._task_start_times[task_id])
+        """Update top status statistics.
+        
+        Uses the model's running counts, so it does not scan the rows.
+        """
+        self._stats_timer.stop()  # This run covers any scheduled update
+        
+        waiting, in_progress, completed, failed = self.model.status_counts
+        total = self.model.rowCount()
+        
+        # Time spent transferring (parallel transfers count once)
+        busy_ms = self._busy_ms
+        if self._busy_since is not None:
+            busy_ms += self._clock.elapsed() - self._busy_since
+        total_elapsed = busy_ms / 1000
         
         # Calculate overall progress
         if total > 0:
@@ -452,14 +796,8 @@ class TransferQueueWidget(QWidget):
         speed_text = "-"
         estimated_time_text = "-"
         
-        # Calculate total size of completed files
-        total_bytes = 0
-        for row in range(total):
-            status_item = self.table.item(row, 0)
-            if status_item and status_item.text() == tr("✓ Completed"):
-                file_size = status_item.data(Qt.ItemDataRole.UserRole + 1)
-                if file_size:
-                    total_bytes += file_size
+        # Total size of completed files
+        total_bytes = self.model.completed_bytes
         
         if completed > 0 and total_elapsed > 0:
             # Average transfer speed (MB/s)
@@ -481,35 +819,26 @@ class TransferQueueWidget(QWidget):
                 estimated_remaining = avg_time_per_file * remaining
                 
                 # Display elapsed/estimated time (HH:MM:SS)
-                def format_time_hms(seconds):
-                    hours = int(seconds // 3600)
-                    minutes = int((seconds % 3600) // 60)
-                    secs = int(seconds % 60)
-                    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-                
-                elapsed_text = format_time_hms(total_elapsed)
-                remaining_text = format_time_hms(estimated_remaining)
-                
-                estimated_time_text = f"{elapsed_text}/{remaining_text}"
+                estimated_time_text = (
+                    f"{_format_hms(total_elapsed)}/{_format_hms(estimated_remaining)}"
+                )
             else:
                 # All completed
-                def format_time_hms(seconds):
-                    hours = int(seconds // 3600)
-                    minutes = int((seconds % 3600) // 60)
-                    secs = int(seconds % 60)
-                    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-                
-                estimated_time_text = format_time_hms(total_elapsed)
+                estimated_time_text = _format_hms(total_elapsed)
         
         # Update status
-        self.status_label.setText(f"{tr('Waiting')}: {waiting} | {tr('In Progress')}: {in_progress} | {tr('Completed')}: {completed} | {tr('Failed')}: {failed}")
+        self.status_label.setText(
+            f"{tr('Waiting')}: {waiting} | {tr('In Progress')}: {in_progress} | "
+            f"{tr('Completed')}: {completed} | {tr('Failed')}: {failed}"
+        )
         
         # Update overall progress info
         if total > 0:
-            self.global_progress_label.setText(f"{tr('Time')}: {estimated_time_text} | {tr('Speed')}: {speed_text}")
+            self.global_progress_label.setText(
+                f"{tr('Time')}: {estimated_time_text} | {tr('Speed')}: {speed_text}"
+            )
         else:
             self.global_progress_label.setText(f"{tr('Time')}: - | {tr('Speed')}: -")
         
         # Enable/disable retry failed button
         self.enable_retry_button(failed > 0)
-
@@ -1,20 +1,22 @@
 """Device watcher worker module.
 
-Periodically executes `adb devices` in QThread to detect
-device connection state changes and notify via signals.
+Follows `adb track-devices` in QThread (falling back to periodic
+`adb devices` calls) to detect device connection state changes and
+notify via signals.
 """
 
 import subprocess
-import time
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QElapsedTimer, QObject, QTimer, pyqtSignal, pyqtSlot
 
-from adb_copy.core.adb_manager import AdbDevice, AdbManager
+from adb_copy.core.adb_manager import AdbDevice, AdbManager, DeviceTracker
 
 
 class DeviceWatcher(QObject):
     """Worker class that monitors device connection state.
     
-    Runs in QThread and periodically checks connected device list.
+    Runs in QThread. After an initial `adb devices` call it follows
+    `adb track-devices`, which reports the device list only when it
+    changes; while tracking is unavailable it polls `adb devices` instead.
     Emits signals when device list changes.
     
     Signals:
@@ -30,40 +32,106 @@ class DeviceWatcher(QObject):
         
         Args:
             adb_path: Path to adb executable
-            poll_interval: Polling interval (seconds). Default 2 seconds
+            poll_interval: Polling interval (seconds) while device tracking
+                is unavailable. Default 2 seconds
         """
         super().__init__()
-        self.adb_manager = AdbManager(adb_path)
+        self.adb_manager = AdbManager.get_default(adb_path)
         self.poll_interval = poll_interval
         self._running = False
         self._last_devices: list[AdbDevice] = []
+        # (serial, state) pairs of _last_devices, compared on every poll
+        self._last_device_set: frozenset[tuple[str, str]] = frozenset()
+        
+        # Child of the watcher, so moveToThread() moves it to the worker thread
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setSingleShot(True)
+        self._poll_timer.timeout.connect(self._poll)
+        
+        # Running `adb track-devices` (None while polling)
+        self._tracker: DeviceTracker | None = None
     
+    @pyqtSlot()
     def start_watching(self) -> None:
         """Start device monitoring.
         
-        This method must be called from QThread and
-        will block until stop_watching() is called.
+        This method must be called from QThread. It checks the devices once
+        and then blocks the thread while following `adb track-devices`;
+        while tracking is unavailable, further checks run on the thread's
+        event loop until stop_watching() is called.
         """
         self._running = True
-        
-        while self._running:
-            try:
-                current_devices = self.adb_manager.get_devices()
-                
-                # Check if device list changed
-                if self._devices_changed(current_devices):
-                    self._last_devices = current_devices
-                    self.devices_changed.emit(current_devices)
-                
-            except subprocess.SubprocessError as e:
-                self.error_occurred.emit(str(e))
-            
-            # Wait for polling interval
-            time.sleep(self.poll_interval)
+        self._poll()
     
     def stop_watching(self) -> None:
-        """Stop device monitoring."""
+        """Stop device monitoring.
+        
+        No check runs after this; a pending poll is dropped and tracking ends.
+        May be called from any thread.
+        """
         self._running = False
+        tracker = self._tracker
+        if tracker is not None:
+            tracker.stop()
+    
+    @pyqtSlot()
+    def _poll(self) -> None:
+        """Check the device list once, then track changes or schedule the next check."""
+        if not self._running:
+            return
+        
+        poll_clock = QElapsedTimer()
+        poll_clock.start()
+        
+        # Also starts the adb server if it is not running yet
+        self._refresh_devices()
+        
+        # Follow changes reported by the adb server until tracking ends
+        if self._running:
+            self._track()
+        
+        # Poll for the rest of the interval (a slow adb call does not push
+        # later polls back); each poll retries tracking
+        if self._running:
+            remaining_ms = int(self.poll_interval * 1000) - poll_clock.elapsed()
+            self._poll_timer.start(max(0, remaining_ms))
+    
+    def _refresh_devices(self) -> None:
+        """Get the device list and emit devices_changed if it changed."""
+        try:
+            current_devices = self.adb_manager.get_devices()
+            
+            # Check if device list changed
+            if self._devices_changed(current_devices):
+                self._last_devices = current_devices
+                self._last_device_set = frozenset((d.serial, d.state) for d in current_devices)
+                # Shell sessions of disconnected devices would only fail later
+                self.adb_manager.close_shell_sessions(
+                    {d.serial for d in current_devices if d.state == "device"}
+                )
+                self.devices_changed.emit(current_devices)
+            
+        except subprocess.SubprocessError as e:
+            self.error_occurred.emit(str(e))
+    
+    def _track(self) -> None:
+        """Follow `adb track-devices`, blocking until it ends or stop_watching() is called."""
+        try:
+            tracker = self.adb_manager.track_devices()
+        except subprocess.SubprocessError:
+            return  # Keep polling
+        
+        self._tracker = tracker
+        try:
+            for device_set in tracker:
+                if not self._running:
+                    break
+                # adb devices -l also reports model names, so refresh through it
+                if device_set != self._last_device_set:
+                    self._refresh_devices()
+        finally:
+            tracker.stop()
+            self._tracker = None
     
     def _devices_changed(self, current_devices: list[AdbDevice]) -> bool:
         """Compare previous device list with current list.
@@ -74,12 +142,6 @@ class DeviceWatcher(QObject):
         Returns:
             bool: Whether device list has changed
         """
-        if len(current_devices) != len(self._last_devices):
-            return True
-        
         # Compare by serial number and state
-        current_set = {(d.serial, d.state) for d in current_devices}
-        last_set = {(d.serial, d.state) for d in self._last_devices}
-        
-        return current_set != last_set
-
+        current_set = frozenset((d.serial, d.state) for d in current_devices)
+        return current_set != self._last_device_set
@@ -4,15 +4,43 @@ Executes `adb shell ls` command in QThread to
 asynchronously retrieve file list from remote device.
 """
 
+import logging
+import operator
 import re
+import shlex
 import subprocess
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
 
 from adb_copy.core.adb_manager import AdbManager
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Entries per files_batch signal while a listing streams in
+_BATCH_SIZE = 100
+
+# Directories whose parsed listing is kept for the next visit
+_LISTING_CACHE_SIZE = 8
+
+# Permission characters accepted in the first ls -la column
+_PERMISSION_CHARS = "drwxst-"
+
+# One ls -la line, for lines the str.split fast path does not accept
+# (compiled once; parsing runs per directory entry)
+# Permission (10 chars) + link count + owner + group + size + date + time + name
+# Capture date and time: YYYY-MM-DD HH:MM or Mon DD HH:MM or Mon DD YYYY
+_LS_LINE_RE = re.compile(
+    # Permission~size (added 's' and 't' for special bits)
+    r"^([drwxst-]{10})\s+\d+\s+\S+\s+\S+\s+(\d+)\s+"
+    r"(\d{4}-\d{2}-\d{2}|\w{3}\s+\d{1,2})\s+"  # Date part (captured)
+    r"(\d{1,2}:\d{2}|\d{4})\s+"  # Time or year (captured)
+    r"(.+)$"  # Filename (rest of line)
+)
+
+
+@dataclass(slots=True)
 class RemoteFileInfo:
     """Data class containing remote file information.
     
@@ -32,17 +60,52 @@ class RemoteFileInfo:
     date: str = ""
 
 
+def _sort_listing(files: list[RemoteFileInfo]) -> list[RemoteFileInfo]:
+    """Order a listing: directories first, then by case-insensitive name.
+    
+    Args:
+        files: Parsed entries in any order
+    
+    Returns:
+        New sorted list
+    """
+    dirs = []
+    others = []
+    for file_info in files:
+        (dirs if file_info.is_dir else others).append((file_info.name.casefold(), file_info))
+    
+    by_key = operator.itemgetter(0)
+    dirs.sort(key=by_key)
+    others.sort(key=by_key)
+    return [entry[1] for entry in dirs] + [entry[1] for entry in others]
+
+
+# (device serial, path) -> (entries by ls line, sorted listing) of recently
+# listed directories, least recently listed first. Shared by all workers
+# (each runnable has its own) and guarded by _listing_cache_lock
+_listing_cache: OrderedDict[
+    tuple[str, str],
+    tuple[dict[str, RemoteFileInfo], list[RemoteFileInfo]],
+] = OrderedDict()
+_listing_cache_lock = threading.Lock()
+
+
 class FileListWorker(QObject):
     """File list retrieval worker class.
     
     Runs in QThread and asynchronously retrieves directory contents from remote device.
     
     Signals:
+        files_batch: Emitted per _BATCH_SIZE entries while the listing arrives,
+            unsorted (list[RemoteFileInfo])
         files_loaded: Emitted when file list retrieval completes (list[RemoteFileInfo])
+        batch_loaded: Emitted when a batch listing completes (dict[str, list[RemoteFileInfo]])
         error_occurred: Emitted when error occurs (str)
     """
     
+    files_batch = pyqtSignal(list)  # list[RemoteFileInfo]
     files_loaded = pyqtSignal(list)  # list[RemoteFileInfo]
+    batch_loaded = pyqtSignal(dict)  # dict[str, list[RemoteFileInfo]]
     error_occurred = pyqtSignal(str)
     
     def __init__(self, adb_path: str = "adb") -> None:
@@ -52,8 +115,9 @@ class FileListWorker(QObject):
             adb_path: Path to adb executable
         """
         super().__init__()
-        self.adb_manager = AdbManager(adb_path)
+        self.adb_manager = AdbManager.get_default(adb_path)
     
+    @pyqtSlot(str, str)
     def list_files(self, device_serial: str, remote_path: str) -> None:
         """Retrieve file list from remote directory.
         
@@ -64,34 +128,125 @@ class FileListWorker(QObject):
             remote_path: Remote directory path to query
         """
         try:
-            # Execute ls -la command (with detailed info)
+            # Stream ls -la output (with detailed info) so that large
+            # directories show their first entries before the listing ends.
+            # -n prints numeric owner/group ids: the names are not shown, and
+            # resolving them costs the device a lookup per entry.
+            # The device's persistent shell saves starting adb per directory
+            files = []
+            batch = []
+            path_prefix = remote_path.rstrip("/") + "/"
+            
+            # Going back to a directory mostly repeats its ls lines: reuse
+            # their entries instead of parsing them again
+            cache_key = (device_serial, remote_path)
+            with _listing_cache_lock:
+                cached_entries, cached_files = _listing_cache.pop(cache_key, ({}, []))
+            entries: dict[str, RemoteFileInfo] = {}
+            
+            for line in self.adb_manager.session_command_lines(
+                device_serial,
+                f"ls -lan {shlex.quote(remote_path)}",
+                timeout=10,
+            ):
+                file_info = cached_entries.get(line)
+                if file_info is None:
+                    file_info = self._parse_ls_line(line, path_prefix)
+                    if file_info is None:
+                        continue
+                entries[line] = file_info
+                files.append(file_info)
+                batch.append(file_info)
+                if len(batch) == _BATCH_SIZE:
+                    self.files_batch.emit(batch)
+                    batch = []
+            
+            # The remainder arrives with the complete, sorted list. Entries
+            # are keyed by their whole line, so the same keys mean the same
+            # listing and the previous sort still holds
+            if entries.keys() == cached_entries.keys():
+                files = cached_files
+            else:
+                files = _sort_listing(files)
+            logger.debug("Parsed %d files in '%s'", len(files), remote_path)
+            
+            with _listing_cache_lock:
+                _listing_cache[cache_key] = (entries, files)
+                if len(_listing_cache) > _LISTING_CACHE_SIZE:
+                    _listing_cache.popitem(last=False)
+            
+            self.files_loaded.emit(files)
+            
+        except subprocess.SubprocessError as e:
+            self.error_occurred.emit(f"File list retrieval failed: {str(e)}")
+        except Exception as e:
+            self.error_occurred.emit(f"Unexpected error: {str(e)}")
+    
+    def list_files_batch(self, device_serial: str, remote_paths: list[str]) -> None:
+        """Retrieve the file lists of several remote directories in one adb call.
+        
+        Directories that cannot be listed are left out of the result.
+        
+        Args:
+            device_serial: Target device serial number
+            remote_paths: Remote directory paths to query
+        """
+        try:
+            quoted = " ".join(shlex.quote(path) for path in remote_paths)
+            # Unreadable directories only go to stderr; keep the rest
+            # (-n: numeric owner/group ids, as in list_files)
             output = self.adb_manager.shell_command(
                 device_serial,
-                f"ls -la '{remote_path}'",
+                f"ls -lan {quoted} 2>/dev/null; true",
                 timeout=10,
             )
             
-            # DEBUG: Print raw output
-            print(f"[DEBUG] ls -la output for '{remote_path}':")
-            print(f"[DEBUG] Output length: {len(output) if output else 0}")
-            print(f"[DEBUG] Output:\n{output}")
-            
-            # None check
             if output is None:
                 self.error_occurred.emit("File list retrieval failed: No output")
                 return
             
-            files = self._parse_ls_output(output, remote_path)
-            print(f"[DEBUG] Parsed {len(files)} files")
-            for f in files:
-                print(f"[DEBUG]   - {f.name} (is_dir={f.is_dir})")
-            self.files_loaded.emit(files)
-            
+            self.batch_loaded.emit(self._parse_batch_output(output, remote_paths))
+        
         except subprocess.SubprocessError as e:
             self.error_occurred.emit(f"File list retrieval failed: {str(e)}")
         except Exception as e:
             self.error_occurred.emit(f"Unexpected error: {str(e)}")
     
+    def _parse_batch_output(
+        self,
+        output: str,
+        remote_paths: list[str],
+    ) -> dict[str, list[RemoteFileInfo]]:
+        """Split multi-directory ls -la output into per-directory listings.
+        
+        With several operands, ls prefixes each directory's section with a
+        "path:" line; a single operand is listed without one.
+        
+        Args:
+            output: Output from ls -la command
+            remote_paths: Directory paths passed to ls
+        
+        Returns:
+            Directory path -> list of RemoteFileInfo
+        """
+        if len(remote_paths) == 1:
+            return {remote_paths[0]: self._parse_ls_output(output, remote_paths[0])}
+        
+        headers = {f"{path}:": path for path in remote_paths}
+        sections: dict[str, list[str]] = {}
+        current: list[str] | None = None
+        for line in output.splitlines():
+            path = headers.get(line.strip())
+            if path is not None:
+                current = sections.setdefault(path, [])
+            elif current is not None:
+                current.append(line)
+        
+        return {
+            path: self._parse_ls_output("\n".join(lines), path)
+            for path, lines in sections.items()
+        }
+    
     def _parse_ls_output(
         self,
         output: str,
@@ -106,64 +261,145 @@ class FileListWorker(QObject):
         Returns:
             List of RemoteFileInfo
         """
+        # One pass over the output; splitlines also drops \r from CRLF endings
         files = []
+        path_prefix = base_path.rstrip("/") + "/"
+        for line in output.splitlines():
+            file_info = self._parse_ls_line(line, path_prefix)
+            if file_info is not None:
+                files.append(file_info)
         
-        # Check for empty output
-        if not output or not output.strip():
-            return files
-        
-        lines = output.strip().split("\n")
+        # Sort: directories first, then by name
+        return _sort_listing(files)
+    
+    def _parse_ls_line(self, line: str, path_prefix: str) -> RemoteFileInfo | None:
+        """Parse one line of ls -la output.
         
+        Args:
+            line: Output line
+            path_prefix: Directory path ending in a single "/" (computed once
+                per listing by the caller)
+            
+        Returns:
+            RemoteFileInfo, or None for the total line, . and .. and unparsable lines
+        """
         # ls -la output format:
         # drwxr-xr-x  2 root root  4096 2024-10-24 17:33 dirname
         # -rw-r--r--  1 root root  1234 2024-10-24 17:33 filename with spaces.txt
         
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("total"):
-                continue
-            
-            # Parse with regex
-            # Permission (10 chars) + link count + owner + group + size + date + time + name
-            # Capture date and time: YYYY-MM-DD HH:MM or Mon DD HH:MM or Mon DD YYYY
-            match = re.match(
-                r"^([drwxst-]{10})\s+\d+\s+\S+\s+\S+\s+(\d+)\s+"  # Permission~size (added 's' and 't' for special bits)
-                r"(\d{4}-\d{2}-\d{2}|\w{3}\s+\d{1,2})\s+"  # Date part (captured)
-                r"(\d{1,2}:\d{2}|\d{4})\s+"  # Time or year (captured)
-                r"(.+)$",  # Filename (rest of line)
-                line,
-            )
+        # Lines come without line endings; names may end in spaces, so no strip()
+        if not line or line.startswith("total"):
+            return None
+        
+        # Symlinks, device nodes, "path:" headers and error messages never
+        # match; reject them before splitting or running the regex
+        if len(line) < 10 or line[0] not in _PERMISSION_CHARS:
+            return None
+        
+        # Fast path: toybox prints "YYYY-MM-DD HH:MM", so the name is whatever
+        # follows the first 7 whitespace-separated fields
+        parts = line.split(None, 7)
+        if (
+            len(parts) == 8
+            and len(parts[0]) == 10
+            and not parts[0].strip(_PERMISSION_CHARS)
+            and parts[1].isdigit()
+            and parts[4].isdigit()
+            and len(parts[5]) == 10
+            and parts[5][4] == "-"
+            and ":" in parts[6]
+        ):
+            permissions, _links, _owner, _group, size_text, date_part, time_part, name = parts
+            size = int(size_text)
+        else:
+            # Other date formats (Mon DD HH:MM, Mon DD YYYY): parse with regex
+            match = _LS_LINE_RE.match(line)
             
             if not match:
-                continue
+                return None
             
             permissions = match.group(1)
             size = int(match.group(2))
             date_part = match.group(3)
             time_part = match.group(4)
             name = match.group(5)
-            
-            # Exclude . and ..
-            if name in (".", ".."):
-                continue
-            
-            # Format date string
-            date_str = f"{date_part} {time_part}"
-            
-            is_dir = permissions.startswith("d")
-            full_path = f"{base_path.rstrip('/')}/{name}"
-            
-            files.append(RemoteFileInfo(
-                name=name,
-                is_dir=is_dir,
-                size=size,
-                permissions=permissions,
-                path=full_path,
-                date=date_str,
-            ))
         
-        # Sort: directories first, then by name
-        files.sort(key=lambda f: (not f.is_dir, f.name.lower()))
+        # Exclude . and ..
+        if name in (".", ".."):
+            return None
         
-        return files
+        return RemoteFileInfo(
+            name=name,
+            is_dir=permissions.startswith("d"),
+            size=size,
+            permissions=permissions,
+            path=path_prefix + name,
+            # Format date string
+            date=f"{date_part} {time_part}",
+        )
+
 
+class FileListRunnable(QRunnable):
+    """File list retrieval task for QThreadPool.
+    
+    Runs FileListWorker.list_files on a pool thread. QRunnable is not a
+    QObject, so results are reported through the wrapped worker's signals.
+    
+    Attributes:
+        worker: Worker whose files_loaded/error_occurred signals report the result
+    """
+    
+    def __init__(self, device_serial: str, remote_path: str, parent: QObject) -> None:
+        """Initialize FileListRunnable instance.
+        
+        Args:
+            device_serial: Target device serial number
+            remote_path: Remote directory path to query
+            parent: Owner of the worker (keeps it alive until results are delivered)
+        """
+        super().__init__()
+        self.worker = FileListWorker()
+        self.worker.setParent(parent)
+        self.device_serial = device_serial
+        self.remote_path = remote_path
+    
+    def run(self) -> None:
+        """Retrieve file list (called on a pool thread)."""
+        try:
+            self.worker.list_files(self.device_serial, self.remote_path)
+        finally:
+            # Posted after the result signals, so receivers get them first
+            self.worker.deleteLater()
+
+
+class FileListBatchRunnable(QRunnable):
+    """Batch file list retrieval task for QThreadPool.
+    
+    Runs FileListWorker.list_files_batch on a pool thread, listing several
+    directories with a single adb round trip.
+    
+    Attributes:
+        worker: Worker whose batch_loaded/error_occurred signals report the result
+    """
+    
+    def __init__(self, device_serial: str, remote_paths: list[str], parent: QObject) -> None:
+        """Initialize FileListBatchRunnable instance.
+        
+        Args:
+            device_serial: Target device serial number
+            remote_paths: Remote directory paths to query
+            parent: Owner of the worker (keeps it alive until results are delivered)
+        """
+        super().__init__()
+        self.worker = FileListWorker()
+        self.worker.setParent(parent)
+        self.device_serial = device_serial
+        self.remote_paths = remote_paths
+    
+    def run(self) -> None:
+        """Retrieve file lists (called on a pool thread)."""
+        try:
+            self.worker.list_files_batch(self.device_serial, self.remote_paths)
+        finally:
+            # Posted after the result signals, so receivers get them first
+            self.worker.deleteLater()
@@ -3,14 +3,44 @@
 Processes file transfer tasks and reports progress in QThread.
 """
 
+import logging
+import os
+import shlex
 import subprocess
+import threading
 import time
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 from adb_copy.core.adb_manager import AdbManager
 
+logger = logging.getLogger(__name__)
+
+# Files below this size that go to the same folder are transferred with one
+# adb call (per-file process start and handshake dominate their transfer time)
+_SMALL_FILE_SIZE = 64 * 1024
+
+# Most files per grouped adb call (keeps the command line short on Windows)
+_MAX_GROUP_FILES = 50
+
+# Files from this size on report progress while they transfer
+_PROGRESS_MIN_SIZE = 1024 * 1024
+
+# Files from this size on are compressed with lz4 on the wire (for smaller
+# files the compression setup costs more than it saves)
+_COMPRESS_MIN_SIZE = 1024 * 1024
+
+# Transfers running at the same time (each is its own adb process; the adb
+# server serves several sync connections per device)
+_MAX_PARALLEL_TRANSFERS = 4
+
+# Seconds between size checks of an upload's file on the device (each one
+# is a shell command, unlike the local size check of a download)
+_REMOTE_POLL_INTERVAL = 2.0
+
 
 @dataclass
 class TransferTask:
@@ -36,10 +66,41 @@ class TransferTask:
     is_dir: bool = False
 
 
+class _TransferRunnable(QRunnable):
+    """Runs one transfer (a task or a group of small files) on the transfer pool.
+    
+    QRunnable is not a QObject, so the result is reported through the
+    owning worker's signals.
+    """
+    
+    def __init__(self, worker: "TransferWorker", group: list[TransferTask]) -> None:
+        """Initialize _TransferRunnable instance.
+        
+        Args:
+            worker: Worker that submitted the transfer
+            group: Tasks from TransferWorker._take_group
+        """
+        super().__init__()
+        self.worker = worker
+        self.group = group
+    
+    def run(self) -> None:
+        """Transfer the tasks (called on a pool thread)."""
+        try:
+            if len(self.group) > 1:
+                self.worker._run_group(self.group)
+            else:
+                self.worker._run_task(self.group[0])
+        finally:
+            self.worker._transfer_finished()
+
+
 class TransferWorker(QObject):
     """File transfer worker class.
     
-    Runs in QThread and sequentially processes file transfer queue.
+    Runs in QThread and processes the file transfer queue in order, up to
+    _MAX_PARALLEL_TRANSFERS transfers at a time on its own thread pool.
+    Signals are emitted from the pool threads.
     
     Signals:
         transfer_started: Emitted when transfer starts (task_id: int)
@@ -62,10 +123,29 @@ class TransferWorker(QObject):
             adb_path: Path to adb executable
         """
         super().__init__()
-        self.adb_manager = AdbManager(adb_path)
-        self.task_queue: list[TransferTask] = []
+        self.adb_manager = AdbManager.get_default(adb_path)
+        self.task_queue: deque[TransferTask] = deque()  # FIFO, popleft() is O(1)
+        # Queued downloads added without a size (e.g. retries), sized in one
+        # batch on the transfer thread before they are grouped
+        self._unsized_pulls: list[TransferTask] = []
+        # Transfers submitted to the pool and not finished yet
+        self._in_flight = 0
+        # Guards task_queue, _unsized_pulls and _in_flight (add_task runs on
+        # the GUI thread, transfers finish on pool threads)
+        self._lock = threading.Lock()
+        # Notified when a transfer finishes, a task is added or on stop()
+        self._state_changed = threading.Condition(self._lock)
+        # Own pool: the global one serves file listings and must not be
+        # blocked by long transfers
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(_MAX_PARALLEL_TRANSFERS)
+        # Held while an upload's size is checked on the device; parallel
+        # uploads skip their check meanwhile instead of starting another
+        self._remote_poll_lock = threading.Lock()
         self._running = False
-        self._paused = False
+        # Set while not paused; the transfer loop blocks on it while paused
+        self._resume_event = threading.Event()
+        self._resume_event.set()
     
     def add_task(self, task: TransferTask) -> None:
         """Add transfer task to queue.
@@ -73,63 +153,233 @@ class TransferWorker(QObject):
         Args:
             task: Transfer task
         """
-        self.task_queue.append(task)
+        with self._lock:
+            if task.direction == "pull" and not task.is_dir and task.file_size == 0:
+                self._unsized_pulls.append(task)
+            self.task_queue.append(task)
+            self._state_changed.notify()
     
     def start_transfer(self) -> None:
         """Start transfer tasks.
         
         This method must be called from QThread.
         """
-        print(f"[DEBUG] TransferWorker.start_transfer started, queue: {len(self.task_queue)} tasks")
+        # Nothing queued: skip starting the transfer loop
+        with self._lock:
+            queued = len(self.task_queue)
+        if not queued:
+            self.all_completed.emit()
+            return
+        
+        logger.debug("TransferWorker.start_transfer started, queue: %d tasks", queued)
         self._running = True
         
-        while self._running and self.task_queue:
-            # Check for pause
-            while self._paused and self._running:
-                time.sleep(0.1)
+        while self._running:
+            with self._lock:
+                # Wait for a free slot (or for tasks added in the meantime)
+                while self._running and (
+                    self._in_flight == _MAX_PARALLEL_TRANSFERS
+                    or (not self.task_queue and self._in_flight)
+                ):
+                    self._state_changed.wait()
+                if not self.task_queue:
+                    break
+            
+            # Check for pause (running transfers finish meanwhile);
+            # resume() and stop() wake the wait immediately
+            self._resume_event.wait()
             
             if not self._running:
                 break
             
-            # Get next task
-            task = self.task_queue.pop(0)
-            print(f"[DEBUG] Task processing started: task_id={task.task_id}, file={task.filename}")
+            self._size_unsized_pulls()
             
-            try:
-                self.transfer_started.emit(task.task_id)
-                print(f"[DEBUG] transfer_started signal emitted: {task.task_id}")
-                
-                self._process_task(task)
-                print(f"[DEBUG] _process_task completed: {task.task_id}")
-                
-                self.transfer_completed.emit(task.task_id)
-                print(f"[DEBUG] transfer_completed signal emitted: {task.task_id}")
-                
-            except Exception as e:
-                print(f"[DEBUG] Transfer failed: {task.task_id}, error: {str(e)}")
-                self.transfer_failed.emit(task.task_id, str(e))
+            # Get next task (with the small files queued right after it
+            # for the same folder)
+            with self._lock:
+                group = self._take_group(self.task_queue.popleft())
+                self._in_flight += 1
+            self._pool.start(_TransferRunnable(self, group))
+        
+        # Wait for the transfers still running
+        self._pool.waitForDone()
         
         # All tasks completed
-        print(f"[DEBUG] Transfer loop ended, remaining tasks: {len(self.task_queue)}")
-        if not self.task_queue:
-            print("[DEBUG] all_completed signal emitted")
+        with self._lock:
+            remaining = len(self.task_queue)
+        logger.debug("Transfer loop ended, remaining tasks: %d", remaining)
+        if not remaining:
+            logger.debug("all_completed signal emitted")
             self.all_completed.emit()
         
         self._running = False
-        print("[DEBUG] TransferWorker.start_transfer ended")
+        logger.debug("TransferWorker.start_transfer ended")
+    
+    def _transfer_finished(self) -> None:
+        """Free the slot of a finished transfer (called on a pool thread)."""
+        with self._lock:
+            self._in_flight -= 1
+            self._state_changed.notify()
+    
+    def _run_task(self, task: TransferTask) -> None:
+        """Transfer one task and report its result.
+        
+        Args:
+            task: Transfer task
+        """
+        logger.debug("Task processing started: task_id=%d, file=%s", task.task_id, task.filename)
+        
+        try:
+            self.transfer_started.emit(task.task_id)
+            logger.debug("transfer_started signal emitted: %d", task.task_id)
+            
+            self._process_task(task)
+            logger.debug("_process_task completed: %d", task.task_id)
+            
+            self.transfer_completed.emit(task.task_id)
+            logger.debug("transfer_completed signal emitted: %d", task.task_id)
+            
+        except Exception as e:
+            logger.debug("Transfer failed: %d, error: %s", task.task_id, e)
+            self.transfer_failed.emit(task.task_id, str(e))
+    
+    def _size_unsized_pulls(self) -> None:
+        """Look up the remote sizes of downloads queued without one.
+        
+        Folders found this way are marked as such, so they are neither
+        grouped with small files nor given a progress ticker.
+        """
+        with self._lock:
+            tasks, self._unsized_pulls = self._unsized_pulls, []
+        by_device: dict[str, list[TransferTask]] = {}
+        for task in tasks:
+            by_device.setdefault(task.device_serial, []).append(task)
+        
+        for device_serial, device_tasks in by_device.items():
+            try:
+                sizes = self.adb_manager.stat_sizes(
+                    device_serial, [task.source_path for task in device_tasks]
+                )
+            except subprocess.SubprocessError as e:
+                logger.debug("Size lookup failed: %s", e)
+                continue  # Transferred alone and without progress
+            for task in device_tasks:
+                if task.source_path not in sizes:
+                    continue  # Missing; the transfer reports the error
+                size = sizes[task.source_path]
+                if size is None:
+                    task.is_dir = True
+                else:
+                    task.file_size = size
+    
+    def _group_folder(self, task: TransferTask) -> str | None:
+        """Get the destination folder if the task can join a grouped transfer.
+        
+        Only small single files whose destination keeps the source file
+        name qualify, since a grouped adb call cannot rename.
+        
+        Args:
+            task: Transfer task
+        
+        Returns:
+            Destination folder, or None if the task must be transferred alone
+        """
+        if task.is_dir or task.file_size >= _SMALL_FILE_SIZE:
+            return None
+        
+        if task.direction == "push":
+            source_name = os.path.basename(task.source_path)
+            folder, _, dest_name = task.destination_path.rpartition("/")
+            folder = folder or "/"
+        elif task.direction == "pull":
+            source_name = task.source_path.rpartition("/")[2]
+            folder, dest_name = os.path.split(task.destination_path)
+        else:
+            return None
+        
+        return folder if source_name == dest_name else None
+    
+    def _take_group(self, task: TransferTask) -> list[TransferTask]:
+        """Collect the queued tasks that can be transferred together with a task.
+        
+        Must be called with _lock held.
+        
+        Args:
+            task: Task just taken from the queue
+        
+        Returns:
+            The task, followed by matching tasks taken from the front of the queue
+        """
+        group = [task]
+        folder = self._group_folder(task)
+        if folder is None:
+            return group
+        
+        while len(group) < _MAX_GROUP_FILES and self.task_queue:
+            next_task = self.task_queue[0]
+            if (
+                next_task.direction != task.direction
+                or next_task.device_serial != task.device_serial
+                or self._group_folder(next_task) != folder
+            ):
+                break
+            group.append(self.task_queue.popleft())
+        
+        return group
+    
+    def _run_group(self, group: list[TransferTask]) -> None:
+        """Transfer small files bound for one folder with a single adb call.
+        
+        If the grouped call fails, the files are transferred one by one so
+        that each failure is reported for its own task.
+        
+        Args:
+            group: Tasks from _take_group (same direction, device and folder)
+        """
+        first = group[0]
+        folder = self._group_folder(first)
+        sources = [task.source_path for task in group]
+        logger.debug("Grouped transfer started: %d files -> %s", len(group), folder)
+        
+        for task in group:
+            self.transfer_started.emit(task.task_id)
+        
+        # The first task carries the group's time; the others complete
+        # instantly, so the queue's total time matches the real one
+        self.transfer_progress.emit(first.task_id, 0, "0 KB/s")
+        
+        try:
+            if first.direction == "push":
+                self.adb_manager.push_files(first.device_serial, sources, folder, timeout=600)
+            else:
+                self.adb_manager.pull_files(first.device_serial, sources, folder, timeout=600)
+        except subprocess.SubprocessError as e:
+            logger.debug("Grouped transfer failed, retrying per file: %s", e)
+            for task in group:
+                self._run_task(task)
+            return
+        
+        # transfer_completed also marks the task 100% in the queue
+        for task in group:
+            if task is not first:
+                self.transfer_progress.emit(task.task_id, 0, "0 KB/s")
+            self.transfer_completed.emit(task.task_id)
     
     def pause(self) -> None:
         """Pause transfer."""
-        self._paused = True
+        self._resume_event.clear()
     
     def resume(self) -> None:
         """Resume transfer."""
-        self._paused = False
+        self._resume_event.set()
     
     def stop(self) -> None:
         """Stop transfer."""
         self._running = False
-        self._paused = False
+        # Wake a paused or waiting loop so it sees _running and exits
+        self._resume_event.set()
+        with self._lock:
+            self._state_changed.notify()
     
     def _process_task(self, task: TransferTask) -> None:
         """Process transfer task.
@@ -140,20 +390,111 @@ class TransferWorker(QObject):
         Raises:
             Exception: When transfer fails
         """
+        compression = self._compression_for(task)
         if task.direction == "push":
-            self._push_file(task)
+            self._push_file(task, compression)
         elif task.direction == "pull":
-            self._pull_file(task)
+            self._pull_file(task, compression)
         else:
             raise ValueError(f"Unknown transfer direction: {task.direction}")
     
-    def _push_file(self, task: TransferTask) -> None:
+    def _compression_for(self, task: TransferTask) -> str | None:
+        """Choose the adb compression for a transfer.
+        
+        Args:
+            task: Transfer task
+        
+        Returns:
+            "lz4" for large transfers when adb supports it, else None (adb default)
+        """
+        if task.file_size >= _COMPRESS_MIN_SIZE and self.adb_manager.supports_compression():
+            return "lz4"
+        return None
+    
+    def _progress_ticker(
+        self,
+        task: TransferTask,
+        start_time: float,
+        transferred_bytes: Callable[[], int],
+    ) -> Callable[[], None] | None:
+        """Build an on_tick callback that reports a running transfer's progress.
+        
+        Args:
+            task: Transfer task
+            start_time: time.time() when the transfer started
+            transferred_bytes: Returns the destination file's current size
+        
+        Returns:
+            Callback for AdbManager.push_file/pull_file, or None for folders
+            and small files (finished before an update would show)
+        """
+        if task.is_dir or task.file_size < _PROGRESS_MIN_SIZE:
+            return None
+        
+        last_percent = 0
+        
+        def on_tick() -> None:
+            nonlocal last_percent
+            try:
+                done = transferred_bytes()
+            except (OSError, ValueError, subprocess.SubprocessError):
+                return  # Destination not created yet
+            
+            # 0 and 100 are reserved for the start and the end of the transfer
+            percent = min(99, done * 100 // task.file_size)
+            if percent <= last_percent:
+                return
+            last_percent = percent
+            
+            elapsed_time = time.time() - start_time
+            speed_str = f"{done / elapsed_time / 1024:.1f} KB/s" if elapsed_time > 0 else "N/A"
+            self.transfer_progress.emit(task.task_id, percent, speed_str)
+        
+        return on_tick
+    
+    def _remote_size_poller(self, task: TransferTask) -> Callable[[], int]:
+        """Build a callback that returns the size of an upload on the device.
+        
+        The size is checked in the device's persistent shell, at most every
+        _REMOTE_POLL_INTERVAL seconds and only while no other upload's check
+        is running; otherwise the last known size is returned.
+        
+        Args:
+            task: Push transfer task
+        
+        Returns:
+            Callback for _progress_ticker
+        """
+        command = f"stat -c %s {shlex.quote(task.destination_path)}"
+        last_poll = 0.0
+        last_size = 0
+        
+        def remote_size() -> int:
+            nonlocal last_poll, last_size
+            now = time.monotonic()
+            if now - last_poll < _REMOTE_POLL_INTERVAL:
+                return last_size
+            if not self._remote_poll_lock.acquire(blocking=False):
+                return last_size
+            try:
+                last_poll = now
+                last_size = int("".join(self.adb_manager.session_command_lines(
+                    task.device_serial, command, timeout=5
+                )))
+            finally:
+                self._remote_poll_lock.release()
+            return last_size
+        
+        return remote_size
+    
+    def _push_file(self, task: TransferTask, compression: str | None = None) -> None:
         """Transfer file from local to remote.
         
         Args:
             task: Transfer task
+            compression: adb compression algorithm, None for adb's default
         """
-        print(f"[DEBUG] _push_file started: {task.filename}")
+        logger.debug("_push_file started: %s", task.filename)
         start_time = time.time()
         
         try:
@@ -161,72 +502,67 @@ class TransferWorker(QObject):
             # so we estimate progress based on file size
             
             # Initial progress
-            print(f"[DEBUG] transfer_progress emit: {task.task_id}, 0%")
+            logger.debug("transfer_progress emit: %d, 0%%", task.task_id)
             self.transfer_progress.emit(task.task_id, 0, "0 KB/s")
             
-            # File transfer (blocking)
-            print(f"[DEBUG] push_file called: {task.source_path} -> {task.destination_path}")
+            # File transfer (blocking; progress from the size on the device)
+            logger.debug("push_file called: %s -> %s", task.source_path, task.destination_path)
             self.adb_manager.push_file(
                 task.device_serial,
                 task.source_path,
                 task.destination_path,
                 is_dir=task.is_dir,
                 timeout=600,  # 10 minutes
+                on_tick=self._progress_ticker(
+                    task,
+                    start_time,
+                    self._remote_size_poller(task),
+                ),
+                compression=compression,
             )
-            print(f"[DEBUG] push_file completed")
-            
-            # Transfer completed
-            elapsed_time = time.time() - start_time
-            if elapsed_time > 0:
-                speed = task.file_size / elapsed_time / 1024  # KB/s
-                speed_str = f"{speed:.1f} KB/s"
-            else:
-                speed_str = "N/A"
-            
-            print(f"[DEBUG] transfer_progress emit: {task.task_id}, 100%, {speed_str}")
-            self.transfer_progress.emit(task.task_id, 100, speed_str)
+            # No 100% update: transfer_completed (from _run_task) marks the
+            # task finished, so progress signals stay at one per tick
+            logger.debug("push_file completed in %.2fs", time.time() - start_time)
             
         except subprocess.SubprocessError as e:
-            print(f"[DEBUG] Push failed: {str(e)}")
+            logger.debug("Push failed: %s", e)
             raise Exception(f"Push failed: {str(e)}")
     
-    def _pull_file(self, task: TransferTask) -> None:
+    def _pull_file(self, task: TransferTask, compression: str | None = None) -> None:
         """Retrieve file from remote to local.
         
         Args:
             task: Transfer task
+            compression: adb compression algorithm, None for adb's default
         """
-        print(f"[DEBUG] _pull_file started: {task.filename}")
+        logger.debug("_pull_file started: %s", task.filename)
         start_time = time.time()
         
         try:
             # Initial progress
-            print(f"[DEBUG] transfer_progress emit: {task.task_id}, 0%")
+            logger.debug("transfer_progress emit: %d, 0%%", task.task_id)
             self.transfer_progress.emit(task.task_id, 0, "0 KB/s")
             
-            # File transfer (blocking)
-            print(f"[DEBUG] pull_file called: {task.source_path} -> {task.destination_path}")
+            # File transfer (blocking; progress from the local file size)
+            logger.debug("pull_file called: %s -> %s", task.source_path, task.destination_path)
             self.adb_manager.pull_file(
                 task.device_serial,
                 task.source_path,
                 task.destination_path,
                 is_dir=task.is_dir,
                 timeout=600,  # 10 minutes
+                on_tick=self._progress_ticker(
+                    task,
+                    start_time,
+                    lambda: os.path.getsize(task.destination_path),
+                ),
+                compression=compression,
             )
-            print(f"[DEBUG] pull_file completed")
-            
-            # Transfer completed
-            elapsed_time = time.time() - start_time
-            if elapsed_time > 0:
-                speed = task.file_size / elapsed_time / 1024  # KB/s
-                speed_str = f"{speed:.1f} KB/s"
-            else:
-                speed_str = "N/A"
-            
-            print(f"[DEBUG] transfer_progress emit: {task.task_id}, 100%, {speed_str}")
-            self.transfer_progress.emit(task.task_id, 100, speed_str)
+            # No 100% update: transfer_completed (from _run_task) marks the
+            # task finished, so progress signals stay at one per tick
+            logger.debug("pull_file completed in %.2fs", time.time() - start_time)
             
         except subprocess.SubprocessError as e:
-            print(f"[DEBUG] Pull failed: {str(e)}")
+            logger.debug("Pull failed: %s", e)
             raise Exception(f"Pull failed: {str(e)}")
 
@@ -142,12 +142,12 @@ def test_local_drives(results: TestResults):
                 widget.load_path(drive_path)
                 
                 # 에러 체크 (첫 행이 에러 메시지인지 확인)
-                if widget.table.rowCount() > 0:
-                    first_item = widget.table.item(0, 0)
-                    if first_item and "⚠" in first_item.text():
+                if widget.model.rowCount() > 0:
+                    first_text = widget.model.index(0, 0).data()
+                    if first_text and "⚠" in first_text:
                         results.add_fail(
                             f"{drive_path} 로딩",
-                            first_item.text()
+                            first_text
                         )
                     else:
                         results.add_pass(f"{drive_path} 로딩 성공")
@@ -160,24 +160,26 @@ def test_local_drives(results: TestResults):
         
         # 폴더 트리 위젯의 드라이브 경로 검증
         tree_widget = FolderTreeWidget(panel_type="local")
-        root_item = tree_widget.tree_widget.topLevelItem(0)  # My PC
+        tree_widget.show()  # 드라이브 트리는 처음 표시될 때 생성됨
+        tree_model = tree_widget.model
+        root_index = tree_model.index(0, 0)  # My PC
         
         drive_count = 0
-        for i in range(root_item.childCount()):
-            child = root_item.child(i)
-            if "💾" in child.text(0):
+        for i in range(tree_model.rowCount(root_index)):
+            child = tree_model.index(i, 0, root_index)
+            if "💾" in child.data():
                 drive_count += 1
                 # UserRole에 저장된 경로 검증
-                stored_path = child.data(0, Qt.ItemDataRole.UserRole)
+                stored_path = child.data(Qt.ItemDataRole.UserRole)
                 
                 if stored_path is None:
                     results.add_fail(
-                        f"드라이브 경로 저장 ({child.text(0)})",
+                        f"드라이브 경로 저장 ({child.data()})",
                         "경로가 None"
                     )
                 elif not Path(stored_path).exists():
                     results.add_fail(
-                        f"드라이브 경로 저장 ({child.text(0)})",
+                        f"드라이브 경로 저장 ({child.data()})",
                         f"유효하지 않은 경로: {stored_path}"
                     )
         
@@ -273,6 +275,28 @@ def test_ui_initialization(results: TestResults):
         folder_tree = FolderTreeWidget(panel_type="local")
         results.add_pass("FolderTreeWidget 초기화")
         
+        # 로컬 트리 표시 시 문서 폴더 선택 (showEvent에서 트리 생성)
+        from PyQt6.QtCore import QStandardPaths
+        documents_path = QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.DocumentsLocation
+        )
+        selected_paths = []
+        folder_tree.folder_selected.connect(selected_paths.append)
+        folder_tree.show()
+        if not documents_path or not Path(documents_path).is_dir():
+            results.add_skip("로컬 트리 표시 시 문서 폴더 선택", "문서 폴더 없음")
+        elif (
+            selected_paths == [str(Path(documents_path))]
+            and folder_tree.path_edit.text() == str(Path(documents_path))
+        ):
+            results.add_pass("로컬 트리 표시 시 문서 폴더 선택")
+        else:
+            results.add_fail(
+                "로컬 트리 표시 시 문서 폴더 선택",
+                f"선택된 경로: {selected_paths}"
+            )
+        folder_tree.hide()
+        
         # 전송 큐
         transfer_queue = TransferQueueWidget()
         results.add_pass("TransferQueueWidget 초기화")